@@ -32,6 +32,22 @@ import time as TIME
 import datetime
 import json
 from ast import literal_eval
+import itertools
+import zipfile
+import gc
+import hashlib
+import warnings
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pyomo.core.expr import identify_variables
+from pyomo.common.collections import ComponentSet
+# Memory of the process is read with 'psutil' (if installed), otherwise it is
+#   only tracked on platforms with '/proc' (i.e., Linux)
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # IDAES is not installed, then the script will search for any other available 'ipopt' library
 if "idaes" in os.environ['CONDA_DEFAULT_ENV']:
@@ -54,6 +70,12 @@ class LinearSolverMethod(Enum):
     MA57 = 3
     MA97 = 4
 
+# Define an Enum class for warm start strategies of the initializer
+class WarmStartMethod(Enum):
+    PreviousTime = 1
+    NearestBlock = 2
+    TemperatureInterpolation = 3
+
 # Helper function to grab reference state diffusivities in cm**2/s
 def default_ref_diffusivity(spec):
     if "nh3" in spec.lower():
@@ -108,6 +130,18 @@ def ergun_pressure_drop(mu, rho, v, dh, eps):
 def arrhenius_rate_const(A, B, E, T):
     return A*T**B*exp(-E/8.3145/T)
 
+# Helper function for log-parameterized Arrhenius reaction rates
+#   lnk_ref = natural log of the rate constant at Tref (units depend on reaction)
+#   B = power of temperature (usually = 0)
+#   E_ref = activation energy divided by R*Tref (dimensionless)
+#   Tref = reference temperature in K
+#   T = temperature of system in K
+#
+#   Function returns the k value of the Arrhenius Expression
+#           (same as 'arrhenius_rate_const' with ln(A) = lnk_ref + E_ref - B*ln(Tref))
+def log_arrhenius_rate_const(lnk_ref, B, E_ref, Tref, T):
+    return (T/Tref)**B*exp(lnk_ref - E_ref*(Tref/T - 1))
+
 # Helper function for Equilibrium Arrhenius reaction rates
 #   Af = forward rate pre-exponential term (units depend on reaction)
 #   Ef = forward rate activation energy in J/mol
@@ -121,6 +155,49 @@ def equilibrium_arrhenius_consts(Af, Ef, dH, dS):
     Er = Ef - dH
     return (Ar, Er)
 
+# Reference to the simulator being initialized in parallel
+#       Worker processes are forked from the parent, so each worker
+#       inherits its own copy of this simulator (and model) without
+#       the need to pickle the pyomo model.
+_parallel_init_simulator = None
+
+# Helper function for parallel initialization of an (age, temp) block
+#       Runs in a worker process and returns the values of all state
+#       variables for the block so they can be merged into the parent
+#
+#       Returns a tuple of (status, termination_condition, success, values, stats)
+def _parallel_initialize_block(age, temp, block_args):
+    sim = _parallel_init_simulator
+    if block_args[-1] != None:
+        block_args[-1]["part"] = True
+    sim.init_solver_stats = {"calls": 0, "iterations": 0}
+    try:
+        (status, condition, success) = sim._initialize_block(age, temp, *block_args)
+    finally:
+        sim._remove_solver_log()
+    return (status, condition, success, sim._grab_block_values(age, temp), sim.init_solver_stats)
+
+# Helper function to run a single start of the multi-start parameter estimation
+#       Runs in a worker process that is forked from the parent (the same
+#       way as '_parallel_initialize_block'). Pyomo components can not be
+#       sent between processes, thus the parameters are listed again here.
+#
+#       Returns the result dictionary of '_multistart_solve'
+def _parallel_multistart_solve(start, point, solve_args):
+    sim = _parallel_init_simulator
+    return sim._multistart_solve(start, point, sim._multistart_parameters(), *solve_args)
+
+# Helper function to solve a single (age, temp) block of the decomposed parameter estimation
+#       Runs in a worker process that is forked from the parent
+#
+#       Returns the result dictionary of '_decomposed_block_solve' with
+#       the values of all state variables for the block added
+def _parallel_decomposed_solve(age, temp, solve_args):
+    sim = _parallel_init_simulator
+    result = sim._decomposed_block_solve(age, temp, *solve_args)
+    result["values"] = sim._grab_block_values(age, temp)
+    return result
+
 # Class object to hold the simulator and all model components
 #       This object will be how a user interfaces with the
 #       pyomo simulator and dictates the form of the model
@@ -176,6 +253,7 @@ class Isothermal_Monolith_Simulator(object):
         self.isRxnSet = False
         self.isRxnBuilt = {}
         self.rxn_list = {}
+        self.rxn_network = {}
         self.isConBuilt = False
         self.isDiscrete = False
         self.isInitialSet = {}
@@ -184,10 +262,24 @@ class Isothermal_Monolith_Simulator(object):
         self.isInitialized = False
         self.build_time = TIME.time()
         self.initialize_time = 0
+        self.init_solver_stats = {"calls": 0, "iterations": 0}
+        self.init_warm_start_stats = {}
+        self.isInitStatsLogged = False
         self.solve_time = 0
         self.isVelocityRecalculated = False
         self.load_time = 0
+        self.objective_build_time = 0
         self.rescaleConstraint = False
+        self.isRateConstShared = {}
+        self.isLogParameterized = False
+        self.log_Tref = None
+        self.multistart_results = []
+        self.decomposed_history = []
+        self.perf_log_file = None
+        self.perf_run_id = None
+        self.perf_records = []
+        self.result_cache = None
+        self.data_cache = None
 
         self.isDataBoundsSet = False
         self.isDataTimesSet = False
@@ -788,7 +880,9 @@ class Isothermal_Monolith_Simulator(object):
     # Set the isothermal temperatures for a simulation
     #   Sets all to a constant, can be changed later
     def set_isothermal_temp(self,age,temp,value):
+        self.clear_result_cache()
         self.model.T[age,temp,:,:].set_value(value)
+        self._update_rate_const_sharing()
         self.isVelocityRecalculated = False
         self.isIsothermalTempSet = True
 
@@ -988,8 +1082,112 @@ class Isothermal_Monolith_Simulator(object):
                     if spec in self.model.surf_set:
                         self.model.u_q[spec,rxn,:].set_value(info["override_molar_contribution"][spec])
 
+        # Compile the reaction network for this reaction
+        self._compile_reaction_network_from_model(rxn)
+
         self.isRxnBuilt[rxn] = True
 
+    # Helper function to compile the reaction network from the stoichiometry in the model
+    #       A term is kept if its molar contribution is non-zero at any location,
+    #       so reactions that are only active in part of the domain are included.
+    def _compile_reaction_network_from_model(self, rxn):
+        u_C = {}
+        for spec in self.model.gas_set:
+            u_C[spec] = 0
+            for loc in self.model.z:
+                if value(self.model.u_C[spec,rxn,loc]) != 0:
+                    u_C[spec] = value(self.model.u_C[spec,rxn,loc])
+                    break
+        u_q = {}
+        if self.isSurfSpecSet == True:
+            for spec in self.model.surf_set:
+                u_q[spec] = 0
+                for loc in self.model.z:
+                    if value(self.model.u_q[spec,rxn,loc]) != 0:
+                        u_q[spec] = value(self.model.u_q[spec,rxn,loc])
+                        break
+        self._compile_reaction_network(rxn, u_C, u_q)
+
+    # Helper function to compile the reaction network for a reaction
+    #       Stores the reactants and products of the reaction split by
+    #       phase (gas, surf, site) and the sparse stoichiometry (only the
+    #       non-zero molar contributions). This is built once, so that the
+    #       constraints do not need to search through the model sets and
+    #       only include reaction terms that are non-zero.
+    #
+    #       u_C = dict of molar contributions of gas species (by name)
+    #       u_q = dict of molar contributions of surface species (by name)
+    def _compile_reaction_network(self, rxn, u_C, u_q):
+        network = {}
+        for item in ["reactants", "products"]:
+            network["gas_"+item] = []
+            network["surf_"+item] = []
+            network["site_"+item] = []
+            for spec in self.model.component(rxn+"_"+item):
+                if spec in self.model.gas_set:
+                    network["gas_"+item].append(spec)
+                if self.isSurfSpecSet == True:
+                    if spec in self.model.surf_set:
+                        network["surf_"+item].append(spec)
+                    if self.isSitesSet == True:
+                        if spec in self.model.site_set:
+                            network["site_"+item].append(spec)
+        network["u_C"] = {}
+        for spec in u_C:
+            if u_C[spec] != 0:
+                network["u_C"][spec] = u_C[spec]
+        network["u_q"] = {}
+        for spec in u_q:
+            if u_q[spec] != 0:
+                network["u_q"][spec] = u_q[spec]
+        self.rxn_network[rxn] = network
+
+    # Helper function to compile the reaction network from a saved model state
+    #       Saved stoichiometry is keyed by str((spec, rxn, loc)), so any
+    #       non-zero value at any location is considered a non-zero term.
+    def _compile_reaction_network_from_state(self, obj):
+        for rxn in self.model.all_rxns:
+            u_C = {}
+            u_q = {}
+            if 'u_C' in obj['model']:
+                for ((spec, r, loc), val) in self._state_items(obj, 'u_C'):
+                    if r == rxn and val != 0:
+                        u_C[spec] = val
+            else:
+                for spec in self.model.gas_set:
+                    u_C[spec] = 1
+            if self.isSurfSpecSet == True:
+                if 'u_q' in obj['model']:
+                    for ((spec, r, loc), val) in self._state_items(obj, 'u_q'):
+                        if r == rxn and val != 0:
+                            u_q[spec] = val
+                else:
+                    for spec in self.model.surf_set:
+                        u_q[spec] = 1
+            self._compile_reaction_network(rxn, u_C, u_q)
+
+    # Helper function to pick up stoichiometry that was changed directly in the model
+    #       The network is compiled in 'set_reaction_info' (or from a saved state)
+    #       and the constraints only hold the terms of that network. If u_C or u_q
+    #       were changed since then (e.g., a term that was left out is made non-zero),
+    #       then the network is compiled again and the reaction constraints are
+    #       rebuilt (the same way as for rate constant sharing).
+    def _update_reaction_network(self):
+        isChanged = False
+        for rxn in self.model.all_rxns:
+            old = self.rxn_network[rxn]
+            self._compile_reaction_network_from_model(rxn)
+            new = self.rxn_network[rxn]
+            if old["u_C"].keys() != new["u_C"].keys() or old["u_q"].keys() != new["u_q"].keys():
+                isChanged = True
+        if isChanged == False or self.isConBuilt == False:
+            return
+        for con in self.model.pore_cons.values():
+            con.set_value(self.pore_mb_constraint(self.model, *con.index()))
+        if self.isSurfSpecSet == True:
+            for con in self.model.surf_cons.values():
+                con.set_value(self.surf_mb_constraint(self.model, *con.index()))
+
     # Function to manually override parameter bounds for reactions
     #   This is optional. Default values are setup in the 'set_reaction_info' function
     #       User MUST provide...
@@ -1253,112 +1451,174 @@ class Isothermal_Monolith_Simulator(object):
     #       eps = (optional) tolerance to prevent divide by zero error
     #
     def interpret_var(self, var, spec, age, temp, loc, time, eps=1e-6):
+        r = 0
+        for (node, weight) in self._interpolation_weights(loc, time, eps):
+            r += weight*var[spec,age,temp,node[0],node[1]]
+        return r
+
+    # Helper function to find the interpolation stencil in one dimension
+    #       cset = ContinuousSet in the model (z or t)
+    #       point = float for the location in that domain
+    #       eps = tolerance to prevent divide by zero error
+    #
+    #       Returns a tuple of (nearest, next_nearest, weight) where 'weight'
+    #       is the contribution of the 'next_nearest' node (the 'nearest'
+    #       node contributes -weight, relative to its own value).
+    def _interpolation_stencil(self, cset, point, eps):
+        nearest_index = cset.find_nearest_index(point)
+        if nearest_index == 1:
+            next_nearest_index = 2
+        elif nearest_index == len(cset):
+            next_nearest_index = len(cset)-1
+        else:
+            if cset.at(nearest_index) >= point:
+                next_nearest_index = nearest_index - 1
+            else:
+                next_nearest_index = nearest_index + 1
+        nearest = cset.at(nearest_index)
+        next_nearest = cset.at(next_nearest_index)
+        weight = (nearest - point)/(nearest - (next_nearest + eps))
+        return (nearest, next_nearest, weight)
+
+    # Helper function to compute the interpolation weights for a (loc, time) point
+    #       Uses the nearest node and the slopes to the next nearest nodes
+    #       in both space and time (same approximation as 'interpret_var').
+    #
+    #       Returns a list of ((z, t), weight) with only the non-zero weights
+    def _interpolation_weights(self, loc, time, eps=1e-6):
         if eps > 1e-6:
             eps = 1e-6
         if eps < 1e-16:
             eps = 1e-16
-        nearest_loc_index = self.model.z.find_nearest_index(loc)
-        nearest_time_index = self.model.t.find_nearest_index(time)
-
-        if nearest_loc_index == 1:
-            next_nearest_loc_index = 2
-        elif nearest_loc_index == len(self.model.z):
-            next_nearest_loc_index = len(self.model.z)-1
-        else:
-            #if self.model.z[nearest_loc_index] >= loc:
-            if self.model.z.at(nearest_loc_index) >= loc:
-                next_nearest_loc_index = nearest_loc_index - 1
-            else:
-                next_nearest_loc_index = nearest_loc_index + 1
-
-        if nearest_time_index == 1:
-            next_nearest_time_index = 2
-        elif nearest_time_index == len(self.model.t):
-            next_nearest_time_index = len(self.model.t)-1
-        else:
-            #if self.model.t[nearest_time_index] >= time:
-            if self.model.t.at(nearest_time_index) >= time:
-                next_nearest_time_index = nearest_time_index - 1
-            else:
-                next_nearest_time_index = nearest_time_index + 1
-
-        #z_dist = (self.model.z[nearest_loc_index] - loc)
-        z_dist = (self.model.z.at(nearest_loc_index) - loc)
-        #t_dist = (self.model.t[nearest_time_index] - time)
-        t_dist = (self.model.t.at(nearest_time_index) - time)
-        #z_slope = -(var[spec,age,temp,self.model.z[nearest_loc_index],self.model.t[nearest_time_index]] - var[spec,age,temp,self.model.z[next_nearest_loc_index],self.model.t[nearest_time_index]])/(self.model.z[nearest_loc_index] - (self.model.z[next_nearest_loc_index] + eps) )
-        z_slope = -(var[spec,age,temp,self.model.z.at(nearest_loc_index),self.model.t.at(nearest_time_index)] - var[spec,age,temp,self.model.z.at(next_nearest_loc_index),self.model.t.at(nearest_time_index)])/(self.model.z.at(nearest_loc_index) - (self.model.z.at(next_nearest_loc_index) + eps) )
-        #t_slope = -(var[spec,age,temp,self.model.z[nearest_loc_index],self.model.t[nearest_time_index]] - var[spec,age,temp,self.model.z[nearest_loc_index],self.model.t[next_nearest_time_index]])/(self.model.t[nearest_time_index] - (self.model.t[next_nearest_time_index] + eps) )
-        t_slope = -(var[spec,age,temp,self.model.z.at(nearest_loc_index),self.model.t.at(nearest_time_index)] - var[spec,age,temp,self.model.z.at(nearest_loc_index),self.model.t.at(next_nearest_time_index)])/(self.model.t.at(nearest_time_index) - (self.model.t.at(next_nearest_time_index) + eps) )
+        (z_n, z_nn, a_z) = self._interpolation_stencil(self.model.z, loc, eps)
+        (t_n, t_nn, a_t) = self._interpolation_stencil(self.model.t, time, eps)
+        weights = {(z_n, t_n): 1 - a_z - a_t}
+        weights[(z_nn, t_n)] = weights.get((z_nn, t_n), 0) + a_z
+        weights[(z_n, t_nn)] = weights.get((z_n, t_nn), 0) + a_t
+        return [(node, weights[node]) for node in weights if weights[node] != 0]
+
+    # Helper function to multiply a rate term by the concentrations of either
+    #       the 'reactants' or 'products' of a reaction (raised to their orders)
+    def _rate_concentration_terms(self, rxn, item, model, age, temp, loc, time, r):
+        network = self.rxn_network[rxn]
+        for spec in network["gas_"+item]:
+            r=r*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for spec in network["surf_"+item]:
+            r=r*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for spec in network["site_"+item]:
+            r=r*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        return r
 
-        loc_val = self.model.z.at(nearest_loc_index)
-        time_val = self.model.t.at(nearest_time_index)
+    # Helper function to give the rate constant of an arrhenius reaction at temperature T
+    #       Uses the log-parameterized form if 'set_log_parameterized_kinetics' was called
+    def _arrhenius_k(self, model, rxn, T):
+        if self.isLogParameterized == True:
+            return log_arrhenius_rate_const(model.lnk_ref[rxn], model.B[rxn], model.E_ref[rxn], model.T_kin_ref, T)
+        return arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], T)
 
-        return (var[spec,age,temp,loc_val,time_val] + z_slope*z_dist + t_slope*t_dist)
+    # Helper function to give the forward and reverse rate constants of an
+    #       equilibrium arrhenius reaction at temperature T
+    #
+    #       Returns a tuple of (kf, kr)
+    def _equilibrium_arrhenius_k(self, model, rxn, T):
+        if self.isLogParameterized == True:
+            kf = log_arrhenius_rate_const(model.lnkf_ref[rxn], 0, model.Ef_ref[rxn], model.T_kin_ref, T)
+            kr = kf*exp(-model.dS[rxn]/8.3145 + model.dH[rxn]/8.3145/T)
+            return (kf, kr)
+        (Ar, Er) = equilibrium_arrhenius_consts(model.Af[rxn], model.Ef[rxn], model.dH[rxn], model.dS[rxn])
+        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], T)
+        kr = arrhenius_rate_const(Ar, 0, Er, T)
+        return (kf, kr)
+
+    # Shared rate constant expressions for each (rxn, age, temp) block
+    #       Used by the isothermal model while the temperature of a block is
+    #       the same at all nodes. All node constraints of the block then
+    #       reference a single exp() term instead of building their own.
+    def shared_rate_const(self, m, rxn, age, temp):
+        return self._arrhenius_k(m, rxn, m.T[age,temp,m.z.first(),m.t.first()])
+
+    def shared_forward_rate_const(self, m, rxn, age, temp):
+        return self._equilibrium_arrhenius_k(m, rxn, m.T[age,temp,m.z.first(),m.t.first()])[0]
+
+    def shared_reverse_rate_const(self, m, rxn, age, temp):
+        return self._equilibrium_arrhenius_k(m, rxn, m.T[age,temp,m.z.first(),m.t.first()])[1]
+
+    # Helper function to check if an (age, temp) block uses the shared rate constants
+    def _is_rate_const_shared(self, age, temp):
+        if age not in self.isRateConstShared:
+            return False
+        return self.isRateConstShared[age][temp]
+
+    # Helper function to check if the temperature of an (age, temp) block is the same at all nodes
+    def _is_temp_uniform(self, age, temp):
+        T = np.array([var.value for var in self.model.T[age,temp,:,:]], dtype=float)
+        return bool(np.all(np.abs(T - T[0]) <= 1e-12*np.abs(T[0])))
+
+    # Helper function to switch blocks between shared and per node rate constants
+    #       A block can only share its rate constants while its temperature is
+    #       uniform. Temperature ramps (or data) make the temperature vary, thus
+    #       the reaction constraints of that block are rebuilt with per node
+    #       rate constants (and rebuilt again if the temperature is made uniform).
+    #       Called by the temperature setters and again before every solve, since
+    #       the temperatures may also have been changed directly.
+    def _update_rate_const_sharing(self):
+        if len(self.isRateConstShared) == 0:
+            return
+        for age in self.model.age_set:
+            for temp in self.model.T_set:
+                isUniform = self._is_temp_uniform(age, temp)
+                if isUniform == self.isRateConstShared[age][temp]:
+                    continue
+                self.isRateConstShared[age][temp] = isUniform
+                for con in self.model.pore_cons[:, age, temp, :, :]:
+                    con.set_value(self.pore_mb_constraint(self.model, *con.index()))
+                if self.isSurfSpecSet == True:
+                    for con in self.model.surf_cons[:, age, temp, :, :]:
+                        con.set_value(self.surf_mb_constraint(self.model, *con.index()))
 
     # Define a single arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
     def arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
-        r = 0
-        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], model.T[age,temp,loc,time])
-        r=k
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                r=r*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    r=r*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        r=r*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        return r
+        if self._is_rate_const_shared(age, temp) == True:
+            k = model.k_rxn[rxn,age,temp]
+        else:
+            k = self._arrhenius_k(model, rxn, model.T[age,temp,loc,time])
+        return self._rate_concentration_terms(rxn, "reactants", model, age, temp, loc, time, k)
 
     # Define a single equilibrium arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
     def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
-        r = 0
-        (Ar, Er) = equilibrium_arrhenius_consts(model.Af[rxn], model.Ef[rxn], model.dH[rxn], model.dS[rxn])
-        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], model.T[age,temp,loc,time])
-        kr = arrhenius_rate_const(Ar, 0, Er, model.T[age,temp,loc,time])
-        rf=kf
-        rr=kr
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                rf=rf*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    rf=rf*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        rf=rf*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        for spec in model.component(rxn+"_products"):
-             if spec in model.gas_set:
-                 rr=rr*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-             if self.isSurfSpecSet == True:
-                 if spec in model.surf_set:
-                     rr=rr*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                 if self.isSitesSet == True:
-                     if spec in model.site_set:
-                         rr=rr*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        r = rf-rr
-        return r
+        if self._is_rate_const_shared(age, temp) == True:
+            kf = model.kf_rxn[rxn,age,temp]
+            kr = model.kr_rxn[rxn,age,temp]
+        else:
+            (kf, kr) = self._equilibrium_arrhenius_k(model, rxn, model.T[age,temp,loc,time])
+        rf = self._rate_concentration_terms(rxn, "reactants", model, age, temp, loc, time, kf)
+        rr = self._rate_concentration_terms(rxn, "products", model, age, temp, loc, time, kr)
+        return rf-rr
 
     # Define a function for the reaction sum for gas species
+    #       Only reactions with non-zero stoichiometry are included
     def reaction_sum_gas(self, gas_spec, model, age, temp, loc, time):
         r_sum=0
         for r in model.arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
+            if gas_spec in self.rxn_network[r]["u_C"]:
+                r_sum += model.u_C[gas_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
         for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+            if gas_spec in self.rxn_network[re]["u_C"]:
+                r_sum += model.u_C[gas_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
         return r_sum
 
     # Define a function for the reaction sum for surface species
+    #       Only reactions with non-zero stoichiometry are included
     def reaction_sum_surf(self, surf_spec, model, age, temp, loc, time):
         r_sum=0
         for r in model.arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
+            if surf_spec in self.rxn_network[r]["u_q"]:
+                r_sum += model.u_q[surf_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
         for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+            if surf_spec in self.rxn_network[re]["u_q"]:
+                r_sum += model.u_q[surf_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
         return r_sum
 
     # Define a function for the site sum
@@ -1397,27 +1657,162 @@ class Isothermal_Monolith_Simulator(object):
 
     # Objective function
     def norm_objective(self, m):
-        sum = 0
-        try:
+        start = TIME.time()
+        terms = self._objective_terms(m, m.data_age_set, m.data_T_set)
+        self.objective_build_time = TIME.time() - start
+        print("\tObjective built with " + str(len(terms)) + " terms. Elapsed time (s) = " + str(self.objective_build_time))
+        return quicksum(terms)
+
+    # Objective function for a single (age, temp) block of data
+    def block_objective(self, m, age, temp):
+        return quicksum(self._objective_terms(m, [age], [temp]))
+
+    # Helper function to list the terms of the objective function for the given ages and temps
+    #       Interpolation weights are only computed once for each (z, t) data
+    #       point, then reused for all species, ages, and temperatures
+    def _objective_terms(self, m, ages, temps):
+        stencils = {}
+        for z in m.z_data:
+            for t in m.t_data:
+                stencils[z,t] = self._interpolation_weights(z, t)
+
+        terms = []
+        if self.isDataGasSpecSet == True:
             for spec in m.data_gas_set:
-                for age in m.data_age_set:
-                    for temp in m.data_T_set:
+                for age in ages:
+                    for temp in temps:
                         for z in m.z_data:
                             for t in m.t_data:
-                                sum+=m.w[spec,age,temp,t]*(m.Cb_data[spec,age,temp,z,t] - self.interpret_var(m.Cb,spec,age,temp,z,t))**2
-        except:
-            pass
-        try:
+                                model_val = quicksum(weight*m.Cb[spec,age,temp,node[0],node[1]] for (node, weight) in stencils[z,t])
+                                terms.append(m.w[spec,age,temp,t]*(m.Cb_data[spec,age,temp,z,t] - model_val)**2)
+        if self.isDataSurfSpecSet == True:
             for spec in m.data_surface_set:
-                for age in m.data_age_set:
-                    for temp in m.data_T_set:
+                for age in ages:
+                    for temp in temps:
                         for z in m.z_data:
                             for t in m.t_data:
-                                sum+=m.wq[spec,age,temp,t]*(m.q_data[spec,age,temp,z,t] - self.interpret_var(m.q,spec,age,temp,z,t))**2
-        except:
-            pass
-        return sum
+                                model_val = quicksum(weight*m.q[spec,age,temp,node[0],node[1]] for (node, weight) in stencils[z,t])
+                                terms.append(m.wq[spec,age,temp,t]*(m.q_data[spec,age,temp,z,t] - model_val)**2)
+        return terms
+
+    # Function to fit the kinetics in a log-parameterized form
+    #       Pre-exponential factors can span many orders of magnitude and are
+    #       strongly correlated with the activation energies, which makes them
+    #       hard to fit. With this option, the solver works with ln(k_ref), the
+    #       natural log of the rate constant at the reference temperature Tref,
+    #       and E/R/Tref instead of A and E:
+    #
+    #               k = (T/Tref)^B * exp[ln(k_ref) - E/R/Tref*(Tref/T - 1)]
+    #
+    #       A and E (and their bounds) are still given with 'set_reaction_info'
+    #       and 'set_reaction_param_bounds' and are reported as usual. They are
+    #       converted to the log form before each solve and back after. Bounds
+    #       on A are kept as bounds on ln(A).
+    #
+    #       Tref = reference temperature in K (if None, the mean temperature
+    #               of all (age, temp) blocks is used)
+    #
+    #       NOTE: Must be called before 'build_constraints'
+    def set_log_parameterized_kinetics(self, Tref=None):
+        if self.isConBuilt == True:
+            raise Exception("Error! Must set log-parameterized kinetics before building constraints")
+        if Tref != None and Tref <= 0:
+            raise Exception("Error! Reference temperature must be positive (in K). "
+                            +str(Tref)+" given is not valid")
+        self.isLogParameterized = True
+        self.log_Tref = Tref
+
+    # Helper function to add the log-parameterized kinetic variables to the model
+    def _build_log_parameters(self):
+        self.model.T_kin_ref = Param(within=PositiveReals, initialize=298, mutable=True, units=units.K)
+        self.model.lnk_ref = Var(self.model.arrhenius_rxns, domain=Reals, initialize=0)
+        self.model.E_ref = Var(self.model.arrhenius_rxns, domain=Reals, initialize=0)
+        self.model.lnkf_ref = Var(self.model.equ_arrhenius_rxns, domain=Reals, initialize=0)
+        self.model.Ef_ref = Var(self.model.equ_arrhenius_rxns, domain=Reals, initialize=0)
+
+        # Bounds on ln(A) (+/- 1e20 are treated as no bound by the solver)
+        self.model.lnA_lb = Param(self.model.all_rxns, domain=Reals, initialize=-1e20, mutable=True)
+        self.model.lnA_ub = Param(self.model.all_rxns, domain=Reals, initialize=1e20, mutable=True)
+        self.model.lnA_bounds = Constraint(self.model.all_rxns, rule=self.log_prefactor_bounds)
+
+    # Bounds of ln(A) for log-parameterized kinetics
+    def log_prefactor_bounds(self, m, rxn):
+        if rxn in m.arrhenius_rxns:
+            lnA = m.lnk_ref[rxn] + m.E_ref[rxn] - m.B[rxn]*log(m.T_kin_ref)
+        else:
+            lnA = m.lnkf_ref[rxn] + m.Ef_ref[rxn]
+        return inequality(m.lnA_lb[rxn], lnA, m.lnA_ub[rxn])
+
+    # Helper function to convert A and E (and their bounds) to the log-parameterized form
+    #       Called before each solve. A fixed E fixes E/R/Tref and a fixed A
+    #       gives equal bounds on ln(A).
+    def _kinetics_to_log_parameters(self):
+        if self.isLogParameterized == False:
+            return
+        Tref = self.log_Tref
+        if Tref == None:
+            Tref = np.mean([value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
+                            for age in self.model.age_set for temp in self.model.T_set])
+        self.model.T_kin_ref.set_value(Tref)
+        for r in self.model.arrhenius_rxns:
+            self._set_log_parameter(r, self.model.A[r], self.model.E[r], value(self.model.B[r]),
+                                    self.model.lnk_ref[r], self.model.E_ref[r])
+        for re in self.model.equ_arrhenius_rxns:
+            self._set_log_parameter(re, self.model.Af[re], self.model.Ef[re], 0,
+                                    self.model.lnkf_ref[re], self.model.Ef_ref[re])
+
+    # Helper function to set the log-parameterized form of a single reaction
+    def _set_log_parameter(self, rxn, A, E, B, lnk_ref, E_ref):
+        Tref = value(self.model.T_kin_ref)
+        RTref = 8.3145*Tref
+        lnA = np.log(max(A.value, 1e-300))
+        E_ref.set_value(E.value/RTref)
+        E_ref.setlb(None if E.lb == None else E.lb/RTref)
+        E_ref.setub(None if E.ub == None else E.ub/RTref)
+        lnk_ref.set_value(lnA + B*np.log(Tref) - E.value/RTref)
+        if E.fixed == True:
+            E_ref.fix()
+        else:
+            E_ref.unfix()
+
+        if A.fixed == True and E.fixed == True:
+            lnk_ref.fix()
+            self.model.lnA_bounds[rxn].deactivate()
+            return
+        lnk_ref.unfix()
+        self.model.lnA_bounds[rxn].activate()
+        if A.fixed == True:
+            self.model.lnA_lb[rxn].set_value(lnA)
+            self.model.lnA_ub[rxn].set_value(lnA)
+        else:
+            if A.lb != None and A.lb > 0:
+                self.model.lnA_lb[rxn].set_value(np.log(A.lb))
+            else:
+                self.model.lnA_lb[rxn].set_value(-1e20)
+            if A.ub != None:
+                self.model.lnA_ub[rxn].set_value(np.log(max(A.ub, 1e-300)))
+            else:
+                self.model.lnA_ub[rxn].set_value(1e20)
 
+    # Helper function to convert the log-parameterized form back to A and E
+    #       Called after each solve
+    def _log_parameters_to_kinetics(self):
+        if self.isLogParameterized == False:
+            return
+        Tref = value(self.model.T_kin_ref)
+        RTref = 8.3145*Tref
+        for r in self.model.arrhenius_rxns:
+            if self.model.E[r].fixed == False:
+                self.model.E[r].set_value(self.model.E_ref[r].value*RTref)
+            if self.model.A[r].fixed == False:
+                lnA = self.model.lnk_ref[r].value + self.model.E_ref[r].value - value(self.model.B[r])*np.log(Tref)
+                self.model.A[r].set_value(float(np.exp(lnA)))
+        for re in self.model.equ_arrhenius_rxns:
+            if self.model.Ef[re].fixed == False:
+                self.model.Ef[re].set_value(self.model.Ef_ref[re].value*RTref)
+            if self.model.Af[re].fixed == False:
+                lnA = self.model.lnkf_ref[re].value + self.model.Ef_ref[re].value
+                self.model.Af[re].set_value(float(np.exp(lnA)))
 
     # Build Constraints
     def build_constraints(self):
@@ -1425,6 +1820,24 @@ class Isothermal_Monolith_Simulator(object):
             if self.isRxnBuilt[rxn] == False:
                 raise Exception("Error! Cannot build constraints until reaction info is set. "
                                 +str(rxn)+ " reaction is not yet constructed")
+        start = TIME.time()
+
+        if self.isLogParameterized == True:
+            self._build_log_parameters()
+
+        # Blocks with a uniform temperature share the rate constants over all nodes
+        #   (checked from the current temperatures, which may have been set directly)
+        self.model.k_rxn = Expression(self.model.arrhenius_rxns, self.model.age_set,
+                                self.model.T_set, rule=self.shared_rate_const)
+        self.model.kf_rxn = Expression(self.model.equ_arrhenius_rxns, self.model.age_set,
+                                self.model.T_set, rule=self.shared_forward_rate_const)
+        self.model.kr_rxn = Expression(self.model.equ_arrhenius_rxns, self.model.age_set,
+                                self.model.T_set, rule=self.shared_reverse_rate_const)
+        for age in self.model.age_set:
+            self.isRateConstShared[age] = {}
+            for temp in self.model.T_set:
+                self.isRateConstShared[age][temp] = self._is_temp_uniform(age, temp)
+
         self.model.bulk_cons = Constraint(self.model.gas_set, self.model.age_set,
                                 self.model.T_set, self.model.z,
                                 self.model.t, rule=self.bulk_mb_constraint)
@@ -1442,25 +1855,22 @@ class Isothermal_Monolith_Simulator(object):
                                         self.model.t, rule=self.site_bal_constraint)
 
         self.isConBuilt = True
+        self._log_performance("build_constraints", start)
 
-    # Apply a discretizer
-    def discretize_model(self, method=DiscretizationMethod.FiniteDifference, elems=20, tstep=100, colpoints=2):
-        if self.isConBuilt == False:
-            raise Exception("Error! Must build the constraints before calling a discretizer")
-
-        print("Starting discretizer. Please wait...")
-
-        if colpoints < 2:
-            colpoints = 2
-
+    # Helper function for 'discretize_model' to apply the discretizers and
+    #   initialize the newly created model components
+    def _apply_discretizer(self, method, elems, tstep, colpoints):
         # Apply the discretizer method
         fd_discretizer = TransformationFactory('dae.finite_difference')
         # Secondary discretizer is for orthogonal collocation methods (if desired)
         oc_discretizer = TransformationFactory('dae.collocation')
 
         # discretization in time
+        pass_start = TIME.time()
         fd_discretizer.apply_to(self.model,nfe=tstep,wrt=self.model.t,scheme='BACKWARD')
+        self._log_performance("discretize_time", pass_start, nfe=tstep)
 
+        pass_start = TIME.time()
         if method == DiscretizationMethod.FiniteDifference:
             fd_discretizer.apply_to(self.model,nfe=elems,wrt=self.model.z,scheme='CENTRAL')
             self.DiscType = "DiscretizationMethod.FiniteDifference"
@@ -1472,6 +1882,7 @@ class Isothermal_Monolith_Simulator(object):
         else:
             raise Exception("Error! Unrecognized discretization method. "
                             +str(method)+ " given is not recognized")
+        self._log_performance("discretize_space", pass_start, nfe=elems, method=str(method))
 
         # Before exiting, we should initialize some additional parameters that
         #   the discretizer doesn't already handle
@@ -1482,6 +1893,7 @@ class Isothermal_Monolith_Simulator(object):
             for temp in self.model.T_set:
                 val = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
                 self.model.T[age,temp,:,:].set_value(val)
+        self._update_rate_const_sharing()
 
         #       Initialize space_velocity, linear velocity, and pressure
         self.model.space_velocity[:,:,:].fix()
@@ -1565,17 +1977,21 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.Smax[site,age,:,:].set_value(val)
 
         #        Initialize u_C
+        #           NOTE: Must set each node explicitly, since the constraints
+        #                   do not reference zero stoichiometry terms
         for spec in self.model.gas_set:
             for rxn in self.model.all_rxns:
                 val = value(self.model.u_C[spec,rxn,self.model.z.first()])
-                self.model.u_C[spec,rxn,:].set_value(val)
+                for loc in self.model.z:
+                    self.model.u_C[spec,rxn,loc] = val
 
         #        Initialize u_q
         if self.isSurfSpecSet == True:
             for spec in self.model.surf_set:
                 for rxn in self.model.all_rxns:
                     val = value(self.model.u_q[spec,rxn,self.model.z.first()])
-                    self.model.u_q[spec,rxn,:].set_value(val)
+                    for loc in self.model.z:
+                        self.model.u_q[spec,rxn,loc] = val
 
         # For PDE portions, fix the first time derivative at the first node
         for spec in self.model.gas_set:
@@ -1586,6 +2002,30 @@ class Isothermal_Monolith_Simulator(object):
 
         self.isDiscrete = True
 
+    # Apply a discretizer
+    def discretize_model(self, method=DiscretizationMethod.FiniteDifference, elems=20, tstep=100, colpoints=2):
+        if self.isConBuilt == False:
+            raise Exception("Error! Must build the constraints before calling a discretizer")
+
+        print("Starting discretizer. Please wait...")
+
+        if colpoints < 2:
+            colpoints = 2
+
+        # The garbage collector is paused while creating and initializing the
+        #   (very many) model components. Otherwise, it gets triggered over and
+        #   over, and each pass walks through the whole (growing) model without
+        #   ever finding anything to collect. The prior state of the collector
+        #   is always restored, even if the discretizer fails.
+        start = TIME.time()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._apply_discretizer(method, elems, tstep, colpoints)
+        finally:
+            if gc_enabled == True:
+                gc.enable()
+
         # Build the objective function (if possible)
         anyFalse = False
         if self.isDataGasSpecSet == True or self.isDataSurfSpecSet == True:
@@ -1604,14 +2044,20 @@ class Isothermal_Monolith_Simulator(object):
             if anyFalse == True:
                 raise Exception("Error! Some data for gases not set. Cannot create objective function. "
                                 +str(self.isDataValuesSet)+ " check dict for missing pieces")
+            objective_start = TIME.time()
             self.model.obj = Objective(rule=self.norm_objective)
             self.isObjectiveSet = True
+            self._log_performance("build_objective", objective_start)
 
-        self.build_time = (TIME.time() - self.build_time)
+        self._log_performance("discretize_model", start)
+        build_start = self.build_time
+        self.build_time = (TIME.time() - build_start)
         print("\tComplete! Elapsed time (s) = "+str(self.build_time))
+        self._log_performance("build", build_start, model=self.model)
 
     # Set initial condition for surface species as fraction of surface sites
     def set_surf_IC_as_fraction_of_sites(self, surf_spec, site, age, temp, fraction):
+        self.clear_result_cache()
         if self.isSurfSpecSet == False:
             raise Exception("Error! Cannot use this function is there is no surface species")
         if self.isSitesSet == False:
@@ -1640,6 +2086,7 @@ class Isothermal_Monolith_Simulator(object):
 
     # Set constant initial conditions
     def set_const_IC(self,spec,age,temp,value):
+        self.clear_result_cache()
         if self.isDiscrete == False:
             raise Exception("Error! User should call the discretizer before setting initial conditions")
         if value < 0:
@@ -1664,6 +2111,7 @@ class Isothermal_Monolith_Simulator(object):
 
     # Set initial condition when given ppm as units
     def set_const_IC_in_ppm(self, spec, age, temp, ppm_val):
+        self.clear_result_cache()
         if self.isDiscrete == False:
             raise Exception("Error! User should call the discretizer before setting initial conditions")
         if ppm_val < 0:
@@ -1686,6 +2134,7 @@ class Isothermal_Monolith_Simulator(object):
 
     # Set constant boundary conditions
     def set_const_BC(self,spec,age,temp,value, auto_init=True):
+        self.clear_result_cache()
         if spec not in self.model.gas_set:
             raise Exception("Error! Cannot specify boundary value for non-gas species. "
                             +str(spec)+" given is not in model.gas_set")
@@ -1711,6 +2160,7 @@ class Isothermal_Monolith_Simulator(object):
 
     # Set boundary condition when given ppm as units
     def set_const_BC_in_ppm(self, spec, age, temp, ppm_val, auto_init=True):
+        self.clear_result_cache()
         if spec not in self.model.gas_set:
             raise Exception("Error! Cannot specify boundary value for non-gas species. "
                             +str(spec)+" given is not in model.gas_set")
@@ -1742,6 +2192,7 @@ class Isothermal_Monolith_Simulator(object):
     # Set time dependent BCs using a 'time_value_pairs' list of tuples
     #       If user does not provide an initial value, it will be assumed 1e-20
     def set_time_dependent_BC(self,spec,age,temp,time_value_pairs,initial_value=1e-20, auto_init=True):
+        self.clear_result_cache()
         if spec not in self.model.gas_set:
             raise Exception("Error! Cannot specify boundary value for non-gas species. "
                             +str(spec)+" given is not in model.gas_set")
@@ -1807,6 +2258,7 @@ class Isothermal_Monolith_Simulator(object):
 
     # Set time dependent boundary condition when given ppm as units
     def set_time_dependent_BC_in_ppm(self, spec, age, temp, time_value_pairs, initial_value=0, auto_init=True):
+        self.clear_result_cache()
         if spec not in self.model.gas_set:
             raise Exception("Error! Cannot specify boundary value for non-gas species. "
                             +str(spec)+" given is not in model.gas_set")
@@ -1880,6 +2332,7 @@ class Isothermal_Monolith_Simulator(object):
     #       at the start time. End temperature will be carried over to
     #       end time (if possible).
     def set_temperature_ramp(self, age, temp, start_time, end_time, end_temp):
+        self.clear_result_cache()
         if self.isDiscrete == False:
             raise Exception("Error! User should call the discretizer before setting a temperature ramp")
         start_temp = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
@@ -1894,6 +2347,7 @@ class Isothermal_Monolith_Simulator(object):
                     slope = (end_temp-start_temp)/(end_time-start_time)
                     self.model.T[age,temp,:,time].set_value(start_temp+slope*(time-start_time))
             previous_time = time
+        self._update_rate_const_sharing()
         self.isVelocityRecalculated = False
         self.isIsothermalTempSet = True
 
@@ -1909,6 +2363,7 @@ class Isothermal_Monolith_Simulator(object):
     #       temperatures from the files and know what location they
     #       belong to
     def set_temperature_from_data(self, age, temp, data_dict, key_loc_pairs):
+        self.clear_result_cache()
         if type(data_dict) is not dict:
             raise Exception("Error! Must specify temperature information using a formatted dictionary. "
                             +str(data_dict)+" given in not a dict object")
@@ -2006,6 +2461,7 @@ class Isothermal_Monolith_Simulator(object):
             time_old = time
 
         #End for loop over all model time
+        self._update_rate_const_sharing()
         self.isVelocityRecalculated = False
         self.isIsothermalTempSet = True
 
@@ -2091,6 +2547,7 @@ class Isothermal_Monolith_Simulator(object):
     #   NOTE: The list of time values and cooresponding data points should be
     #           in their correct order (we don't check order for you)
     def set_data_values_for(self, spec, age, temp, loc, times, values):
+        self.data_cache = None
         #if self.isDataGasSpecSet == False:
         #    raise Exception("Error! Data gas species must be set in model data before providing values")
 
@@ -2139,6 +2596,132 @@ class Isothermal_Monolith_Simulator(object):
 
         self.isDataValuesSet[spec][loc] = True
 
+    # Helper function to reset the windowed data from the full data set
+    #       Used after loading the full data from a file
+    def _reload_data_window(self, full_name):
+        param = self.model.component(full_name)
+        index_sets = list(param.index_set().subsets())
+        values = [paramdata.value for paramdata in param.values(sort=SortComponents.ORDERED_INDICES)]
+        table = {"time": list(self.model.t_data_full)}
+        column_map = {}
+        offset = 0
+        for index in itertools.product(*index_sets[0:4]):
+            table[index] = values[offset:offset+len(index_sets[4])]
+            column_map[index] = index
+            offset += len(index_sets[4])
+        self.set_data_values_from_table(table, column_map)
+
+    # Function to setup data for many species, ages, and temperatures at once
+    #   from a single table of data. The table can either be a dictionary of
+    #   lists with a 'time' key (e.g., from 'naively_read_data_file') or an
+    #   object holding a 'data_map' and 'time_key' (e.g., a TransientData object).
+    #
+    #       data_table = dictionary of columns or TransientData-like object
+    #       column_map = dictionary of column names in the table to the data set
+    #                   they belong to, given as tuples of (spec, age, temp) or
+    #                   (spec, age, temp, loc)
+    #                   [if None, then all columns named for data species are
+    #                    used with the given 'age' and 'temp']
+    #       age = (optional) data age for the columns when column_map is None
+    #       temp = (optional) data temperature for the columns when column_map is None
+    #       loc = (optional) data location for any column not given a location
+    #               [can be omitted when there is only one data location]
+    #
+    #   NOTE: All times in the table must be in the model.t_data_full set, and
+    #           only the times inside the simulated time window are placed in the
+    #           data used by the objective function
+    def set_data_values_from_table(self, data_table, column_map=None, age=None, temp=None, loc=None):
+        if self.isDataGasSpecSet == False and self.isDataSurfSpecSet == False:
+            raise Exception("Error! Data species must be set in model data before providing values")
+
+        if type(data_table) is dict:
+            columns = data_table
+            time_key = ""
+            for key in columns:
+                if str(key).lower() == "time":
+                    time_key = key
+                    break
+        elif hasattr(data_table, "data_map") and hasattr(data_table, "time_key"):
+            columns = data_table.data_map
+            time_key = data_table.time_key
+        else:
+            raise Exception("Error! Data table must be a dictionary of lists or an object with a 'data_map' and 'time_key'")
+        if time_key == "" or time_key not in columns:
+            raise Exception("Error! Data table must contain a 'time' column of time stamps")
+
+        data_sets = {}
+        if self.isDataGasSpecSet == True:
+            data_sets["Cb_data"] = self.model.data_gas_set
+        if self.isDataSurfSpecSet == True:
+            data_sets["q_data"] = self.model.data_surface_set
+
+        if column_map == None:
+            if age == None or temp == None:
+                raise Exception("Error! Must give the 'age' and 'temp' of the data when no 'column_map' is given")
+            column_map = {}
+            for key in columns:
+                for name in data_sets:
+                    if key in data_sets[name]:
+                        column_map[key] = (key, age, temp)
+            if column_map == {}:
+                raise Exception("Error! No columns in the data table are named for data species")
+        if type(column_map) is not dict:
+            raise Exception("Error! Column map must be a dictionary of column names to (spec, age, temp, loc) tuples")
+
+        # Check all columns before setting any values
+        targets = []
+        for key in column_map:
+            if key not in columns:
+                raise Exception("Error! Column "+str(key)+" is not in the data table")
+            if type(column_map[key]) is not tuple or len(column_map[key]) not in [3,4]:
+                raise Exception("Error! Column "+str(key)+" must map to a (spec, age, temp) or (spec, age, temp, loc) tuple")
+            (spec, col_age, col_temp) = column_map[key][0:3]
+            col_loc = loc
+            if len(column_map[key]) == 4:
+                col_loc = column_map[key][3]
+            if col_loc == None and len(self.model.z_data) == 1:
+                col_loc = self.model.z_data.first()
+            if col_loc not in self.model.z_data:
+                raise Exception("Error! Location given was not specified during the creation of the spatial data set. "
+                                +str(col_loc)+ " given is not a valid location in model.z_data")
+            if col_age not in self.model.data_age_set:
+                raise Exception("Error! Age "+str(col_age)+" is not a valid age in model.data_age_set")
+            if col_temp not in self.model.data_T_set:
+                raise Exception("Error! Temperature "+str(col_temp)+" is not a valid temperature in model.data_T_set")
+            names = [name for name in data_sets if spec in data_sets[name]]
+            if names == []:
+                raise Exception("Error! Data species name given is invalid! "+str(spec)+" is not a data species")
+            if len(columns[key]) != len(columns[time_key]):
+                raise Exception("Error! Column "+str(key)+" must have the same number of values as the time stamps")
+            values = np.asarray(columns[key], dtype=float)
+            if np.isnan(values).any() == True:
+                raise Exception("Error! Column "+str(key)+" contains values that are not numbers")
+            for name in names:
+                targets.append((name, spec, col_age, col_temp, col_loc, values))
+
+        # Map each time stamp to the matching time in the full and windowed data times
+        times = np.asarray(columns[time_key], dtype=float)
+        full_times = {time: time for time in self.model.t_data_full}
+        try:
+            full_keys = [full_times[time] for time in times.tolist()]
+        except KeyError as err:
+            raise Exception("Error! Time "+str(err.args[0])+" in the data table is not in model.t_data_full")
+        inside = np.where((times >= self.model.t.first()) & (times <= self.model.t.last()))[0]
+        window_keys = [full_keys[i] for i in inside]
+
+        if len(times)*len(targets) > 500:
+            print("Setting up large data space for "+str(len(targets))+" data sets with "+str(len(times))+" time points...")
+
+        # Values and indices were checked above, so they are stored without
+        #   Pyomo checking each point again
+        self.data_cache = None
+        for (name, spec, col_age, col_temp, col_loc, values) in targets:
+            self.model.component(name+"_full").store_values({(spec, col_age, col_temp, col_loc, time): val
+                                    for (time, val) in zip(full_keys, values.tolist())}, check=False)
+            self.model.component(name).store_values({(spec, col_age, col_temp, col_loc, time): val
+                                    for (time, val) in zip(window_keys, values[inside].tolist())}, check=False)
+            self.isDataValuesSet[spec][col_loc] = True
+
 
     # This function will recalculate all linear velocities
     #   based on the space-velocity and temperature and pressure information
@@ -2315,6 +2898,9 @@ class Isothermal_Monolith_Simulator(object):
                         raise Exception("Error! Must specify boundaries before attempting to initialize scaling. "
                                         +str(spec)+","+str(age)+","+str(temp)+ " given does not have BCs set")
 
+        start = TIME.time()
+        self._update_rate_const_sharing()
+        self._kinetics_to_log_parameters()
         self.model.scaling_factor = Suffix(direction=Suffix.EXPORT)
 
         # set initial scaling factor to inverse of max values
@@ -2452,12 +3038,14 @@ class Isothermal_Monolith_Simulator(object):
                 maxval = 1e-2
             self.model.scaling_factor.set_value(self.model.dq_dt_disc_eq, scale_to/maxval)
             self.model.scaling_factor.set_value(self.model.dq_dt, scale_to/maxval)
+        self._log_performance("initialize_auto_scaling", start)
 
 
     # Function to finialize the scaling of system variables
     def finalize_auto_scaling(self, scale_to=1, obj_scale_to=1):
         if self.isInitialized == False:
             raise Exception("Error! Cannot automate final variable scaling if variables not initialized")
+        start = TIME.time()
 
         self.rescaleConstraint = False
         # add the scaling_factor if it doesn't already exist
@@ -2625,6 +3213,7 @@ class Isothermal_Monolith_Simulator(object):
                     if maxval < 1e-2:
                         maxval = 1e-2
                     self.model.scaling_factor.set_value(self.model.surf_cons, scale_to/maxval)
+        self._log_performance("finalize_auto_scaling", start)
 
 
     # Helper function to establish a guess based on another time step
@@ -2647,45 +3236,1086 @@ class Isothermal_Monolith_Simulator(object):
                     for loc in self.model.z:
                         self.model.S[spec, age_solve, temp_solve, loc, time_solve].set_value(self.model.S[spec, age_solve, temp_solve, loc, time_ref].value)
 
-    # Function to initilize the simulator
-    def initialize_simulator(self, console_out=False, options={'print_user_options': 'yes',
-                                                    'linear_solver': LinearSolverMethod.MA27,
-                                                    'tol': 1e-8,
-                                                    'acceptable_tol': 1e-8,
-                                                    'compl_inf_tol': 1e-8,
-                                                    'constr_viol_tol': 1e-8,
-                                                    'max_iter': 3000,
-                                                    'obj_scaling_factor': 1,
-                                                    'diverging_iterates_tol': 1e50},
-                                                    restart_on_warning=False,
-                                                    restart_on_error=False,
-                                                    use_old_times=False):
-        for spec in self.model.gas_set:
-            for age in self.model.age_set:
-                for temp in self.model.T_set:
-                    if self.isBoundarySet[spec][age][temp] == False:
-                        raise Exception("Error! Must specify boundaries before attempting to solve. "
-                                        +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
-        if self.isSurfSpecSet == True:
-            for spec in self.model.surf_set:
-                for age in self.model.age_set:
-                    for temp in self.model.T_set:
-                        if self.isInitialSet[spec][age][temp] == False:
-                            raise Exception("Error! Must specify initial conditions before attempting to solve. "
-                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+    # Helper function to setup the solver used by the initializer
+    #       The solver is only built once and reused for every
+    #       time step of an (age, temp) block
+    #
+    #       log_stats = if True (and the user did not give an 'output_file'),
+    #                   the Ipopt output is written to a temporary file to
+    #                   count the iterations of each solve
+    def _setup_initializer_solver(self, options, log_stats=False):
+        solver = SolverFactory('ipopt')
+        #solver = SolverFactory('multistart')
+        #solver = SolverFactory('trustregion')
 
-        if self.isIsothermalTempSet == False:
-            raise Exception("Error! Cannot initialize if temperatures are not set first")
+        # Check user options
+        for item in options:
+            solver.options[item] = options[item]
+        if 'print_user_options' in options:
+            if options['print_user_options'] == "yes":
+                solver.options['print_user_options'] = options['print_user_options']
+        else:
+            solver.options['print_user_options'] = 'yes'
+        #   linear_solver -> valid options:
+        #   -------------------------------
+        #       Depends on installed libraries
+        #           'mumps'  --> available on Windows AND 'idaes'
+        #                       (Only option if NOT using 'idaes')
+        #           'ma27' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Small problems, Not parallel)
+        #           'ma57' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Medium problems, threaded blas)
+        #           'ma77' --> NOT functional with Windows OR 'idaes'
+        #           'ma86' --> NOT functional with Windows OR 'idaes'
+        #           'ma97' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Large problems, parallel)
+        #           'pardiso' --> NOT functional with Windows OR 'idaes'
+        #           'wsmp' --> NOT functional with Windows OR 'idaes'
+        #
+        #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
+        #           computationally efficient than the standard Windows
+        #           solver libraries
+        if 'linear_solver' in options:
+            # Force the use of MUMPS if conda environment is not setup for 'idaes'
+            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                options['linear_solver'] = LinearSolverMethod.MUMPS
+            if options['linear_solver'] == LinearSolverMethod.MUMPS:
+                # Only available option without 'idaes' enviroment or
+                #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
+                solver.options['linear_solver'] = 'mumps'
+            elif options['linear_solver'] == LinearSolverMethod.MA27:
+                # Best for small problems (no parallelization)
+                solver.options['linear_solver'] = 'ma27'
+            elif options['linear_solver'] == LinearSolverMethod.MA57:
+                # Best for medium problems (threaded BLAS)
+                solver.options['linear_solver'] = 'ma57'
+            elif options['linear_solver'] == LinearSolverMethod.MA97:
+                # Best for large problems (maximizes parallelization)
+                solver.options['linear_solver'] = 'ma97'
+            else:
+                print("Error! Invalid solver option")
+                print("\tValid Options: 'LinearSolverMethod.MUMPS'")
+                print("\t               'LinearSolverMethod.MA27'")
+                print("\t               'LinearSolverMethod.MA57'")
+                print("\t               'LinearSolverMethod.MA97'")
+                raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
+        else:
+            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                solver.options['linear_solver'] = 'mumps'
+            else:
+                solver.options['linear_solver'] = 'ma97'
+        if 'tol' in options:
+            solver.options['tol'] = options['tol']
+        else:
+            solver.options['tol'] = 1e-8
+        if 'acceptable_tol' in options:
+            solver.options['acceptable_tol'] = options['acceptable_tol']
+        else:
+            solver.options['acceptable_tol'] = 1e-8
+        if 'compl_inf_tol' in options:
+            solver.options['compl_inf_tol'] = options['compl_inf_tol']
+        else:
+            solver.options['compl_inf_tol'] = 1e-8
+        if 'constr_viol_tol' in options:
+            solver.options['constr_viol_tol'] = options['constr_viol_tol']
+        else:
+            solver.options['constr_viol_tol'] = 1e-8
+        if 'max_iter' in options:
+            solver.options['max_iter'] = options['max_iter']
+        else:
+            solver.options['max_iter'] = 3000
+        if 'obj_scaling_factor' in options:
+            solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
+        else:
+            solver.options['obj_scaling_factor'] = 1
+        if 'diverging_iterates_tol' in options:
+            solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
+        else:
+            solver.options['diverging_iterates_tol'] = 1e50
+        if 'warm_start_init_point' in options:
+            solver.options['warm_start_init_point'] = options['warm_start_init_point']
+        else:
+            solver.options['warm_start_init_point'] = 'yes'
 
-        if self.isVelocityRecalculated == False:
-            self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
+        # Run solver (tighten the bounds to force good solutions) (1e-4 was old)
+        solver.options['bound_push'] = 1e-6
+        solver.options['bound_frac'] = 1e-6
+        solver.options['mu_init'] = 1e-2
+        solver.options['slack_bound_push'] = 1e-6
+        solver.options['slack_bound_frac'] = 1e-6
+        solver.options['warm_start_init_point'] = 'yes'
+
+        # Write a short log of each solve to count the Ipopt iterations
+        if log_stats == True and 'output_file' not in options:
+            solver.options['output_file'] = self._solver_log_file()
+            solver.options['file_print_level'] = 5
+
+        return solver
+
+    # Function to turn on (or off) the performance log
+    #       Each phase of the simulator (build, discretization, scaling,
+    #       every initializer sub-solve, and the full solve) is written to
+    #       the log as one JSON record per line with the wall time (s), memory
+    #       in use at the end of the phase (MB, resident set size), model size
+    #       and Ipopt statistics (where relevant).
+    #       Records from the same simulator are tagged with the same 'run'.
+    #
+    #       file_name = name of the log file (in the 'output/' folder). Records
+    #                   are appended to the file, so multiple runs can be compared.
+    #                   If None, the performance log is turned off.
+    #
+    #       NOTE: Call before 'build_constraints' to capture all phases. Counting
+    #               the nonzeros of the full model takes some time on large models.
+    def set_performance_log(self, file_name="performance_log.jsonl"):
+        if file_name == None:
+            self.perf_log_file = None
+            return
+        folder="output/"
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        self.perf_log_file = folder+file_name
+        self.perf_run_id = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S") + "_" + str(os.getpid())
+        self.perf_records = []
 
-        # Setup a dictionary to determine which reaction to unfix after solve
-        self.initialize_time = TIME.time()
-        fixed_dict = {}
-        for rxn in self.rxn_list:
-            fixed_dict[rxn]=self.rxn_list[rxn]["fixed"]
+    # Helper function to add a record to the performance log
+    #       start = wall clock time (from TIME.time()) at the start of the phase
+    #       model = (optional) model or block to give the size of in the record
+    #
+    #       Any extra keyword args are added to the record as they are
+    def _log_performance(self, phase, start, model=None, **info):
+        if self.perf_log_file == None:
+            return
+        record = {"run": self.perf_run_id, "phase": phase,
+                    "timestamp": datetime.datetime.now().isoformat(),
+                    "wall_time": TIME.time() - start, "memory": self._current_memory()}
+        if model != None:
+            record.update(self._model_size(model))
+        record.update(info)
+        self.perf_records.append(record)
+        with open(self.perf_log_file, "a") as file:
+            file.write(json.dumps(record, default=str) + "\n")
+
+    # Helper function to give the memory (MB) currently used by this process
+    #       This is the resident set size (not the peak), so memory that is
+    #       freed after a phase is no longer counted for the later phases
+    #
+    #       Returns None if the platform does not support it
+    def _current_memory(self):
+        if psutil != None:
+            return psutil.Process().memory_info().rss/1024/1024
+        try:
+            with open("/proc/self/statm") as file:
+                pages = int(file.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return pages*os.sysconf("SC_PAGE_SIZE")/1024/1024
+
+    # Helper function to give the size of the problem the solver would see
+    #       Only active constraints and the unfixed vars in them are counted
+    #
+    #       Returns a dictionary of the number of variables, constraints, and nonzeros
+    def _model_size(self, model):
+        variables = ComponentSet()
+        constraints = 0
+        nonzeros = 0
+        for con in model.component_data_objects(Constraint, active=True):
+            constraints += 1
+            for var in identify_variables(con.body, include_fixed=False):
+                variables.add(var)
+                nonzeros += 1
+        return {"variables": len(variables), "constraints": constraints, "nonzeros": nonzeros}
+
+    # Helper function to give the name of the Ipopt log file of the initializer
+    #       Each process gets its own file
+    def _solver_log_file(self):
+        return os.path.join(tempfile.gettempdir(), "cats_init_ipopt_" + str(os.getpid()) + ".log")
+
+    # Helper function to remove the Ipopt log file of the initializer
+    def _remove_solver_log(self):
+        if os.path.isfile(self._solver_log_file()):
+            os.remove(self._solver_log_file())
+
+    # Helper function to solve a block sub-problem
+    #       The number of Ipopt iterations is read from the solver's output
+    #       file and added to the counts in 'self.init_solver_stats'
+    #
+    #       age, temp, and time are only used to label the performance log
+    def _solve_block(self, solver, block, console_out, age=None, temp=None, time=None):
+        start = TIME.time()
+        results = solver.solve(block, tee=console_out, load_solutions=False)
+        stats = self._read_ipopt_stats(solver.options.get('output_file'))
+        self.init_solver_stats["calls"] += 1
+        self.init_solver_stats["iterations"] += stats["iterations"]
+        self._log_performance("initialize_block", start, model=block, age=age, temp=temp, time=time,
+                                status=results.solver.status, condition=results.solver.termination_condition,
+                                **stats)
+        return results
+
+    # Helper function to solve the full model and log the performance of the solve
+    #       If performance logging is on (and the user did not give an 'output_file'),
+    #       the Ipopt output is written to a temporary file to read the iterations from
+    #
+    #       Any extra keyword args are only used to label the performance log
+    def _solve_logged(self, solver, console_out, phase, **info):
+        if self.perf_log_file == None:
+            return solver.solve(self.model, tee=console_out, load_solutions=False)
+        isTempLog = solver.options.get('output_file') == None
+        if isTempLog == True:
+            solver.options['output_file'] = self._solver_log_file()
+            solver.options['file_print_level'] = 5
+        start = TIME.time()
+        try:
+            results = solver.solve(self.model, tee=console_out, load_solutions=False)
+            stats = self._read_ipopt_stats(solver.options['output_file'])
+        finally:
+            if isTempLog == True:
+                self._remove_solver_log()
+        self._log_performance(phase, start, model=self.model, status=results.solver.status,
+                                condition=results.solver.termination_condition, **stats, **info)
+        return results
+
+    # Helper function to read the solver statistics from an Ipopt output file
+    #       Iteration numbers of the restoration phase are marked with 'r' (with no
+    #       space after it if the objective is negative, e.g., "6r-1.95e+00"), so every
+    #       switch to those lines is counted as an entry into restoration. Ipopt only
+    #       writes the iteration lines if 'file_print_level' is 5 (or more).
+    #
+    #       Returns a dictionary of the number of iterations and restorations
+    def _read_ipopt_stats(self, file_name):
+        stats = {"iterations": 0, "restorations": 0}
+        if file_name == None or os.path.isfile(file_name) == False:
+            return stats
+        inRestoration = False
+        with open(file_name) as file:
+            for line in file:
+                if line.startswith("Number of Iterations"):
+                    stats["iterations"] = int(line.split(":")[1])
+                items = line.split()
+                if len(items) == 0:
+                    continue
+                (step, mark, rest) = items[0].partition("r")
+                if step.isdigit() == True:
+                    isRestoration = mark == "r"
+                    if isRestoration == True and inRestoration == False:
+                        stats["restorations"] += 1
+                    inRestoration = isRestoration
+        return stats
+
+    # Helper function to build a sub-problem for a single (age, temp) block
+    #       The sub-problem only holds references to the constraints of
+    #       this block in the full model. Thus, the solver only has to
+    #       write out the active constraints (i.e., current time slice)
+    #       of the block instead of the whole model at each time step.
+    #       Variables are shared with the full model, so the fixed
+    #       values from prior time steps are updated in place.
+    def _build_block_subproblem(self, age, temp):
+        block = ConcreteModel()
+        cons_list = ["bulk_cons", "pore_cons", "dCb_dz_disc_eq", "dCb_dt_disc_eq", "dC_dt_disc_eq"]
+        if self.isSurfSpecSet == True:
+            cons_list += ["surf_cons", "dq_dt_disc_eq"]
+            if self.isSitesSet == True:
+                cons_list += ["site_cons"]
+        for name in cons_list:
+            block.add_component(name, Reference(self.model.component(name)[:, age, temp, :, :]))
+        if self.DiscType == "DiscretizationMethod.FiniteDifference":
+            block.dCbdz_edge = Reference(self.model.dCbdz_edge[:, age, temp, :])
+
+        if self.model.find_component('scaling_factor'):
+            block.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        return block
+
+    # Helper function to set the scaling factors of the block sub-problem
+    #       Only the factors for the current time slice (or list of time
+    #       slices) are passed along to the solver (i.e., the active
+    #       constraints and unfixed vars)
+    def _set_block_scaling(self, block, age, temp, time):
+        if block.find_component('scaling_factor') == None:
+            return
+        block.scaling_factor.clear()
+        for con in block.component_data_objects(Constraint, active=True):
+            if self.model.scaling_factor.get(con) != None:
+                block.scaling_factor[con] = self.model.scaling_factor[con]
+        if type(time) is not list:
+            time = [time]
+        for name in self._block_var_names():
+            for time_slice in time:
+                for var in self.model.component(name)[:, age, temp, :, time_slice]:
+                    if var.fixed == False and self.model.scaling_factor.get(var) != None:
+                        block.scaling_factor[var] = self.model.scaling_factor[var]
+
+    # Helper function to unfix the vars and activate the constraints of a time slice
+    def _unfix_time_slice(self, age, temp, time):
+        self.model.Cb[:, age, temp, :, time].unfix()
+        self.model.C[:, age, temp, :, time].unfix()
+        self.model.dCb_dt[:, age, temp, :, time].unfix()
+        self.model.dC_dt[:, age, temp, :, time].unfix()
+        self.model.dCb_dz[:, age, temp, :, time].unfix()
+        self.model.bulk_cons[:, age, temp, :, time].activate()
+        self.model.pore_cons[:, age, temp, :, time].activate()
+        self.model.dCb_dz_disc_eq[:, age, temp, :, time].activate()
+        self.model.dCb_dt_disc_eq[:, age, temp, :, time].activate()
+        self.model.dC_dt_disc_eq[:, age, temp, :, time].activate()
+        if self.DiscType == "DiscretizationMethod.FiniteDifference":
+            self.model.dCbdz_edge[:, age, temp, time].activate()
+
+        if self.isSurfSpecSet == True:
+            self.model.q[:, age, temp, :, time].unfix()
+            self.model.dq_dt[:, age, temp, :, time].unfix()
+            self.model.surf_cons[:, age, temp, :, time].activate()
+            self.model.dq_dt_disc_eq[:, age, temp, :, time].activate()
+
+            if self.isSitesSet == True:
+                self.model.S[:, age, temp, :, time].unfix()
+                self.model.site_cons[:, age, temp, :, time].activate()
+
+    # Helper function to fix the vars and deactivate the constraints of a time slice
+    def _fix_time_slice(self, age, temp, time):
+        self.model.Cb[:, age, temp, :, time].fix()
+        self.model.C[:, age, temp, :, time].fix()
+        self.model.dCb_dt[:, age, temp, :, time].fix()
+        self.model.dC_dt[:, age, temp, :, time].fix()
+        self.model.dCb_dz[:, age, temp, :, time].fix()
+        self.model.bulk_cons[:, age, temp, :, time].deactivate()
+        self.model.pore_cons[:, age, temp, :, time].deactivate()
+        self.model.dCb_dz_disc_eq[:, age, temp, :, time].deactivate()
+        self.model.dCb_dt_disc_eq[:, age, temp, :, time].deactivate()
+        self.model.dC_dt_disc_eq[:, age, temp, :, time].deactivate()
+        if self.DiscType == "DiscretizationMethod.FiniteDifference":
+            self.model.dCbdz_edge[:, age, temp, time].deactivate()
+
+        if self.isSurfSpecSet == True:
+            self.model.q[:, age, temp, :, time].fix()
+            self.model.dq_dt[:, age, temp, :, time].fix()
+            self.model.surf_cons[:, age, temp, :, time].deactivate()
+            self.model.dq_dt_disc_eq[:, age, temp, :, time].deactivate()
+
+            if self.isSitesSet == True:
+                self.model.S[:, age, temp, :, time].fix()
+                self.model.site_cons[:, age, temp, :, time].deactivate()
+
+    # Helper function to make sure the vars that should be fixed, are fixed
+    #       Fix ICs, BCs, and dCb_dt @ z=0, t=0
+    def _fix_block_boundaries(self, age, temp):
+        self.model.dCb_dt[:,age, temp,self.model.z.first(),self.model.t.first()].fix()
+        self.model.Cb[:,age, temp, :, self.model.t.first()].fix()
+        self.model.C[:,age, temp, :, self.model.t.first()].fix()
+        if self.isSurfSpecSet == True:
+            self.model.q[:,age, temp, :, self.model.t.first()].fix()
+        self.model.Cb[:,age, temp,self.model.z.first(), :].fix()
+
+    # Helper function to initialize a single (age, temp) block of the model
+    #       This function marches through all time steps for the given
+    #       'age_solve' and 'temp_solve' combination. It assumes that all
+    #       other variables have already been fixed and constraints have
+    #       been deactivated by 'initialize_simulator'.
+    #
+    #       Returns a tuple of (status, termination_condition, success)
+    def _initialize_block(self, age_solve, temp_solve, console_out, options,
+                            restart_on_warning, restart_on_error, use_old_times,
+                            windowed=None, checkpoint=None, warm_started=False):
+        if windowed != None:
+            return self._initialize_block_windowed(age_solve, temp_solve, console_out,
+                                                    options, windowed, checkpoint, warm_started)
+
+        # Initial guesses of a warm started block are already set
+        if warm_started == True:
+            use_old_times = False
+
+        # Inside age_solve && temp_solve
+        print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
+
+        time_solve_old = self.model.t.first()
+        results = None
+
+        # Load any time steps that were already solved from the checkpoint
+        steps_done = self._restore_block_checkpoint(checkpoint, age_solve, temp_solve)
+        if steps_done > 1:
+            print("\tRestored time steps up to " + str(self.model.t.at(steps_done)) + " from checkpoint")
+
+        # Build the solver and the sub-problem for this block only once
+        solver = self._setup_initializer_solver(options, log_stats=self.isInitStatsLogged)
+        block = self._build_block_subproblem(age_solve, temp_solve)
+
+        i=0
+        for time_solve in self.model.t:
+            # Solve 1 time at a time starting with the i=1 time step (since IC is known)
+            #   Time steps restored from the checkpoint stay fixed
+            if i > 0 and i < steps_done:
+                pass
+            elif i > 0:
+                start = TIME.time()
+                print("\t... time_step " + str(time_solve))
+                self._unfix_time_slice(age_solve, temp_solve, time_solve)
+                self._fix_block_boundaries(age_solve, temp_solve)
+
+                # Update scaling for this time slice and reset the scaling
+                #   method (a restart may have changed it)
+                self._set_block_scaling(block, age_solve, temp_solve, time_solve)
+                if block.find_component('scaling_factor'):
+                    solver.options['nlp_scaling_method'] = 'user-scaling'
+                else:
+                    solver.options['nlp_scaling_method'] = 'gradient-based'
+
+                if use_old_times == True:
+                    self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
+                    solver.options['nlp_scaling_method'] = 'gradient-based'
+
+                results = self._solve_block(solver, block, console_out, age_solve, temp_solve, time_solve)
+                if results.solver.status == SolverStatus.ok:
+                    block.solutions.load_from(results)
+                elif results.solver.status == SolverStatus.warning:
+                    if restart_on_warning == False:
+                        print("WARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                        print("\tResults are loaded, but need to be checked")
+                        block.solutions.load_from(results)
+                    else:
+                        print("WARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                        print("\tAttempting to correct with restart...")
+                        #Establish initial guess
+                        self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
+
+                        #After initial guess, rerun solver
+                        if solver.options['nlp_scaling_method'] == 'user-scaling':
+                            solver.options['nlp_scaling_method'] = 'gradient-based'
+                        else:
+                            if block.find_component('scaling_factor'):
+                                solver.options['nlp_scaling_method'] = 'user-scaling'
+                        results = self._solve_block(solver, block, console_out, age_solve, temp_solve, time_solve)
+
+                        if results.solver.status == SolverStatus.ok:
+                            block.solutions.load_from(results)
+                            print("\tCorrection success!")
+                        elif results.solver.status == SolverStatus.warning:
+                            print("\tSame issue persists...")
+                            print("\tResults are loaded, but need to be checked")
+                            block.solutions.load_from(results)
+                        else:
+                            #block.solutions.load_from(results)
+                            print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                            print("\tStatus: " + str(results.solver.status))
+                            print("\tTermination Condition: " + str(results.solver.termination_condition))
+                            self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+                            return (results.solver.status, results.solver.termination_condition, False)
+
+                else:
+                    if restart_on_error == False:
+                        #block.solutions.load_from(results)
+                        print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                        print("\tStatus: " + str(results.solver.status))
+                        print("\tTermination Condition: " + str(results.solver.termination_condition))
+                        self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+                        return (results.solver.status, results.solver.termination_condition, False)
+                    else:
+                        print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                        print("\tAttempting to recover with restart...")
+                        #Establish initial guess
+                        self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
+
+                        #After initial guess, rerun solver
+                        if solver.options['nlp_scaling_method'] == 'user-scaling':
+                            solver.options['nlp_scaling_method'] = 'gradient-based'
+                        else:
+                            if block.find_component('scaling_factor'):
+                                solver.options['nlp_scaling_method'] = 'user-scaling'
+                        results = self._solve_block(solver, block, console_out, age_solve, temp_solve, time_solve)
+
+                        if results.solver.status == SolverStatus.ok:
+                            block.solutions.load_from(results)
+                            print("\tRecovery success!")
+                        elif results.solver.status == SolverStatus.warning:
+                            print("\tWARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                            print("\tResults are loaded, but need to be checked")
+                            block.solutions.load_from(results)
+                        else:
+                            #block.solutions.load_from(results)
+                            print("\tUnable to recover...")
+                            print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
+                            print("\tStatus: " + str(results.solver.status))
+                            print("\tTermination Condition: " + str(results.solver.termination_condition))
+                            self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+                            return (results.solver.status, results.solver.termination_condition, False)
+
+                # Fix the steps that were just solved
+                self._fix_time_slice(age_solve, temp_solve, time_solve)
+
+                # Record the converged time step in the checkpoint
+                self._checkpoint_time_step(checkpoint, age_solve, temp_solve, i)
+
+            else:
+                # i = 0, don't do anything
+                pass
+            i+=1
+            time_solve_old = time_solve
+        # End time_solve loop
+
+        self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+        if results == None:
+            # All time steps were restored from the checkpoint
+            return (SolverStatus.ok, TerminationCondition.optimal, True)
+        return (results.solver.status, results.solver.termination_condition, True)
+
+    # Helper function to list the fixed inputs of an (age, temp) block that change
+    #       between 'time_ref' and 'time' (i.e., the BCs, the temperature, and
+    #       the conditions of the flow)
+    #
+    #       Returns a list of (var, value at time, value at time_ref)
+    def _block_time_inputs(self, age, temp, time, time_ref):
+        slices = [self.model.Cb[:, age, temp, self.model.z.first(), time]]
+        for name in ["T", "P", "v", "rho", "mu", "Re"]:
+            slices.append(self.model.component(name)[age, temp, :, time])
+        for name in ["Sc", "Sh", "km"]:
+            slices.append(self.model.component(name)[:, age, temp, :, time])
+        inputs = []
+        for var_slice in slices:
+            for var in var_slice:
+                if var.fixed == True:
+                    ref = var.parent_component()[var.index()[:-1] + (time_ref,)].value
+                    if var.value != ref:
+                        inputs.append( (var, var.value, ref) )
+        return inputs
+
+    # Helper function to find the largest relative change of the states of
+    #       an (age, temp) block between 'time_ref' and 'time'
+    #
+    #       Changes are relative to the largest value of each species over
+    #       both times. Species that are negligible compared to the largest
+    #       species of the same state var are not considered.
+    def _block_step_change(self, age, temp, time, time_ref):
+        var_list = ["Cb", "C"]
+        if self.isSurfSpecSet == True:
+            var_list += ["q"]
+            if self.isSitesSet == True:
+                var_list += ["S"]
+        change = 0
+        for name in var_list:
+            scale = {}
+            delta = {}
+            for var in self.model.component(name)[:, age, temp, :, time]:
+                spec = var.index()[0]
+                ref = var.parent_component()[var.index()[:-1] + (time_ref,)].value
+                scale[spec] = max(scale.get(spec, 0), abs(var.value), abs(ref))
+                delta[spec] = max(delta.get(spec, 0), abs(var.value - ref))
+            max_scale = max(scale.values())
+            for spec in scale:
+                if scale[spec] > 1e-6*max_scale:
+                    change = max(change, delta[spec]/scale[spec])
+        return change
+
+    # Helper function to solve a single time step by ramping the inputs of the block
+    #       The inputs (see '_block_time_inputs') are moved from their values
+    #       at 'time_ref' to their values at 'time' in 'substeps' equal steps,
+    #       each one starting from the solution of the last. The last sub-step
+    #       is the actual time step.
+    #
+    #       Returns a tuple of (results, success, number of solver calls)
+    def _substep_time_slice(self, solver, block, console_out, age, temp, time, time_ref, substeps):
+        inputs = self._block_time_inputs(age, temp, time, time_ref)
+        if len(inputs) == 0 or substeps < 2:
+            return (None, False, 0)
+        print("\t\tSplitting time step into " + str(substeps) + " sub-steps...")
+        calls = 0
+        for k in range(1, substeps+1):
+            for (var, val, ref) in inputs:
+                var.set_value(ref + (val-ref)*k/substeps)
+            results = self._solve_block(solver, block, console_out, age, temp, time)
+            calls += 1
+            if results.solver.status != SolverStatus.ok:
+                break
+            block.solutions.load_from(results)
+        for (var, val, ref) in inputs:
+            var.set_value(val)
+        success = results.solver.status == SolverStatus.ok
+        return (results, success, calls)
+
+    # Helper function to initialize a single (age, temp) block in windows of time steps
+    #       Instead of solving 1 time step of the grid at a time, a 'window'
+    #       of several time steps is solved in a single call to the solver.
+    #       The window doubles (up to 'max_window' steps) while the relative
+    #       change per step stays below 'step_change_tol'/4, and is halved when
+    #       the change is larger than 'step_change_tol' or when the solver
+    #       fails. When a single time step fails, it is reached by continuation,
+    #       i.e., its inputs are ramped over sub-steps (see '_substep_time_slice').
+    #       The time step of the grid itself is never changed (this is not an
+    #       error controlled time stepper), so the results are the same as for
+    #       '_initialize_block'.
+    #
+    #       Initial guesses come from the last converged time step, unless
+    #       the block was 'warm_started' from another block.
+    #
+    #       Returns a tuple of (status, termination_condition, success)
+    def _initialize_block_windowed(self, age_solve, temp_solve, console_out, options,
+                                    windowed, checkpoint=None, warm_started=False):
+        print("Initializing for " + str(age_solve) + " -> " + str(temp_solve) + " (windowed steps)")
+
+        results = None
+        times = list(self.model.t)
+        steps_done = self._restore_block_checkpoint(checkpoint, age_solve, temp_solve)
+        if steps_done > 1:
+            print("\tRestored time steps up to " + str(self.model.t.at(steps_done)) + " from checkpoint")
+
+        solver = self._setup_initializer_solver(options, log_stats=self.isInitStatsLogged)
+        block = self._build_block_subproblem(age_solve, temp_solve)
+
+        i = max(steps_done, 1)
+        window = 1
+        calls = 0
+        steps = len(times) - i
+        while i < len(times):
+            n = min(window, len(times)-i)
+            time_ref = times[i-1]
+            window_times = times[i:i+n]
+            print("\t... time_steps " + str(window_times[0]) + " to " + str(window_times[-1]))
+            for time_solve in window_times:
+                if warm_started == False:
+                    self._initial_guesser(age_solve, temp_solve, time_solve, time_ref)
+                self._unfix_time_slice(age_solve, temp_solve, time_solve)
+            self._fix_block_boundaries(age_solve, temp_solve)
+
+            self._set_block_scaling(block, age_solve, temp_solve, window_times)
+            if block.find_component('scaling_factor'):
+                solver.options['nlp_scaling_method'] = 'user-scaling'
+            else:
+                solver.options['nlp_scaling_method'] = 'gradient-based'
+
+            results = self._solve_block(solver, block, console_out, age_solve, temp_solve, window_times)
+            calls += 1
+            success = results.solver.status == SolverStatus.ok
+            if success == True:
+                block.solutions.load_from(results)
+            elif n > 1:
+                # Retry from the same time with a smaller window
+                for time_solve in window_times:
+                    self._fix_time_slice(age_solve, temp_solve, time_solve)
+                window = max(n//2, 1)
+                print("\t\tSolver failed. Reducing window to " + str(window) + " time steps")
+                continue
+            else:
+                self._initial_guesser(age_solve, temp_solve, window_times[0], time_ref)
+                (sub_results, success, sub_calls) = self._substep_time_slice(solver, block,
+                                console_out, age_solve, temp_solve, window_times[0], time_ref,
+                                windowed["substeps"])
+                calls += sub_calls
+                if sub_results != None:
+                    results = sub_results
+
+            if success == False:
+                if results.solver.status == SolverStatus.warning:
+                    print("WARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(window_times[0]) + ")")
+                    print("\tResults are loaded, but need to be checked")
+                    block.solutions.load_from(results)
+                else:
+                    print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(window_times[0]) + ")")
+                    print("\tStatus: " + str(results.solver.status))
+                    print("\tTermination Condition: " + str(results.solver.termination_condition))
+                    self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+                    return (results.solver.status, results.solver.termination_condition, False)
+
+            # Fix the steps that were just solved
+            for k in range(0, n):
+                self._fix_time_slice(age_solve, temp_solve, window_times[k])
+                self._checkpoint_time_step(checkpoint, age_solve, temp_solve, i+k)
+
+            # Adjust the window for the next solve
+            change = self._block_step_change(age_solve, temp_solve, window_times[-1], time_ref)/n
+            if change > windowed["step_change_tol"]:
+                window = max(n//2, 1)
+            elif change < windowed["step_change_tol"]/4 and n == window:
+                window = min(window*2, windowed["max_window"])
+            i += n
+        # End time window loop
+
+        print("\tSolved " + str(steps) + " time steps with " + str(calls) + " solver calls")
+        self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
+        if results == None:
+            # All time steps were restored from the checkpoint
+            return (SolverStatus.ok, TerminationCondition.optimal, True)
+        return (results.solver.status, results.solver.termination_condition, True)
+
+    # Helper function to give the temperature of an (age, temp) block (at the inlet and t=0)
+    def _block_temperature(self, age, temp):
+        return value(self.model.T[age, temp, self.model.z.first(), self.model.t.first()])
+
+    # Helper function to order the (age, temp) blocks for a warm start method
+    #       For 'TemperatureInterpolation', the blocks of each age are ordered
+    #       from the coldest and hottest inward (by bisection), so that most
+    #       blocks lie between 2 blocks that are already solved
+    def _warm_start_order(self, block_list, method):
+        if method != WarmStartMethod.TemperatureInterpolation:
+            return block_list
+        ordered = []
+        for age in self.model.age_set:
+            temps = [temp for (a, temp) in block_list if a == age]
+            temps.sort(key=lambda temp: self._block_temperature(age, temp))
+            if len(temps) < 3:
+                ordered += [(age, temp) for temp in temps]
+                continue
+            ordered += [(age, temps[0]), (age, temps[-1])]
+            intervals = [(0, len(temps)-1)]
+            while len(intervals) > 0:
+                new_intervals = []
+                for (low, high) in intervals:
+                    if high - low > 1:
+                        mid = (low + high)//2
+                        ordered.append( (age, temps[mid]) )
+                        new_intervals += [(low, mid), (mid, high)]
+                intervals = new_intervals
+        return ordered
+
+    # Helper function to select the solved blocks used to warm start an (age, temp) block
+    #       NearestBlock:               the solved block of the same age with the
+    #                                   nearest temperature, else the same temperature
+    #                                   at the nearest age, else the nearest temperature
+    #       TemperatureInterpolation:   linear interpolation between the nearest solved
+    #                                   blocks of the same age that are colder and hotter
+    #                                   (falls back to NearestBlock if not bracketed)
+    #
+    #       Returns a list of (age, temp, weight)
+    def _warm_start_sources(self, age, temp, solved, method):
+        if method == WarmStartMethod.PreviousTime or len(solved) == 0:
+            return []
+        T = self._block_temperature(age, temp)
+        same_age = [(self._block_temperature(a, t), a, t) for (a, t) in solved if a == age]
+        if method == WarmStartMethod.TemperatureInterpolation:
+            colder = [item for item in same_age if item[0] <= T]
+            hotter = [item for item in same_age if item[0] >= T]
+            if len(colder) > 0 and len(hotter) > 0:
+                low = max(colder, key=lambda item: item[0])
+                high = min(hotter, key=lambda item: item[0])
+                if high[0] == low[0]:
+                    return [(low[1], low[2], 1)]
+                w = (T - low[0])/(high[0] - low[0])
+                return [(low[1], low[2], 1-w), (high[1], high[2], w)]
+        if len(same_age) > 0:
+            nearest = min(same_age, key=lambda item: abs(item[0] - T))
+            return [(nearest[1], nearest[2], 1)]
+        ages = list(self.model.age_set)
+        same_temp = [a for (a, t) in solved if t == temp]
+        if len(same_temp) > 0:
+            nearest = min(same_temp, key=lambda a: abs(ages.index(a) - ages.index(age)))
+            return [(nearest, temp, 1)]
+        nearest = min(solved, key=lambda item: abs(self._block_temperature(item[0], item[1]) - T))
+        return [(nearest[0], nearest[1], 1)]
+
+    # Helper function to warm start an (age, temp) block from blocks already solved
+    #       The state variables at all times (other than the ICs and BCs) are
+    #       set to the (weighted) values of the source blocks
+    #
+    #       Returns True if the block was warm started
+    def _warm_start_block(self, age, temp, solved, method):
+        sources = self._warm_start_sources(age, temp, solved, method)
+        if len(sources) == 0:
+            return False
+        for name in self._block_var_names():
+            var = getattr(self.model, name)
+            for item in var[:, age, temp, :, :]:
+                index = item.index()
+                if index[4] == self.model.t.first():
+                    continue
+                if name == "Cb" and index[3] == self.model.z.first():
+                    continue
+                val = 0
+                for (a, t, w) in sources:
+                    val += w*var[index[0], a, t, index[3], index[4]].value
+                item.set_value(val)
+        print("\tWarm start for " + str(age) + " -> " + str(temp) + " from "
+                + ", ".join([str(a) + " -> " + str(t) for (a, t, w) in sources]))
+        return True
+
+    # Helper function to list the names of the state variables of each block
+    def _block_var_names(self):
+        var_list = ["Cb", "C", "dCb_dt", "dC_dt", "dCb_dz"]
+        if self.isSurfSpecSet == True:
+            var_list += ["q", "dq_dt"]
+            if self.isSitesSet == True:
+                var_list += ["S"]
+        return var_list
+
+    # Helper function to grab all state variable values for an (age, temp) block
+    #       Returns a dictionary of variable names with a list of
+    #       (index, value) pairs that can be sent between processes
+    def _grab_block_values(self, age, temp):
+        values = {}
+        for name in self._block_var_names():
+            values[name] = []
+            for var in self.model.component(name)[:, age, temp, :, :]:
+                values[name].append( (var.index(), var.value) )
+        return values
+
+    # Helper function to load state variable values from '_grab_block_values'
+    def _load_block_values(self, values):
+        self.result_cache = None
+        for name in values:
+            var = self.model.component(name)
+            for index, val in values[name]:
+                var[index].set_value(val)
+
+    # Helper function to list the names of the variables saved in checkpoints
+    #       These are all variables that are fixed after a time step is solved
+    def _checkpoint_var_names(self):
+        return self._block_var_names()
+
+    # Helper function to grab the variables of a block at a single time
+    def _block_time_slice(self, name, age, temp, time):
+        var = self.model.component(name)
+        if var.dim() == 5:
+            return var[:, age, temp, :, time]
+        return var[age, temp, :, time]
+
+    # Helper function to list the temperatures that are inputs to the initializer
+    def _init_temperature_slices(self):
+        return [self.model.T.values()]
+
+    # Helper function to list the fixed inputs of the initializer as slices of the
+    #       model components (boundary and initial values, temperatures, stoichiometry,
+    #       and kinetic parameters)
+    def _init_input_slices(self):
+        m = self.model
+        slices = [m.Cb[:, :, :, m.z.first(), :], m.Cb[:, :, :, :, m.t.first()], m.C[:, :, :, :, m.t.first()]]
+        if self.isSurfSpecSet == True:
+            slices += [m.q[:, :, :, :, m.t.first()], m.u_q.values()]
+        for name in ["u_C", "A", "B", "E", "Af", "Ef", "dH", "dS"]:
+            slices.append(m.component(name).values())
+        return slices + self._init_temperature_slices()
+
+    # Helper function to give a hash of the values of the fixed inputs of the initializer
+    def _init_inputs_hash(self):
+        sha = hashlib.sha1()
+        for items in self._init_input_slices():
+            sha.update(np.array([item.value for item in items], dtype=float).tobytes())
+        return sha.hexdigest()
+
+    # Helper function to setup the checkpoint of the initializer
+    #       The checkpoint holds one array (time x slice values) for each
+    #       variable of each (age, temp) block, the number of time steps
+    #       that have converged for each block, and a small header used
+    #       to check that the file belongs to the same model. The header
+    #       holds the time points, the slice sizes, and a hash of the fixed
+    #       inputs, so a checkpoint is not resumed after the BCs, ICs,
+    #       temperatures, stoichiometry, or kinetics were changed.
+    #
+    #       Returns None if no checkpoint file is given
+    def _setup_init_checkpoint(self, checkpoint_file, checkpoint_every, resume):
+        if checkpoint_file == None:
+            if resume == True:
+                raise Exception("Error! Must provide a 'checkpoint_file' to resume from")
+            return None
+        if checkpoint_every < 1:
+            raise Exception("Error! 'checkpoint_every' must be at least 1")
+
+        header = {"times": list(self.model.t), "vars": {}, "inputs": self._init_inputs_hash()}
+        for name in self._checkpoint_var_names():
+            header["vars"][name] = len(list(self._block_time_slice(name, self.model.age_set.first(),
+                                                    self.model.T_set.first(), self.model.t.first())))
+        checkpoint = {"file": checkpoint_file, "every": checkpoint_every, "part": False,
+                        "data": {"header": np.array(json.dumps(header))}}
+
+        if resume == True:
+            self._read_init_checkpoint(checkpoint)
+        else:
+            # Remove partial files left over from a prior parallel run
+            for age in self.model.age_set:
+                for temp in self.model.T_set:
+                    if os.path.isfile(self._init_checkpoint_part(checkpoint, age, temp)):
+                        os.remove(self._init_checkpoint_part(checkpoint, age, temp))
+        return checkpoint
+
+    # Helper function to give the name of the file a parallel worker
+    #       writes the checkpoint of an (age, temp) block to
+    def _init_checkpoint_part(self, checkpoint, age, temp):
+        return checkpoint["file"] + ".part-" + str(age) + "-" + str(temp)
+
+    # Helper function to read the checkpoint file (and any partial files)
+    #       Blocks with the most converged time steps are kept
+    def _read_init_checkpoint(self, checkpoint):
+        files = [checkpoint["file"]]
+        for age in self.model.age_set:
+            for temp in self.model.T_set:
+                files.append(self._init_checkpoint_part(checkpoint, age, temp))
+        for file in files:
+            if os.path.isfile(file) == False:
+                continue
+            with np.load(file, allow_pickle=False) as data:
+                if str(data["header"]) != str(checkpoint["data"]["header"]):
+                    print("Warning! Checkpoint '" + file + "' does not match the model (or its inputs) and will be ignored")
+                    continue
+                for age in self.model.age_set:
+                    for temp in self.model.T_set:
+                        key = str(age) + "|" + str(temp) + "|"
+                        if key + "steps" not in data.files:
+                            continue
+                        if key + "steps" in checkpoint["data"]:
+                            if checkpoint["data"][key + "steps"][0] >= data[key + "steps"][0]:
+                                continue
+                        checkpoint["data"][key + "steps"] = data[key + "steps"]
+                        for name in self._checkpoint_var_names():
+                            checkpoint["data"][key + name] = data[key + name]
+
+    # Helper function to write the checkpoint for an (age, temp) block
+    #       In serial, all blocks are written to the checkpoint file. In
+    #       parallel, each worker only writes its own block to a partial
+    #       file that is merged back into the checkpoint by the parent.
+    def _write_init_checkpoint(self, checkpoint, age, temp):
+        if checkpoint == None:
+            return
+        if checkpoint["part"] == True:
+            file = self._init_checkpoint_part(checkpoint, age, temp)
+            key = str(age) + "|" + str(temp) + "|"
+            data = {"header": checkpoint["data"]["header"]}
+            for item in checkpoint["data"]:
+                if item.startswith(key):
+                    data[item] = checkpoint["data"][item]
+        else:
+            file = checkpoint["file"]
+            data = checkpoint["data"]
+        # Write to a temporary file first so a crash never leaves a broken checkpoint
+        with open(file + ".tmp", "wb") as f:
+            np.savez(f, **data)
+        os.replace(file + ".tmp", file)
+        checkpoint["since_write"] = 0
+
+    # Helper function to merge the partial files of a parallel run
+    #       back into the checkpoint file
+    def _merge_init_checkpoint(self, checkpoint):
+        if checkpoint == None:
+            return
+        self._read_init_checkpoint(checkpoint)
+        self._write_init_checkpoint(checkpoint, None, None)
+        for age in self.model.age_set:
+            for temp in self.model.T_set:
+                if os.path.isfile(self._init_checkpoint_part(checkpoint, age, temp)):
+                    os.remove(self._init_checkpoint_part(checkpoint, age, temp))
+
+    # Helper function to record a converged time step of an (age, temp) block
+    #       The checkpoint file is written every 'checkpoint_every' steps
+    def _checkpoint_time_step(self, checkpoint, age, temp, step):
+        if checkpoint == None:
+            return
+        key = str(age) + "|" + str(temp) + "|"
+        time = self.model.t.at(step+1)
+        if key + "steps" not in checkpoint["data"]:
+            checkpoint["data"][key + "steps"] = np.array([1])
+            for name in self._checkpoint_var_names():
+                size = len(list(self._block_time_slice(name, age, temp, time)))
+                checkpoint["data"][key + name] = np.full((len(self.model.t), size), np.nan)
+        for name in self._checkpoint_var_names():
+            checkpoint["data"][key + name][step,:] = [var.value for var in self._block_time_slice(name, age, temp, time)]
+        checkpoint["data"][key + "steps"] = np.array([step+1])
+
+        checkpoint["since_write"] = checkpoint.get("since_write", 0) + 1
+        if checkpoint["since_write"] >= checkpoint["every"]:
+            self._write_init_checkpoint(checkpoint, age, temp)
+
+    # Helper function to restore the converged time steps of an (age, temp) block
+    #
+    #       Returns the number of time steps (including the IC) that were restored
+    def _restore_block_checkpoint(self, checkpoint, age, temp):
+        if checkpoint == None:
+            return 0
+        key = str(age) + "|" + str(temp) + "|"
+        if key + "steps" not in checkpoint["data"]:
+            return 0
+        steps = int(checkpoint["data"][key + "steps"][0])
+        for step in range(1, steps):
+            time = self.model.t.at(step+1)
+            for name in self._checkpoint_var_names():
+                for var, val in zip(self._block_time_slice(name, age, temp, time), checkpoint["data"][key + name][step]):
+                    if np.isnan(val) == False:
+                        var.set_value(val)
+        return steps
+
+    # Function to initilize the simulator
+    #       workers = number of processes to use for initializing
+    #                   the (age, temp) blocks of the model. Each block
+    #                   is independent, thus results are the same as
+    #                   the serial method (workers = 1).
+    #
+    #       checkpoint_file = name of a binary (.npz) file to save the
+    #                   converged time steps of each (age, temp) block to
+    #                   while initializing. The file is written every
+    #                   'checkpoint_every' time steps.
+    #
+    #       resume = if True, time steps already converged in the
+    #                   'checkpoint_file' are loaded and skipped, thus an
+    #                   interrupted initialization picks up where it died.
+    #
+    #       windowed_steps = if True, several time steps of the grid are solved
+    #                   together in windows of up to 'max_window' steps in smooth
+    #                   regions, and a failed time step is solved by continuation
+    #                   over 'substeps' sub-steps (ramping the BCs and inputs).
+    #                   The window shrinks when the relative change per
+    #                   step is larger than 'step_change_tol'. The time step
+    #                   of the grid is not changed. This replaces the
+    #                   'restart_on_warning', 'restart_on_error', and
+    #                   'use_old_times' options.
+    #
+    #       warm_start = strategy for the initial guesses of each new (age, temp)
+    #                   block (see WarmStartMethod). 'PreviousTime' only uses the
+    #                   prior time step of the same block. 'NearestBlock' and
+    #                   'TemperatureInterpolation' seed the whole block from the
+    #                   already solved block(s) nearest in temperature (or age).
+    #                   Only available for serial initialization (workers = 1).
+    #
+    #       solver_stats = if True, the Ipopt iterations of every sub-solve are
+    #                   counted (from a temporary Ipopt output file), printed,
+    #                   and kept in 'self.init_warm_start_stats' by warm start
+    #                   strategy. Always True when the performance log is on.
+    def initialize_simulator(self, console_out=False, options={'print_user_options': 'yes',
+                                                    'linear_solver': LinearSolverMethod.MA27,
+                                                    'tol': 1e-8,
+                                                    'acceptable_tol': 1e-8,
+                                                    'compl_inf_tol': 1e-8,
+                                                    'constr_viol_tol': 1e-8,
+                                                    'max_iter': 3000,
+                                                    'obj_scaling_factor': 1,
+                                                    'diverging_iterates_tol': 1e50},
+                                                    restart_on_warning=False,
+                                                    restart_on_error=False,
+                                                    use_old_times=False,
+                                                    workers=1,
+                                                    checkpoint_file=None,
+                                                    checkpoint_every=10,
+                                                    resume=False,
+                                                    windowed_steps=False,
+                                                    max_window=8,
+                                                    substeps=4,
+                                                    step_change_tol=0.1,
+                                                    warm_start=WarmStartMethod.PreviousTime,
+                                                    solver_stats=False):
+        for spec in self.model.gas_set:
+            for age in self.model.age_set:
+                for temp in self.model.T_set:
+                    if self.isBoundarySet[spec][age][temp] == False:
+                        raise Exception("Error! Must specify boundaries before attempting to solve. "
+                                        +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
+        if self.isSurfSpecSet == True:
+            for spec in self.model.surf_set:
+                for age in self.model.age_set:
+                    for temp in self.model.T_set:
+                        if self.isInitialSet[spec][age][temp] == False:
+                            raise Exception("Error! Must specify initial conditions before attempting to solve. "
+                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+
+        if self.isIsothermalTempSet == False:
+            raise Exception("Error! Cannot initialize if temperatures are not set first")
+
+        # Temperatures or stoichiometry may have been changed directly
+        self._update_rate_const_sharing()
+        self._update_reaction_network()
+
+        if self.isVelocityRecalculated == False:
+            self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
+
+        # Setup a dictionary to determine which reaction to unfix after solve
+        self.initialize_time = TIME.time()
+        self.result_cache = None
+        fixed_dict = {}
+        for rxn in self.rxn_list:
+            fixed_dict[rxn]=self.rxn_list[rxn]["fixed"]
         self.fix_all_reactions()
+        self._kinetics_to_log_parameters()
 
         # Run a solve of the model without objective function
         if self.isObjectiveSet == True:
@@ -2716,273 +4346,69 @@ class Isothermal_Monolith_Simulator(object):
                 self.model.site_cons[:, :, :, :, :].deactivate()
 
         # Loops over specific sub-problems to solve
-        age_solve_old = self.model.age_set.first()
-        temp_solve_old = self.model.T_set.first()
-        time_solve_old = self.model.t.first()
+        #   Each (age, temp) block is independent of the others, thus they
+        #   can be farmed out to separate processes if 'workers' > 1
+        block_list = []
         for age_solve in self.model.age_set:
             for temp_solve in self.model.T_set:
-
-                # Inside age_solve && temp_solve
-                print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
-
-                i=0
-                for time_solve in self.model.t:
-                    # Solve 1 time at a time starting with the i=1 time step (since IC is known)
-                    if i > 0:
-                        start = TIME.time()
-                        print("\t... time_step " + str(time_solve))
-                        self.model.Cb[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.C[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                            self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].activate()
-
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-
-                            if self.isSitesSet == True:
-                                self.model.S[:, age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.site_cons[:, age_solve, temp_solve, :, time_solve].activate()
-
-                        # Make sure the vars that should be fixed, are fixed
-                        #   Fix ICs, BCs, and dCb_dt @ z=0, t=0
-                        self.model.dCb_dt[:,age_solve, temp_solve,self.model.z.first(),self.model.t.first()].fix()
-                        self.model.Cb[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        self.model.C[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        self.model.Cb[:,age_solve, temp_solve,self.model.z.first(), :].fix()
-
-                        #Inside age_solve, temp_solve, and time_solve
-                        solver = SolverFactory('ipopt')
-                        #solver = SolverFactory('multistart')
-                        #solver = SolverFactory('trustregion')
-
-                        # Check user options
-                        for item in options:
-                            solver.options[item] = options[item]
-                        if 'print_user_options' in options:
-                            if options['print_user_options'] == "yes":
-                                solver.options['print_user_options'] = options['print_user_options']
-                        else:
-                            solver.options['print_user_options'] = 'yes'
-                        #   linear_solver -> valid options:
-                        #   -------------------------------
-                        #       Depends on installed libraries
-                        #           'mumps'  --> available on Windows AND 'idaes'
-                        #                       (Only option if NOT using 'idaes')
-                        #           'ma27' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Small problems, Not parallel)
-                        #           'ma57' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Medium problems, threaded blas)
-                        #           'ma77' --> NOT functional with Windows OR 'idaes'
-                        #           'ma86' --> NOT functional with Windows OR 'idaes'
-                        #           'ma97' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Large problems, parallel)
-                        #           'pardiso' --> NOT functional with Windows OR 'idaes'
-                        #           'wsmp' --> NOT functional with Windows OR 'idaes'
-                        #
-                        #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
-                        #           computationally efficient than the standard Windows
-                        #           solver libraries
-                        if 'linear_solver' in options:
-                            # Force the use of MUMPS if conda environment is not setup for 'idaes'
-                            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                options['linear_solver'] = LinearSolverMethod.MUMPS
-                            if options['linear_solver'] == LinearSolverMethod.MUMPS:
-                                # Only available option without 'idaes' enviroment or
-                                #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
-                                solver.options['linear_solver'] = 'mumps'
-                            elif options['linear_solver'] == LinearSolverMethod.MA27:
-                                # Best for small problems (no parallelization)
-                                solver.options['linear_solver'] = 'ma27'
-                            elif options['linear_solver'] == LinearSolverMethod.MA57:
-                                # Best for medium problems (threaded BLAS)
-                                solver.options['linear_solver'] = 'ma57'
-                            elif options['linear_solver'] == LinearSolverMethod.MA97:
-                                # Best for large problems (maximizes parallelization)
-                                solver.options['linear_solver'] = 'ma97'
-                            else:
-                                print("Error! Invalid solver option")
-                                print("\tValid Options: 'LinearSolverMethod.MUMPS'")
-                                print("\t               'LinearSolverMethod.MA27'")
-                                print("\t               'LinearSolverMethod.MA57'")
-                                print("\t               'LinearSolverMethod.MA97'")
-                                raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
-                        else:
-                            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                solver.options['linear_solver'] = 'mumps'
-                            else:
-                                solver.options['linear_solver'] = 'ma97'
-                        if 'tol' in options:
-                            solver.options['tol'] = options['tol']
-                        else:
-                            solver.options['tol'] = 1e-8
-                        if 'acceptable_tol' in options:
-                            solver.options['acceptable_tol'] = options['acceptable_tol']
-                        else:
-                            solver.options['acceptable_tol'] = 1e-8
-                        if 'compl_inf_tol' in options:
-                            solver.options['compl_inf_tol'] = options['compl_inf_tol']
-                        else:
-                            solver.options['compl_inf_tol'] = 1e-8
-                        if 'constr_viol_tol' in options:
-                            solver.options['constr_viol_tol'] = options['constr_viol_tol']
-                        else:
-                            solver.options['constr_viol_tol'] = 1e-8
-                        if 'max_iter' in options:
-                            solver.options['max_iter'] = options['max_iter']
-                        else:
-                            solver.options['max_iter'] = 3000
-                        if 'obj_scaling_factor' in options:
-                            solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
-                        else:
-                            solver.options['obj_scaling_factor'] = 1
-                        if 'diverging_iterates_tol' in options:
-                            solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
-                        else:
-                            solver.options['diverging_iterates_tol'] = 1e50
-                        if 'warm_start_init_point' in options:
-                            solver.options['warm_start_init_point'] = options['warm_start_init_point']
-                        else:
-                            solver.options['warm_start_init_point'] = 'yes'
-
-                        # Run solver (tighten the bounds to force good solutions) (1e-4 was old)
-                        solver.options['bound_push'] = 1e-6
-                        solver.options['bound_frac'] = 1e-6
-                        solver.options['mu_init'] = 1e-2
-                        solver.options['slack_bound_push'] = 1e-6
-                        solver.options['slack_bound_frac'] = 1e-6
-                        solver.options['warm_start_init_point'] = 'yes'
-
-                        if self.model.find_component('scaling_factor'):
-                            solver.options['nlp_scaling_method'] = 'user-scaling'
-                        else:
-                            solver.options['nlp_scaling_method'] = 'gradient-based'
-
-                        if use_old_times == True:
-                            self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
-                            solver.options['nlp_scaling_method'] = 'gradient-based'
-
-                        results = solver.solve(self.model, tee=console_out, load_solutions=False)
-                        if results.solver.status == SolverStatus.ok:
-                            self.model.solutions.load_from(results)
-                        elif results.solver.status == SolverStatus.warning:
-                            if restart_on_warning == False:
-                                print("WARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                print("\tResults are loaded, but need to be checked")
-                                self.model.solutions.load_from(results)
-                            else:
-                                print("WARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                print("\tAttempting to correct with restart...")
-                                #Establish initial guess
-                                self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
-
-                                #After initial guess, rerun solver
-                                if solver.options['nlp_scaling_method'] == 'user-scaling':
-                                    solver.options['nlp_scaling_method'] = 'gradient-based'
-                                else:
-                                    if self.model.find_component('scaling_factor'):
-                                        solver.options['nlp_scaling_method'] = 'user-scaling'
-                                results = solver.solve(self.model, tee=console_out, load_solutions=False)
-
-                                if results.solver.status == SolverStatus.ok:
-                                    self.model.solutions.load_from(results)
-                                    print("\tCorrection success!")
-                                elif results.solver.status == SolverStatus.warning:
-                                    print("\tSame issue persists...")
-                                    print("\tResults are loaded, but need to be checked")
-                                    self.model.solutions.load_from(results)
-                                else:
-                                    #self.model.solutions.load_from(results)
-                                    print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                    print("\tStatus: " + str(results.solver.status))
-                                    print("\tTermination Condition: " + str(results.solver.termination_condition))
-                                    return (results.solver.status, results.solver.termination_condition)
-
-                        else:
-                            if restart_on_error == False:
-                                #self.model.solutions.load_from(results)
-                                print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                print("\tStatus: " + str(results.solver.status))
-                                print("\tTermination Condition: " + str(results.solver.termination_condition))
-                                return (results.solver.status, results.solver.termination_condition)
-                            else:
-                                print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                print("\tAttempting to recover with restart...")
-                                #Establish initial guess
-                                self._initial_guesser(age_solve, temp_solve, time_solve, time_solve_old)
-
-                                #After initial guess, rerun solver
-                                if solver.options['nlp_scaling_method'] == 'user-scaling':
-                                    solver.options['nlp_scaling_method'] = 'gradient-based'
-                                else:
-                                    if self.model.find_component('scaling_factor'):
-                                        solver.options['nlp_scaling_method'] = 'user-scaling'
-                                results = solver.solve(self.model, tee=console_out, load_solutions=False)
-
-                                if results.solver.status == SolverStatus.ok:
-                                    self.model.solutions.load_from(results)
-                                    print("\tRecovery success!")
-                                elif results.solver.status == SolverStatus.warning:
-                                    print("\tWARNING: Solver did not exit normally at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                    print("\tResults are loaded, but need to be checked")
-                                    self.model.solutions.load_from(results)
-                                else:
-                                    #self.model.solutions.load_from(results)
-                                    print("\tUnable to recover...")
-                                    print("An Error has occurred at (" + str(age_solve) + ", " + str(temp_solve) + ", " + str(time_solve) + ")")
-                                    print("\tStatus: " + str(results.solver.status))
-                                    print("\tTermination Condition: " + str(results.solver.termination_condition))
-                                    return (results.solver.status, results.solver.termination_condition)
-
-                        # Fix the steps that were just solved
-                        self.model.Cb[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.C[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                            self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].deactivate()
-
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-
-                            if self.isSitesSet == True:
-                                self.model.S[:, age_solve, temp_solve, :, time_solve].fix()
-                                self.model.site_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-
-                    else:
-                        # i = 0, don't do anything
-                        pass
-                    i+=1
-                    time_solve_old = time_solve
-                # End time_solve loop
-                temp_solve_old = temp_solve
-            # End temp_solve loop
-            age_solve_old = age_solve
-        # End age_solve loop
+                block_list.append( (age_solve, temp_solve) )
+        checkpoint = self._setup_init_checkpoint(checkpoint_file, checkpoint_every, resume)
+        windowed = None
+        if windowed_steps == True:
+            windowed = {"max_window": max_window, "substeps": substeps, "step_change_tol": step_change_tol}
+        block_args = (console_out, options, restart_on_warning, restart_on_error, use_old_times, windowed, checkpoint)
+
+        if workers > 1 and len(block_list) > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            print("WARNING: Parallel initialization requires 'fork' processes on this platform")
+            print("\tReverting to serial initialization...")
+            workers = 1
+
+        if workers > 1 and len(block_list) > 1 and warm_start != WarmStartMethod.PreviousTime:
+            print("WARNING: Warm starts from other blocks require serial initialization")
+            print("\tReverting to 'WarmStartMethod.PreviousTime'...")
+            warm_start = WarmStartMethod.PreviousTime
+
+        self.init_solver_stats = {"calls": 0, "iterations": 0}
+        self.isInitStatsLogged = solver_stats == True or self.perf_log_file != None
+        if workers > 1 and len(block_list) > 1:
+            global _parallel_init_simulator
+            _parallel_init_simulator = self
+            context = multiprocessing.get_context("fork")
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(block_list)), mp_context=context) as pool:
+                    jobs = [pool.submit(_parallel_initialize_block, age_solve, temp_solve, block_args) for (age_solve, temp_solve) in block_list]
+                    block_results = [job.result() for job in jobs]
+            finally:
+                # Never keep a reference to the model after the workers are done
+                _parallel_init_simulator = None
+
+            # Merge all block values back into this model (in serial order)
+            for (status, condition, success, values, stats) in block_results:
+                self._load_block_values(values)
+                for item in stats:
+                    self.init_solver_stats[item] += stats[item]
+            self._merge_init_checkpoint(checkpoint)
+            for (status, condition, success, values, stats) in block_results:
+                if success == False:
+                    return (status, condition)
+        else:
+            solved = []
+            try:
+                for (age_solve, temp_solve) in self._warm_start_order(block_list, warm_start):
+                    warm_started = self._warm_start_block(age_solve, temp_solve, solved, warm_start)
+                    (status, condition, success) = self._initialize_block(age_solve, temp_solve, *block_args,
+                                                                        warm_started=warm_started)
+                    if success == False:
+                        return (status, condition)
+                    solved.append( (age_solve, temp_solve) )
+            finally:
+                self._remove_solver_log()
+
+        # Report the solver effort for this warm start strategy
+        if self.isInitStatsLogged == True:
+            self.init_warm_start_stats[str(warm_start)] = self.init_solver_stats.copy()
+            print("Warm start " + str(warm_start) + ": " + str(self.init_solver_stats["iterations"])
+                    + " Ipopt iterations in " + str(self.init_solver_stats["calls"]) + " solver calls")
 
         # Unfix all variables
         self.model.Cb[:, :, :, :, :].unfix()
@@ -3026,8 +4452,11 @@ class Isothermal_Monolith_Simulator(object):
                 self.unfix_reaction(rxn)
 
         self.isInitialized = True
-        self.initialize_time = (TIME.time() - self.initialize_time)
-        return (results.solver.status, results.solver.termination_condition)
+        initialize_start = self.initialize_time
+        self.initialize_time = (TIME.time() - initialize_start)
+        self._log_performance("initialize_simulator", initialize_start,
+                                calls=self.init_solver_stats["calls"], iterations=self.init_solver_stats["iterations"])
+        return (status, condition)
         # End Initializer
 
     # Function to run the solver
@@ -3057,12 +4486,17 @@ class Isothermal_Monolith_Simulator(object):
         if self.isIsothermalTempSet == False:
             raise Exception("Error! Cannot solve if temperatures are not set first")
 
+        # Temperatures or stoichiometry may have been changed directly
+        self._update_rate_const_sharing()
+        self._update_reaction_network()
+
         if self.isObjectiveSet == False:
             print("Warning! No objective function set. Forcing all kinetics to be fixed.")
             self.fix_all_reactions()
         if self.isVelocityRecalculated == False:
             self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
         self.solve_time = TIME.time()
+        self.result_cache = None
 
         solver = SolverFactory('ipopt')
 
@@ -3196,7 +4630,8 @@ class Isothermal_Monolith_Simulator(object):
         else:
             solver.options['nlp_scaling_method'] = 'gradient-based'
 
-        results = solver.solve(self.model, tee=console_out, load_solutions=False)
+        self._kinetics_to_log_parameters()
+        results = self._solve_logged(solver, console_out, "run_solver")
         if results.solver.status == SolverStatus.ok:
             self.model.solutions.load_from(results)
         elif results.solver.status == SolverStatus.warning:
@@ -3211,6 +4646,7 @@ class Isothermal_Monolith_Simulator(object):
             print("An Error has occurred!")
             print("\tStatus: " + str(results.solver.status))
             print("\tTermination Condition: " + str(results.solver.termination_condition))
+        self._log_parameters_to_kinetics()
 
         self.solve_time = (TIME.time() - self.solve_time)
 
@@ -3222,6 +4658,676 @@ class Isothermal_Monolith_Simulator(object):
         print()
         return (results.solver.status, results.solver.termination_condition)
 
+    # Helper function to list the free kinetic parameters for a multi-start fit
+    #       Only parameters that are not fixed and have a finite range of bounds
+    #       are varied. Pre-exponential factors with positive bounds are sampled
+    #       on a log scale.
+    #
+    #       Returns a list of (var, isLogScale)
+    def _multistart_parameters(self):
+        params = []
+        for rxn in self.model.all_rxns:
+            if rxn in self.model.arrhenius_rxns:
+                names = ["A", "B", "E"]
+            else:
+                names = ["Af", "Ef", "dH", "dS"]
+            for name in names:
+                var = self.model.component(name)[rxn]
+                if var.fixed == True or var.lb == None or var.ub == None or var.lb >= var.ub:
+                    continue
+                params.append( (var, name in ["A", "Af"] and var.lb > 0) )
+        return params
+
+    # Helper function to generate Latin hypercube starting points for the parameters
+    #       Each parameter range is split into 'n_starts' equal intervals (on a
+    #       log scale for pre-exponential factors) and every interval is
+    #       sampled exactly once.
+    #
+    #       Returns a 2D array of values (n_starts x parameters)
+    def _latin_hypercube_points(self, params, n_starts, seed=None):
+        rng = np.random.default_rng(seed)
+        points = np.zeros((n_starts, len(params)))
+        for j, (var, isLogScale) in enumerate(params):
+            u = (rng.permutation(n_starts) + rng.random(n_starts))/n_starts
+            if isLogScale == True:
+                points[:,j] = np.exp(np.log(var.lb) + u*(np.log(var.ub) - np.log(var.lb)))
+            else:
+                points[:,j] = var.lb + u*(var.ub - var.lb)
+        return points
+
+    # Helper function to run a single start of the multi-start parameter estimation
+    #       The model is reset to the initialized 'state' before the solve
+    #
+    #       Returns a dictionary with the status, termination condition, objective,
+    #       parameter values, and (if 'keep_state') the values of all variables
+    def _multistart_solve(self, start, point, params, state, console_out, options, keep_state=True):
+        self._set_model_values(state)
+        for (var, isLogScale), val in zip(params, point):
+            var.set_value(float(val))
+        print("Multi-start " + str(start) + " of parameter estimation...")
+        if options == None:
+            (status, condition) = self.run_solver(console_out=console_out)
+        else:
+            (status, condition) = self.run_solver(console_out=console_out, options=options)
+        try:
+            objective = value(self.model.obj)
+        except:
+            objective = np.nan
+        result = {"start": start, "status": status, "condition": condition,
+                  "objective": objective, "params": [var.value for (var, isLogScale) in params]}
+        if keep_state == True:
+            result["state"] = self._grab_model_values()
+        return result
+
+    # Helper function to grab the values of all variables in the model as an array
+    def _grab_model_values(self):
+        return np.array([var.value for var in self.model.component_data_objects(Var)], dtype=float)
+
+    # Helper function to set the values of all variables in the model from an array
+    #       (as given by '_grab_model_values')
+    def _set_model_values(self, values):
+        self.result_cache = None
+        for var, val in zip(self.model.component_data_objects(Var), values):
+            if np.isnan(val) == False:
+                var.set_value(val, skip_validation=True)
+
+    # Function to run a multi-start parameter estimation
+    #       Fits from a single starting point often end in a local optimum. This
+    #       driver runs 'n_starts' fits from Latin hypercube starting points that
+    #       span the bounds of the kinetic parameters (as given with
+    #       'set_reaction_info' or 'set_reaction_param_bounds'). Every fit starts
+    #       from the same initialized state of the model. The current parameters
+    #       are also used as a start if 'include_current' is True.
+    #
+    #       workers = number of processes used to run the fits (each fit is
+    #                   independent, thus results are the same as for serial)
+    #
+    #       seed = seed for the random number generator (for repeatable starts)
+    #
+    #       The best fit (lowest objective of the fits that solved) is loaded
+    #       into the model. All results are kept in 'self.multistart_results'
+    #       and the spread of the objectives and parameters is printed.
+    #
+    #       Returns a tuple of (status, termination_condition) of the best fit
+    def run_multistart_solver(self, n_starts=8, workers=1, seed=None, include_current=True,
+                                console_out=False, options=None):
+        if self.isObjectiveSet == False:
+            raise Exception("Error! Multi-start parameter estimation requires an objective function")
+        if self.isInitialized == False:
+            raise Exception("Error! Must initialize the simulator before running a multi-start parameter estimation")
+        if n_starts < 1:
+            raise Exception("Error! Number of starting points must be at least 1. "
+                            +str(n_starts)+" given is not valid")
+
+        params = self._multistart_parameters()
+        if len(params) == 0:
+            raise Exception("Error! No free kinetic parameters with bounds to vary for a multi-start")
+        points = self._latin_hypercube_points(params, n_starts, seed)
+        if include_current == True:
+            points = np.vstack( ([var.value for (var, isLogScale) in params], points) )
+        state = self._grab_model_values()
+
+        if workers > 1 and len(points) > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            print("WARNING: Parallel multi-start requires 'fork' processes on this platform")
+            print("\tReverting to serial multi-start...")
+            workers = 1
+
+        results = []
+        best = None
+        if workers > 1 and len(points) > 1:
+            global _parallel_init_simulator
+            _parallel_init_simulator = self
+            context = multiprocessing.get_context("fork")
+            solve_args = (state, console_out, options)
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(points)), mp_context=context) as pool:
+                    jobs = [pool.submit(_parallel_multistart_solve, start, point, solve_args) for start, point in enumerate(points)]
+                    for job in jobs:
+                        result = job.result()
+                        results.append(result)
+                        if self._is_better_multistart(result, best) == True:
+                            best = result
+            finally:
+                _parallel_init_simulator = None
+        else:
+            for start, point in enumerate(points):
+                result = self._multistart_solve(start, point, params, state, console_out, options, keep_state=False)
+                results.append(result)
+                if self._is_better_multistart(result, best) == True:
+                    best = result
+                    best["state"] = self._grab_model_values()
+
+        # Load the best fit back into the model
+        if best == None:
+            print("WARNING: None of the starting points gave a solution")
+            print("\tThe model is left at the initialized state")
+            self._set_model_values(state)
+            best = results[0]
+        else:
+            self._set_model_values(best["state"])
+        for result in results:
+            result.pop("state", None)
+        self.multistart_results = results
+
+        self._print_multistart_summary(params, results, best)
+        return (best["status"], best["condition"])
+
+    # Helper function to check if a multi-start result is better than the best so far
+    #       Only fits that solved (with or without warnings) are considered
+    def _is_better_multistart(self, result, best):
+        if result["status"] != SolverStatus.ok and result["status"] != SolverStatus.warning:
+            return False
+        if np.isnan(result["objective"]) == True:
+            return False
+        if best == None:
+            return True
+        return result["objective"] < best["objective"]
+
+    # Helper function to print the spread of the multi-start results
+    def _print_multistart_summary(self, params, results, best):
+        print("\nMulti-start Results")
+        print("-------------------")
+        print("\tStart\tObjective\tStatus")
+        for result in results:
+            print("\t" + str(result["start"]) + "\t" + str(result["objective"]) + "\t" + str(result["status"]))
+        solved = [result for result in results if self._is_better_multistart(result, None) == True]
+        print("\n\tSolved starts = " + str(len(solved)) + " of " + str(len(results)))
+        if len(solved) == 0:
+            print()
+            return
+        objectives = np.array([result["objective"] for result in solved])
+        print("\tBest start    = " + str(best["start"]) + " (objective = " + str(best["objective"]) + ")")
+        print("\tObjective (min, median, max) = (" + str(np.min(objectives)) + ", "
+                + str(np.median(objectives)) + ", " + str(np.max(objectives)) + ")")
+        print("\tParameters (best, min, max):")
+        values = np.array([result["params"] for result in solved])
+        for j, (var, isLogScale) in enumerate(params):
+            print("\t  " + var.name + " = " + str(best["params"][j]) + ", "
+                    + str(np.min(values[:,j])) + ", " + str(np.max(values[:,j])))
+        print()
+
+    # Helper function to list the kinetic parameters shared by all blocks in a fit
+    #       These are the free parameters that the solver sees (i.e., the
+    #       log-parameterized forms if 'set_log_parameterized_kinetics' is used)
+    def _shared_parameters(self):
+        params = []
+        for rxn in self.model.all_rxns:
+            if rxn in self.model.arrhenius_rxns:
+                if self.isLogParameterized == True:
+                    names = ["lnk_ref", "B", "E_ref"]
+                else:
+                    names = ["A", "B", "E"]
+            else:
+                if self.isLogParameterized == True:
+                    names = ["lnkf_ref", "Ef_ref", "dH", "dS"]
+                else:
+                    names = ["Af", "Ef", "dH", "dS"]
+            for name in names:
+                var = self.model.component(name)[rxn]
+                if var.fixed == False:
+                    params.append(var)
+        return params
+
+    # Helper function to solve the sub-problem of a single (age, temp) block for a
+    #       decomposed parameter estimation
+    #
+    #       The block sees its own data and constraints, and its local copy of
+    #       the shared parameters is pulled towards the consensus values 'z'
+    #       by the (scaled) augmented Lagrangian terms
+    #
+    #               SUM(j, lam_j*u_j + rho/2*u_j^2),  u_j = (p_j - z_j)/scale_j
+    #
+    #       If 'lam' is None, the shared parameters are fixed at 'z' instead
+    #       (i.e., the block is only simulated).
+    #
+    #       Returns a dictionary with the status, termination condition,
+    #       objective of the block, and the values of the shared parameters
+    def _decomposed_block_solve(self, age, temp, z, lam, rho, scale, console_out, options):
+        params = self._shared_parameters()
+        for var, val in zip(params, z):
+            var.set_value(float(val))
+
+        block = self._build_block_subproblem(age, temp)
+        hasData = age in self.model.data_age_set and temp in self.model.data_T_set
+        if lam is None:
+            for var in params:
+                var.fix()
+            block.obj = Objective(expr=0)
+        else:
+            if self.isLogParameterized == True:
+                block.lnA_bounds = Reference(self.model.lnA_bounds[:])
+            penalty = 0
+            for j, var in enumerate(params):
+                u = (var - float(z[j]))/float(scale[j])
+                penalty += float(lam[j])*u + rho/2*u**2
+            if hasData == True:
+                block.obj = Objective(expr=self.model.block_obj[age,temp] + penalty)
+            else:
+                block.obj = Objective(expr=penalty)
+
+        self._set_block_scaling(block, age, temp, list(self.model.t))
+        solver = self._setup_initializer_solver(options)
+        if block.find_component('scaling_factor'):
+            if self.model.scaling_factor.get(self.model.obj) != None:
+                block.scaling_factor[block.obj] = self.model.scaling_factor[self.model.obj]
+            solver.options['nlp_scaling_method'] = 'user-scaling'
+        else:
+            solver.options['nlp_scaling_method'] = 'gradient-based'
+
+        results = solver.solve(block, tee=console_out, load_solutions=False)
+        if results.solver.status == SolverStatus.ok or results.solver.status == SolverStatus.warning:
+            block.solutions.load_from(results)
+        if lam is None:
+            for var in params:
+                var.unfix()
+
+        objective = 0
+        if hasData == True:
+            objective = value(self.model.block_obj[age,temp])
+        return {"age": age, "temp": temp, "status": results.solver.status,
+                "condition": results.solver.termination_condition,
+                "objective": objective, "params": np.array([var.value for var in params], dtype=float)}
+
+    # Helper function to solve a list of blocks for the decomposed parameter estimation
+    #       Blocks are solved in forked worker processes if 'workers' > 1, and
+    #       the block values are merged back into this model
+    #
+    #       Returns a list of the result dictionaries (in order of 'block_list')
+    def _decomposed_solve_blocks(self, block_list, workers, z, lam, rho, scale, console_out, options):
+        if workers > 1 and len(block_list) > 1:
+            global _parallel_init_simulator
+            _parallel_init_simulator = self
+            context = multiprocessing.get_context("fork")
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(block_list)), mp_context=context) as pool:
+                    jobs = []
+                    for (age, temp) in block_list:
+                        block_lam = None if lam == None else lam[age,temp]
+                        solve_args = (z, block_lam, rho, scale, console_out, options)
+                        jobs.append(pool.submit(_parallel_decomposed_solve, age, temp, solve_args))
+                    results = [job.result() for job in jobs]
+            finally:
+                _parallel_init_simulator = None
+            for result in results:
+                self._load_block_values(result.pop("values"))
+            return results
+
+        results = []
+        for (age, temp) in block_list:
+            block_lam = None if lam == None else lam[age,temp]
+            results.append(self._decomposed_block_solve(age, temp, z, block_lam, rho, scale, console_out, options))
+        return results
+
+    # Function to run a decomposed parameter estimation
+    #       Instead of a single NLP for all (age, temp) blocks of data, each block
+    #       is solved as its own (much smaller) NLP, and only the shared kinetic
+    #       parameters are coordinated between the blocks by consensus ADMM.
+    #       Each block has a local copy of the parameters, which is pulled
+    #       towards the consensus values (the mean of the local copies) by an
+    #       augmented Lagrangian penalty. Blocks are independent of each other,
+    #       thus they can be solved in parallel with 'workers' > 1.
+    #
+    #       rho = penalty weight for the (scaled) differences between the local
+    #               and consensus parameters. If None, it is set from the initial
+    #               objective of the blocks. The weight is adjusted to balance the
+    #               primal and dual residuals.
+    #
+    #       max_iter = maximum number of ADMM iterations
+    #
+    #       tol = tolerance on the primal and dual residuals (scaled by the
+    #               bounds range of each parameter)
+    #
+    #       After convergence, the parameters are set to the consensus values and
+    #       every block is simulated with them, so the states are consistent with
+    #       a single set of parameters. The residuals of each iteration are kept
+    #       in 'self.decomposed_history'.
+    #
+    #       Returns a tuple of (status, termination_condition) of the final step
+    def run_decomposed_solver(self, workers=1, rho=None, max_iter=50, tol=1e-4, console_out=False,
+                                options={'print_user_options': 'yes',
+                                        'linear_solver': LinearSolverMethod.MA97,
+                                        'tol': 1e-6,
+                                        'acceptable_tol': 1e-6,
+                                        'compl_inf_tol': 1e-6,
+                                        'constr_viol_tol': 1e-6,
+                                        'max_iter': 3000,
+                                        'obj_scaling_factor': 1,
+                                        'diverging_iterates_tol': 1e50}):
+        if self.isObjectiveSet == False:
+            raise Exception("Error! Decomposed parameter estimation requires an objective function")
+        if self.isInitialized == False:
+            raise Exception("Error! Must initialize the simulator before running a decomposed parameter estimation")
+        if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            print("WARNING: Parallel decomposition requires 'fork' processes on this platform")
+            print("\tReverting to serial decomposition...")
+            workers = 1
+        if self.isVelocityRecalculated == False:
+            self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
+        self._update_rate_const_sharing()
+        self._update_reaction_network()
+        self._kinetics_to_log_parameters()
+        self.solve_time = TIME.time()
+        self.result_cache = None
+
+        if self.model.find_component('block_obj') == None:
+            self.model.block_obj = Expression(self.model.data_age_set, self.model.data_T_set,
+                                        rule=self.block_objective)
+        data_blocks = [(age, temp) for age in self.model.data_age_set for temp in self.model.data_T_set]
+        params = self._shared_parameters()
+        if len(params) == 0:
+            raise Exception("Error! No free kinetic parameters to estimate")
+
+        # Consensus values and scales of the shared parameters
+        z = np.array([var.value for var in params], dtype=float)
+        scale = np.ones(len(params))
+        for j, var in enumerate(params):
+            if var.lb != None and var.ub != None and var.ub > var.lb:
+                scale[j] = var.ub - var.lb
+            else:
+                scale[j] = max(abs(var.value), 1)
+        lam = {}
+        for block in data_blocks:
+            lam[block] = np.zeros(len(params))
+        if rho == None:
+            rho = max(10*value(self.model.obj)/len(data_blocks), 1e-8)
+
+        print("\nDecomposed parameter estimation for " + str(len(data_blocks)) + " blocks and "
+                + str(len(params)) + " parameters")
+        self.decomposed_history = []
+        for it in range(1, max_iter+1):
+            results = self._decomposed_solve_blocks(data_blocks, workers, z, lam, rho, scale, console_out, options)
+            for result in results:
+                if result["status"] != SolverStatus.ok and result["status"] != SolverStatus.warning:
+                    print("An Error has occurred in block (" + str(result["age"]) + ", " + str(result["temp"]) + ")")
+                    print("\tStatus: " + str(result["status"]))
+                    print("\tTermination Condition: " + str(result["condition"]))
+                    self._set_shared_parameters(params, z)
+                    self.solve_time = (TIME.time() - self.solve_time)
+                    return (result["status"], result["condition"])
+
+            # Update the consensus values and multipliers
+            z_old = z
+            local = np.array([result["params"] for result in results])
+            z = np.mean(local, axis=0) + scale*np.mean([lam[block] for block in data_blocks], axis=0)/rho
+            for j, var in enumerate(params):
+                if var.lb != None:
+                    z[j] = max(z[j], var.lb)
+                if var.ub != None:
+                    z[j] = min(z[j], var.ub)
+            for result in results:
+                lam[result["age"],result["temp"]] += rho*(result["params"] - z)/scale
+
+            primal = np.sqrt(np.sum(((local - z)/scale)**2))
+            dual = rho*np.sqrt(len(data_blocks))*np.sqrt(np.sum(((z - z_old)/scale)**2))
+            objective = sum([result["objective"] for result in results])
+            self.decomposed_history.append({"iteration": it, "objective": objective, "primal": primal,
+                                            "dual": dual, "rho": rho})
+            print("\tADMM iteration " + str(it) + ": objective = " + str(objective) + ", primal residual = "
+                    + str(primal) + ", dual residual = " + str(dual))
+            if primal < tol and dual < tol:
+                break
+
+            # Balance the residuals
+            if primal > 10*dual:
+                rho = rho*2
+            elif dual > 10*primal:
+                rho = rho/2
+        # End ADMM loop
+
+        # Simulate all blocks with the consensus parameters
+        all_blocks = [(age, temp) for age in self.model.age_set for temp in self.model.T_set]
+        results = self._decomposed_solve_blocks(all_blocks, workers, z, None, rho, scale, console_out, options)
+        self._set_shared_parameters(params, z)
+        self._log_parameters_to_kinetics()
+
+        status = SolverStatus.ok
+        condition = TerminationCondition.optimal
+        for result in results:
+            if result["status"] != SolverStatus.ok:
+                status = result["status"]
+                condition = result["condition"]
+                print("WARNING: Solver did not exit normally for block (" + str(result["age"]) + ", " + str(result["temp"]) + ")")
+                print("\tResults are loaded, but need to be checked")
+
+        self.solve_time = (TIME.time() - self.solve_time)
+        print("\nModel Statistics")
+        print("-----------------")
+        print("\tBuild Time (s)      = " + str(self.build_time))
+        print("\tInitialize Time (s) = " + str(self.initialize_time))
+        print("\tSolve Time (s)      = " + str(self.solve_time))
+        print("\tADMM Iterations     = " + str(len(self.decomposed_history)))
+        print()
+        return (status, condition)
+
+    # Helper function to set the shared kinetic parameters to the given values
+    def _set_shared_parameters(self, params, values):
+        for var, val in zip(params, values):
+            var.set_value(float(val))
+
+
+    # Function to extract the results of the model into numpy arrays
+    #       Values of each variable are pulled in one pass into an array
+    #       (instead of one 'value' call and file write per point)
+    #
+    #       After the model is initialized (or solved), all results are pulled
+    #       once into a cache and every call only slices the cached arrays. The
+    #       cache is cleared when the model is initialized, solved, or loaded
+    #       again, and when ICs, BCs, or temperatures are set. Use
+    #       'clear_result_cache' if the vars are changed by hand.
+    #
+    #       spec_list = (optional) list of species to extract (default is all)
+    #       age_list = (optional) list of ages to extract (default is all)
+    #       temp_list = (optional) list of temperatures to extract (default is all)
+    #       loc_list = (optional) list of locations (nodes) to extract (default is all)
+    #
+    #       Returns a dictionary of...
+    #           "z", "t" = arrays of the locations and times
+    #           "age", "temp", "gas", "surf", "site" = lists of names for each axis
+    #           "Cb", "C" = arrays for the gases indexed by [gas, age, temp, z, t]
+    #           "q" = array for the surface species indexed by [surf, age, temp, z, t]
+    #           "S" = array for the sites indexed by [site, age, temp, z, t]
+    #           "T" = array for the temperatures indexed by [age, temp, z, t]
+    def get_result_arrays(self, spec_list=None, age_list=None, temp_list=None, loc_list=None):
+        if self.isDiscrete == False:
+            raise Exception("Error! Cannot extract results before the model is discretized")
+        ages = list(self.model.age_set)
+        temps = list(self.model.T_set)
+        if spec_list == None:
+            spec_list = list(self.model.all_species_set)
+        if age_list == None:
+            age_list = ages
+        if temp_list == None:
+            temp_list = temps
+        if loc_list == None:
+            loc_list = list(self.model.z)
+        if type(spec_list) is not list or type(age_list) is not list or type(temp_list) is not list \
+            or type(loc_list) is not list:
+            raise Exception("Error! Need to provide species, ages, temperatures, and locations as lists")
+        for spec in spec_list:
+            if spec not in self.model.all_species_set:
+                print("Error! Invalid species given!")
+                raise Exception("\t"+str(spec)+ " is not a species in the model")
+        for age in age_list:
+            if age not in self.model.age_set:
+                raise Exception("Error! "+str(age)+ " is not an age in the model")
+        for temp in temp_list:
+            if temp not in self.model.T_set:
+                raise Exception("Error! "+str(temp)+ " is not a temperature in the model")
+        for loc in loc_list:
+            if loc not in self.model.z:
+                raise Exception("Error! "+str(loc)+ " is not a node in the model")
+
+        if self.isInitialized == True:
+            if self.result_cache == None:
+                self.result_cache = self._pull_result_arrays(list(self.model.all_species_set), ages, temps,
+                                                                list(self.model.z))
+            return self._slice_result_arrays(self.result_cache, spec_list, age_list, temp_list, loc_list)
+        return self._pull_result_arrays(spec_list, age_list, temp_list, loc_list)
+
+    # Function to clear the cache of results
+    #       Only needed if the vars of the model are changed directly after
+    #       a solve (i.e., not through the simulator functions). Anything
+    #       else that writes results into the model must call this.
+    def clear_result_cache(self):
+        self.result_cache = None
+        self.data_cache = None
+
+    # Helper function to pull the results of the model into arrays (see 'get_result_arrays')
+    def _pull_result_arrays(self, spec_list, age_list, temp_list, loc_list):
+        results = {"z": np.array(loc_list), "t": np.array(list(self.model.t)),
+                    "age": list(age_list), "temp": list(temp_list)}
+
+        groups = [("gas", self.model.gas_set, ["Cb", "C"])]
+        if self.isSurfSpecSet == True:
+            groups.append(("surf", self.model.surf_set, ["q"]))
+            if self.isSitesSet == True:
+                groups.append(("site", self.model.site_set, ["S"]))
+        for (group, spec_set, names) in groups:
+            results[group] = [spec for spec in spec_list if spec in spec_set]
+            for name in names:
+                results[name] = self._var_to_array(self.model.component(name), results[group],
+                                                    age_list, temp_list, loc_list)
+        for name in self._result_temperature_names():
+            results[name] = self._var_to_array(self.model.component(name), None, age_list, temp_list, loc_list)
+        return results
+
+    # Helper function to slice a subset of the results out of the cached arrays
+    #       Arrays are copied, so the cache cannot be changed by the caller
+    def _slice_result_arrays(self, cache, spec_list, age_list, temp_list, loc_list):
+        z_list = list(self.model.z)
+        index = [[cache["age"].index(age) for age in age_list], [cache["temp"].index(temp) for temp in temp_list],
+                    [z_list.index(loc) for loc in loc_list], list(range(len(cache["t"])))]
+        results = {"z": np.array(loc_list), "t": np.array(cache["t"]),
+                    "age": list(age_list), "temp": list(temp_list)}
+        for (group, names) in [("gas", ["Cb", "C"]), ("surf", ["q"]), ("site", ["S"])]:
+            if group in cache:
+                results[group] = [spec for spec in spec_list if spec in cache[group]]
+                spec_idx = [cache[group].index(spec) for spec in results[group]]
+                for name in names:
+                    results[name] = cache[name][np.ix_(spec_idx, *index)]
+        for name in self._result_temperature_names():
+            results[name] = cache[name][np.ix_(*index)]
+        return results
+
+    # Helper function to give the arrays of the data for plotting
+    #       Data only change when set by the user, so they are pulled once
+    #
+    #       Returns a dictionary of "Cb_data" and/or "q_data" arrays indexed
+    #       by [spec, age, temp, z_data, t_data] and the lists of names for each axis
+    def _data_arrays(self):
+        if self.data_cache != None:
+            return self.data_cache
+        self.data_cache = {"age": list(self.model.data_age_set), "temp": list(self.model.data_T_set),
+                            "z": list(self.model.z_data), "t": np.array(list(self.model.t_data))}
+        for (isSet, group, name) in [(self.isDataGasSpecSet, "gas", "Cb_data"),
+                                        (self.isDataSurfSpecSet, "surf", "q_data")]:
+            if isSet == True:
+                param = self.model.component(name)
+                self.data_cache[group] = list(list(param.index_set().subsets())[0])
+                shape = [len(index_set) for index_set in param.index_set().subsets()]
+                self.data_cache[name] = np.array([paramdata.value for paramdata in
+                                            param.values(sort=SortComponents.ORDERED_INDICES)], dtype=float).reshape(shape)
+        return self.data_cache
+
+    # Helper function to list the names of the temperature variables in the results
+    def _result_temperature_names(self):
+        return ["T"]
+
+    # Helper function to pull the values of a variable into a numpy array
+    #       If all (age, temp) blocks and nodes are asked for, all values are
+    #       pulled in the order of the index sets, so the array only needs to be
+    #       reshaped to the sizes of those sets. Otherwise, only the values of
+    #       the given blocks and nodes are looked up.
+    #
+    #       spec_list = list of species for the first index (None for temperatures)
+    #
+    #       Returns an array indexed by [spec, age, temp, z, t] (or [age, temp, z, t])
+    def _var_to_array(self, var, spec_list, age_list, temp_list, loc_list):
+        if len(age_list) == len(self.model.age_set) and len(temp_list) == len(self.model.T_set) \
+            and len(loc_list) == len(self.model.z):
+            sets = [list(index_set) for index_set in var.index_set().subsets()]
+            values = np.array([vardata.value for vardata in var.values(sort=SortComponents.ORDERED_INDICES)],
+                                dtype=float).reshape([len(index_set) for index_set in sets])
+            index = [[sets[-4].index(age) for age in age_list], [sets[-3].index(temp) for temp in temp_list],
+                        [sets[-2].index(loc) for loc in loc_list], list(range(len(sets[-1])))]
+            if spec_list != None:
+                index = [[sets[0].index(spec) for spec in spec_list]] + index
+            return values[np.ix_(*index)]
+
+        prefixes = [()]
+        shape = [len(age_list), len(temp_list), len(loc_list), len(self.model.t)]
+        if spec_list != None:
+            prefixes = [(spec,) for spec in spec_list]
+            shape = [len(spec_list)] + shape
+        t_list = list(self.model.t)
+        values = np.array([var[prefix + (age, temp, z, t)].value for prefix in prefixes for age in age_list
+                            for temp in temp_list for z in loc_list for t in t_list], dtype=float)
+        return values.reshape(shape)
+
+    # Function to export the results of the model to a file
+    #       file_name = (optional) name of the file (without extension)
+    #       file_type = type of file to save as
+    #                   ".npz" = compressed numpy file with all arrays of 'get_result_arrays'
+    #                   ".csv" = columnar file with one row per (age, temp, z, t) and
+    #                           one column per variable (e.g., NH3_b, NH3_w, q1, S1, T)
+    #       spec_list, age_list, temp_list, loc_list = (optional) filters (see 'get_result_arrays')
+    def export_results(self, file_name="", file_type=".npz", spec_list=None, age_list=None, temp_list=None,
+                        loc_list=None):
+        if file_type != ".npz" and file_type != ".csv":
+            raise Exception("Error! Unsupported file type for export. "
+                            +str(file_type)+ " given is not '.npz' or '.csv'")
+        results = self.get_result_arrays(spec_list, age_list, temp_list, loc_list)
+        if file_name == "":
+            file_name = "all_results"
+
+        folder="output/"
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        if file_type == ".npz":
+            arrays = {}
+            for key in results:
+                if type(results[key]) is list:
+                    arrays[key] = np.array([str(item) for item in results[key]])
+                else:
+                    arrays[key] = results[key]
+            np.savez_compressed(folder+file_name+file_type, **arrays)
+            return
+
+        # Columns of the csv file as (name, array indexed by [age, temp, z, t])
+        columns = []
+        for i, spec in enumerate(results["gas"]):
+            columns.append((str(spec)+"_b", results["Cb"][i]))
+            columns.append((str(spec)+"_w", results["C"][i]))
+        for (group, name) in [("surf", "q"), ("site", "S")]:
+            if group in results:
+                for i, spec in enumerate(results[group]):
+                    columns.append((str(spec), results[name][i]))
+        for name in self._result_temperature_names():
+            columns.append((name, results[name]))
+
+        (z, t) = np.meshgrid(results["z"], results["t"], indexing="ij")
+        file = open(folder+file_name+file_type,"w")
+        file.write(",".join(["age", "temp", "z", "t"] + [name for (name, array) in columns]) + "\n")
+        for i, age in enumerate(results["age"]):
+            for j, temp in enumerate(results["temp"]):
+                table = np.column_stack([z.ravel(), t.ravel()] + [array[i,j].ravel() for (name, array) in columns])
+                prefix = str(age) + "," + str(temp) + ","
+                file.write("".join([prefix + ",".join(map(str, row)) + "\n" for row in table.tolist()]))
+        file.close()
+
+    # Helper function to give the array (z, t) of results for a species of a (age, temp) block
+    #       Gases give the bulk and washcoat arrays as a tuple
+    #
+    #       i, j = index of the age and temp in the results
+    def _species_result_arrays(self, results, spec, i=0, j=0):
+        if spec in self.model.gas_set:
+            k = results["gas"].index(spec)
+            return (results["Cb"][k,i,j], results["C"][k,i,j])
+        elif spec in self.model.surf_set:
+            return (results["q"][results["surf"].index(spec),i,j],)
+        else:
+            return (results["S"][results["site"].index(spec),i,j],)
 
     # Function to print out results of variables at all locations and times
     def print_results_all_locations(self, spec_list, age, temp, file_name="", include_temp=False):
@@ -3242,66 +5348,39 @@ class Isothermal_Monolith_Simulator(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
 
-        file = open(folder+file_name,"w")
+        results = self.get_result_arrays(spec_list, [age], [temp])
+        times = list(self.model.t)
+        locs = list(self.model.z)
 
         # Embeddd helper function
-        def _print_all_results(model, var, spec, age, temp, file, isTemp=False):
-            tstart = model.t.first()
-            tend = model.t.last()
-
+        def _print_all_results(var, values, file):
             #Print header first
             file.write('\t'+'Times (across)'+'\n')
-            for time in model.t:
-            	if time == tend:
-            		file.write(str(time)+'\n')
-            	elif time == tstart:
-            		file.write('time ->\t'+str(time)+'\t')
-            	else:
-            		file.write(str(time)+'\t')
-
-            for time in model.t:
-            	if time == tend:
-            		file.write(str(var)+'[@t='+str(time)+']\n')
-            	elif time == tstart:
-            		file.write('Z (down)\t'+str(var)+'[@t='+str(time)+']\t')
-            	else:
-            		file.write(str(var)+'[@t='+str(time)+']\t')
+            file.write('time ->\t' + '\t'.join(map(str, times)) + '\n')
+            file.write('Z (down)\t' + '\t'.join([str(var)+'[@t='+str(time)+']' for time in times]) + '\n')
 
             #Print x results
-            for loc in model.z:
-                for time in model.t:
-                    if time == tstart:
-                        if isTemp == False:
-                            file.write(str(loc)+'\t'+str(value(var[spec,age,temp,loc,time]))+'\t')
-                        else:
-                            file.write(str(loc)+'\t'+str(value(var[age,temp,loc,time]))+'\t')
-                    elif time == tend:
-                        if isTemp == False:
-                            file.write(str(value(var[spec,age,temp,loc,time]))+'\n')
-                        else:
-                            file.write(str(value(var[age,temp,loc,time]))+'\n')
-                    else:
-                        if isTemp == False:
-                            file.write(str(value(var[spec,age,temp,loc,time]))+'\t')
-                        else:
-                            file.write(str(value(var[age,temp,loc,time]))+'\t')
+            for loc, row in zip(locs, values.tolist()):
+                file.write(str(loc) + '\t' + '\t'.join(map(str, row)) + '\n')
             file.write('\n')
 
+        file = open(folder+file_name,"w")
         for spec in spec_list:
+            arrays = self._species_result_arrays(results, spec)
             if spec in self.model.gas_set:
                 file.write('Results for bulk '+str(spec)+'_b in table below'+'\n')
-                _print_all_results(self.model, self.model.Cb, spec, age, temp, file)
+                _print_all_results(self.model.Cb, arrays[0], file)
                 file.write('Results for washcoat '+str(spec)+'_w in table below'+'\n')
-                _print_all_results(self.model, self.model.C, spec, age, temp, file)
+                _print_all_results(self.model.C, arrays[1], file)
             elif spec in self.model.surf_set:
                 file.write('Results for surface '+str(spec)+' in table below'+'\n')
-                _print_all_results(self.model, self.model.q, spec, age, temp, file)
+                _print_all_results(self.model.q, arrays[0], file)
             else:
                 file.write('Results for site '+str(spec)+' in table below'+'\n')
-                _print_all_results(self.model, self.model.S, spec, age, temp, file)
+                _print_all_results(self.model.S, arrays[0], file)
         if include_temp == True:
             file.write('Results for temperature in the table below'+'\n')
-            _print_all_results(self.model, self.model.T, None, age, temp, file, include_temp)
+            _print_all_results(self.model.T, results["T"][0,0], file)
 
         file.write('\n')
         file.close()
@@ -3325,32 +5404,33 @@ class Isothermal_Monolith_Simulator(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
 
-        file = open(folder+file_name,"w")
-
-        file.write('Results for z='+str(loc)+' at in table below'+'\n')
-        file.write('Time\t')
+        results = self.get_result_arrays(spec_list, [age], [temp], [loc])
+        columns = []
+        header = 'Time\t'
         for spec in spec_list:
+            for array in self._species_result_arrays(results, spec):
+                columns.append(array[0])
             if spec in self.model.gas_set:
-                file.write(str(spec)+'_b\t'+str(spec)+'_w\t')
-            elif spec in self.model.surf_set:
-                file.write(str(spec)+'\t')
+                header += str(spec)+'_b\t'+str(spec)+'_w\t'
             else:
-                file.write(str(spec)+'\t')
+                header += str(spec)+'\t'
         if include_temp == True:
-            file.write("T[K]"+'\t')
-        file.write('\n')
-        for time in self.model.t:
-            file.write(str(time) + '\t')
-            for spec in spec_list:
-                if spec in self.model.gas_set:
-                    file.write(str(value(self.model.Cb[spec,age,temp,loc,time])) + '\t' + str(value(self.model.C[spec,age,temp,loc,time])) + '\t')
-                elif spec in self.model.surf_set:
-                    file.write(str(value(self.model.q[spec,age,temp,loc,time])) + '\t')
-                else:
-                    file.write(str(value(self.model.S[spec,age,temp,loc,time])) + '\t')
-            if include_temp == True:
-                file.write(str(value(self.model.T[age,temp,loc,time])) + '\t')
-            file.write('\n')
+            columns.append(results["T"][0,0,0])
+            header += "T[K]"+'\t'
+        self._print_time_table(folder+file_name, 'Results for z='+str(loc)+' at in table below', header,
+                                list(self.model.t), columns)
+
+    # Helper function to print a table of columns for all times
+    def _print_time_table(self, file_name, title, header, times, columns):
+        file = open(file_name,"w")
+        file.write(title+'\n')
+        file.write(header+'\n')
+        if len(columns) == 0:
+            rows = [[] for time in times]
+        else:
+            rows = np.column_stack(columns).tolist()
+        for time, row in zip(times, rows):
+            file.write(str(time) + '\t' + ''.join([str(val) + '\t' for val in row]) + '\n')
         file.write('\n')
         file.close()
 
@@ -3378,74 +5458,21 @@ class Isothermal_Monolith_Simulator(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
 
-        file = open(folder+file_name,"w")
-
-        file.write('Integral average results in table below'+'\n')
-        file.write('Time\t')
+        # Trapezoid rule over the nodes (for all times at once)
+        results = self.get_result_arrays(spec_list, [age], [temp])
+        dz = np.diff(results["z"])[:,None]
+        length = self.model.z.last()-self.model.z.first()
+        columns = []
+        header = 'Time\t'
         for spec in spec_list:
+            for array in self._species_result_arrays(results, spec):
+                columns.append(np.sum(dz*0.5*(array[1:] + array[:-1]), axis=0)/length)
             if spec in self.model.gas_set:
-                file.write(str(spec)+'_b\t'+str(spec)+'_w\t')
-            elif spec in self.model.surf_set:
-                file.write(str(spec)+'\t')
+                header += str(spec)+'_b\t'+str(spec)+'_w\t'
             else:
-                file.write(str(spec)+'\t')
-        file.write('\n')
-        for time in self.model.t:
-            file.write(str(time) + '\t')
-            for spec in spec_list:
-                if spec in self.model.gas_set:
-                    #bulk variable
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.Cb[spec,age,temp,loc,time])+value(self.model.Cb[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-
-                    # Washcoat variable
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.C[spec,age,temp,loc,time])+value(self.model.C[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-                elif spec in self.model.surf_set:
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.q[spec,age,temp,loc,time])+value(self.model.q[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-                else:
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.S[spec,age,temp,loc,time])+value(self.model.S[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-            file.write('\n')
-        file.write('\n')
-        file.close()
+                header += str(spec)+'\t'
+        self._print_time_table(folder+file_name, 'Integral average results in table below', header,
+                                list(self.model.t), columns)
 
     # Define a function to print optimal parameter information to a file
     def print_kinetic_parameter_info(self, file_name=""):
@@ -3513,13 +5540,105 @@ class Isothermal_Monolith_Simulator(object):
                 file.write("\t  dS (J/K/mol) =\t" + str(self.model.dS[rxn].value))
             else:
                 pass
+            if self.isLogParameterized == True:
+                file.write('\n')
+                file.write("\t  (fit as ln(k) at Tref and E/R/Tref, Tref (K) = " + str(value(self.model.T_kin_ref)) + ")")
             file.write('\n')
             file.write('\n')
 
         file.close()
 
 
+    # Helper function to grab the values of an indexed component as an array
+    #       Values are ordered by the index set of the component. Components
+    #       indexed by time (last index) are stored as (time x other indices)
+    #       so that a single time slice can be read back from the file.
+    def _state_array(self, component):
+        values = np.array([component[key].value for key in component.index_set()], dtype=float)
+        if list(component.index_set().subsets())[-1] is self.model.t and component.dim() > 1:
+            values = np.ascontiguousarray(values.reshape(-1, len(self.model.t)).T)
+        return values
+
+    # Helper function to save an indexed component to the model state
+    #       If 'arrays' is None, then values are saved into the json
+    #       dictionary (keyed by the string of the index). Otherwise, the
+    #       values are saved as an array for the binary (.npz) format.
+    def _save_indexed(self, obj, arrays, name):
+        if arrays == None:
+            obj['model'][name] = {str(k):v for k, v in self.model.component(name).extract_values().items()}
+        else:
+            arrays[name] = self._state_array(self.model.component(name))
+            obj['model'][name] = "array"
+
+    # Helper function to read a model state file (json or .npz)
+    #       For the binary format, the json header is returned with the
+    #       arrays left in the file to be read when needed
+    def _read_model_state(self, file_name):
+        if file_name.endswith(".npz"):
+            arrays = np.load(file_name, allow_pickle=False)
+            obj = json.loads(str(arrays["header"]))
+            obj['_file'] = file_name
+            obj['_arrays'] = arrays
+        else:
+            obj = json.load(open(file_name))
+        return obj
+
+    # Helper function to close a model state file
+    def _close_model_state(self, obj):
+        if '_arrays' in obj:
+            obj['_arrays'].close()
+
+    # Helper function to read a single time slice of an array in a .npz file
+    #       Arrays in .npz files are stored uncompressed, thus only the
+    #       bytes of the requested row are read from the file.
+    def _read_state_time_slice(self, file_name, name, row):
+        with zipfile.ZipFile(file_name) as zip_file:
+            info = zip_file.getinfo(name + ".npy")
+        with open(file_name, "rb") as file:
+            file.seek(info.header_offset)
+            local_header = file.read(30)
+            file.seek(info.header_offset + 30 + int.from_bytes(local_header[26:28], "little")
+                            + int.from_bytes(local_header[28:30], "little"))
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                (shape, fortran_order, dtype) = np.lib.format.read_array_header_1_0(file)
+            else:
+                (shape, fortran_order, dtype) = np.lib.format.read_array_header_2_0(file)
+            file.seek(row*shape[1]*dtype.itemsize, 1)
+            return np.frombuffer(file.read(shape[1]*dtype.itemsize), dtype=dtype)
+
+    # Helper function to iterate over the saved values of an indexed component
+    #       Yields (index, value) pairs from either file format. If 'time' is
+    #       given, then only the values at that time are given.
+    def _state_items(self, obj, name, time=None):
+        component = self.model.component(name)
+        if type(obj['model'][name]) is dict:
+            for key in obj['model'][name]:
+                index = key
+                if component.dim() > 1:
+                    index = literal_eval(key)
+                if time == None or index[-1] == time:
+                    yield (index, obj['model'][name][key])
+        elif time == None:
+            values = obj['_arrays'][name]
+            if values.ndim > 1:
+                values = values.T.ravel()
+            for index, val in zip(component.index_set(), values):
+                if np.isnan(val) == False:
+                    yield (index, val)
+        else:
+            values = self._read_state_time_slice(obj['_file'], name, obj['state_times'].index(time))
+            others = list(component.index_set().subsets())[:-1]
+            i = 0
+            for index in itertools.product(*others):
+                if np.isnan(values[i]) == False:
+                    yield (index + (time,), values[i])
+                i+=1
+
     # Define function to unload/save a model state
+    #       If 'file_name' ends with '.npz', then the model state is saved
+    #       in a binary format with one array per indexed component and a
+    #       small json header. Otherwise, the full state is saved as json.
     def save_model_state(self, file_name=""):
         if file_name == "":
             file_name+="saved_iso_cat_model_"
@@ -3533,7 +5652,9 @@ class Isothermal_Monolith_Simulator(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
 
-        file = open(folder+file_name,"w")
+        arrays = None
+        if file_name.endswith(".npz"):
+            arrays = {}
 
         # Now, create a dictionary in json based on current model state
         obj = {}
@@ -3688,50 +5809,50 @@ class Isothermal_Monolith_Simulator(object):
                             obj['model']['data_surface_set'].append(item)
 
                     #NOTE: tuple keys must be saved as strings
-                    obj['model']['T'] = {str(k):v for k, v in self.model.T.extract_values().items()}
-                    obj['model']['space_velocity'] = {str(k):v for k, v in self.model.space_velocity.extract_values().items()}
-                    obj['model']['v'] = {str(k):v for k, v in self.model.v.extract_values().items()}
-                    obj['model']['P'] = {str(k):v for k, v in self.model.P.extract_values().items()}
-                    obj['model']['Tref'] = {str(k):v for k, v in self.model.Tref.extract_values().items()}
-                    obj['model']['Pref'] = {str(k):v for k, v in self.model.Pref.extract_values().items()}
-                    obj['model']['rho'] = {str(k):v for k, v in self.model.rho.extract_values().items()}
-                    obj['model']['mu'] = {str(k):v for k, v in self.model.mu.extract_values().items()}
-                    obj['model']['Re'] = {str(k):v for k, v in self.model.Re.extract_values().items()}
-                    obj['model']['Cb'] = {str(k):v for k, v in self.model.Cb.extract_values().items()}
-                    obj['model']['C'] = {str(k):v for k, v in self.model.C.extract_values().items()}
-                    obj['model']['dCb_dz'] = {str(k):v for k, v in self.model.dCb_dz.extract_values().items()}
-                    obj['model']['dCb_dt'] = {str(k):v for k, v in self.model.dCb_dt.extract_values().items()}
-                    obj['model']['dC_dt'] = {str(k):v for k, v in self.model.dC_dt.extract_values().items()}
-                    obj['model']['km'] = {str(k):v for k, v in self.model.km.extract_values().items()}
-                    obj['model']['Dm'] = {str(k):v for k, v in self.model.Dm.extract_values().items()}
-                    obj['model']['Sc'] = {str(k):v for k, v in self.model.Sc.extract_values().items()}
-                    obj['model']['Sh'] = {str(k):v for k, v in self.model.Sh.extract_values().items()}
-                    obj['model']['u_C'] = {str(k):v for k, v in self.model.u_C.extract_values().items()}
+                    self._save_indexed(obj, arrays, 'T')
+                    self._save_indexed(obj, arrays, 'space_velocity')
+                    self._save_indexed(obj, arrays, 'v')
+                    self._save_indexed(obj, arrays, 'P')
+                    self._save_indexed(obj, arrays, 'Tref')
+                    self._save_indexed(obj, arrays, 'Pref')
+                    self._save_indexed(obj, arrays, 'rho')
+                    self._save_indexed(obj, arrays, 'mu')
+                    self._save_indexed(obj, arrays, 'Re')
+                    self._save_indexed(obj, arrays, 'Cb')
+                    self._save_indexed(obj, arrays, 'C')
+                    self._save_indexed(obj, arrays, 'dCb_dz')
+                    self._save_indexed(obj, arrays, 'dCb_dt')
+                    self._save_indexed(obj, arrays, 'dC_dt')
+                    self._save_indexed(obj, arrays, 'km')
+                    self._save_indexed(obj, arrays, 'Dm')
+                    self._save_indexed(obj, arrays, 'Sc')
+                    self._save_indexed(obj, arrays, 'Sh')
+                    self._save_indexed(obj, arrays, 'u_C')
 
                     if self.isDataGasSpecSet == True:
-                        obj['model']['Cb_data'] = {str(k):v for k, v in self.model.Cb_data.extract_values().items()}
-                        obj['model']['Cb_data_full'] = {str(k):v for k, v in self.model.Cb_data_full.extract_values().items()}
-                        obj['model']['w'] = {str(k):v for k, v in self.model.w.extract_values().items()}
+                        self._save_indexed(obj, arrays, 'Cb_data')
+                        self._save_indexed(obj, arrays, 'Cb_data_full')
+                        self._save_indexed(obj, arrays, 'w')
 
                     if self.isDataSurfSpecSet == True:
-                        obj['model']['q_data'] = {str(k):v for k, v in self.model.q_data.extract_values().items()}
-                        obj['model']['q_data_full'] = {str(k):v for k, v in self.model.q_data_full.extract_values().items()}
-                        obj['model']['wq'] = {str(k):v for k, v in self.model.wq.extract_values().items()}
+                        self._save_indexed(obj, arrays, 'q_data')
+                        self._save_indexed(obj, arrays, 'q_data_full')
+                        self._save_indexed(obj, arrays, 'wq')
 
                     if self.isSurfSpecSet == True:
                         obj['model']['surf_set'] = []
                         for item in self.model.surf_set:
                             obj['model']['surf_set'].append(item)
-                        obj['model']['q'] = {str(k):v for k, v in self.model.q.extract_values().items()}
-                        obj['model']['dq_dt'] = {str(k):v for k, v in self.model.dq_dt.extract_values().items()}
-                        obj['model']['u_q'] = {str(k):v for k, v in self.model.u_q.extract_values().items()}
+                        self._save_indexed(obj, arrays, 'q')
+                        self._save_indexed(obj, arrays, 'dq_dt')
+                        self._save_indexed(obj, arrays, 'u_q')
                         if self.isSitesSet == True:
                             obj['model']['site_set'] = []
                             for item in self.model.site_set:
                                 obj['model']['site_set'].append(item)
-                            obj['model']['S'] = {str(k):v for k, v in self.model.S.extract_values().items()}
-                            obj['model']['Smax'] = {str(k):v for k, v in self.model.Smax.extract_values().items()}
-                            obj['model']['u_S'] = {str(k):v for k, v in self.model.u_S.extract_values().items()}
+                            self._save_indexed(obj, arrays, 'S')
+                            self._save_indexed(obj, arrays, 'Smax')
+                            self._save_indexed(obj, arrays, 'u_S')
 
                     obj['model']['all_rxns'] = []
                     for item in self.model.all_rxns:
@@ -3790,17 +5911,25 @@ class Isothermal_Monolith_Simulator(object):
                     for item in self.model.all_species_set:
                         obj['model']['all_species_set'].append(item)
 
-                    obj['model']['rxn_orders'] = {str(k):v for k, v in self.model.rxn_orders.extract_values().items()}
+                    self._save_indexed(obj, arrays, 'rxn_orders')
 
-        json.dump(obj,file)
-        file.close()
+        if arrays == None:
+            file = open(folder+file_name,"w")
+            json.dump(obj,file)
+            file.close()
+        else:
+            obj['state_times'] = list(self.model.t)
+            file = open(folder+file_name,"wb")
+            np.savez(file, header=np.array(json.dumps(obj)), **arrays)
+            file.close()
 
     # Function to load full model from json file
     def load_model_full(self, file_name, reset_param_bounds=False):
+        self.clear_result_cache()
         self.load_time = TIME.time()
         print("----------- Attempting to load model from file ------------\n")
         # Attempt to load json file
-        obj = json.load(open(file_name))
+        obj = self._read_model_state(file_name)
 
         # Dig into the obj dictionary and setup the model
         self.set_bulk_porosity(obj['model']['eb'])
@@ -3885,41 +6014,24 @@ class Isothermal_Monolith_Simulator(object):
                 self.model.add_component(rxn+"_reactants", Set(initialize=obj['model'][rxn+"_reactants"]))
                 self.model.add_component(rxn+"_products", Set(initialize=obj['model'][rxn+"_products"]))
                 self.isRxnBuilt[rxn] = True
+            self._compile_reaction_network_from_state(obj)
         except:
             print(file_name+" does not contain reaction info for reactants and products")
 
         #Manually set data from file
         try:
-            for key in obj['model']['Cb_data_full']:
-                self.model.Cb_data_full[literal_eval(key)].set_value(obj['model']['Cb_data_full'][key])
+            for (index, val) in self._state_items(obj, 'Cb_data_full'):
+                self.model.Cb_data_full[index].set_value(val)
             #Use manually set data to call the sub-routine to automate selection of data sub-set
-            for spec in self.model.data_gas_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        for loc in self.model.z_data:
-                            times = []
-                            values = []
-                            for time in self.model.t_data_full:
-                                times.append(time)
-                                values.append(self.model.Cb_data_full[spec,age,temp,loc,time].value)
-                            self.set_data_values_for(spec,age,temp,loc,times,values)
+            self._reload_data_window("Cb_data_full")
         except:
             print(file_name+" does not contain proper gas data for optimization")
 
         try:
-            for key in obj['model']['q_data_full']:
-                self.model.q_data_full[literal_eval(key)].set_value(obj['model']['q_data_full'][key])
+            for (index, val) in self._state_items(obj, 'q_data_full'):
+                self.model.q_data_full[index].set_value(val)
             #Use manually set data to call the sub-routine to automate selection of data sub-set
-            for spec in self.model.data_surface_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        for loc in self.model.z_data:
-                            times = []
-                            values = []
-                            for time in self.model.t_data_full:
-                                times.append(time)
-                                values.append(self.model.q_data_full[spec,age,temp,loc,time].value)
-                            self.set_data_values_for(spec,age,temp,loc,times,values)
+            self._reload_data_window("q_data_full")
         except:
             print(file_name+" does not contain proper surface data for optimization")
 
@@ -3944,71 +6056,70 @@ class Isothermal_Monolith_Simulator(object):
         print("\n........... loading time-space info for all vars ..........")
 
         # Set functions to perform AFTER discretization
-        for key in obj['model']['T']:
-            self.model.T[literal_eval(key)].set_value(obj['model']['T'][key])
-        for key in obj['model']['space_velocity']:
-            self.model.space_velocity[literal_eval(key)].set_value(obj['model']['space_velocity'][key])
-        for key in obj['model']['v']:
-            self.model.v[literal_eval(key)].set_value(obj['model']['v'][key])
-        for key in obj['model']['P']:
-            self.model.P[literal_eval(key)].set_value(obj['model']['P'][key])
-        for key in obj['model']['Tref']:
-            self.model.Tref[literal_eval(key)].set_value(obj['model']['Tref'][key])
-        for key in obj['model']['Pref']:
-            self.model.Pref[literal_eval(key)].set_value(obj['model']['Pref'][key])
-        for key in obj['model']['rho']:
-            self.model.rho[literal_eval(key)].set_value(obj['model']['rho'][key])
-        for key in obj['model']['mu']:
-            self.model.mu[literal_eval(key)].set_value(obj['model']['mu'][key])
-        for key in obj['model']['Re']:
-            self.model.Re[literal_eval(key)].set_value(obj['model']['Re'][key])
-        for key in obj['model']['Cb']:
-            self.model.Cb[literal_eval(key)].set_value(obj['model']['Cb'][key])
-        for key in obj['model']['C']:
-            self.model.C[literal_eval(key)].set_value(obj['model']['C'][key])
-        for key in obj['model']['dCb_dz']:
-            self.model.dCb_dz[literal_eval(key)].set_value(obj['model']['dCb_dz'][key])
-        for key in obj['model']['dCb_dt']:
-            self.model.dCb_dt[literal_eval(key)].set_value(obj['model']['dCb_dt'][key])
-        for key in obj['model']['dC_dt']:
-            self.model.dC_dt[literal_eval(key)].set_value(obj['model']['dC_dt'][key])
-        for key in obj['model']['km']:
-            self.model.km[literal_eval(key)].set_value(obj['model']['km'][key])
-
-        #NOTE: There is only a single key for Dm, so we don't use 'literal_eval'
-        for key in obj['model']['Dm']:
-            self.model.Dm[key].set_value(obj['model']['Dm'][key])
-
-        for key in obj['model']['Sc']:
-            self.model.Sc[literal_eval(key)].set_value(obj['model']['Sc'][key])
-        for key in obj['model']['Sh']:
-            self.model.Sh[literal_eval(key)].set_value(obj['model']['Sh'][key])
+        for (index, val) in self._state_items(obj, 'T'):
+            self.model.T[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'space_velocity'):
+            self.model.space_velocity[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'v'):
+            self.model.v[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'P'):
+            self.model.P[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Tref'):
+            self.model.Tref[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Pref'):
+            self.model.Pref[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'rho'):
+            self.model.rho[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'mu'):
+            self.model.mu[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Re'):
+            self.model.Re[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Cb'):
+            self.model.Cb[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'C'):
+            self.model.C[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dCb_dz'):
+            self.model.dCb_dz[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dCb_dt'):
+            self.model.dCb_dt[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dC_dt'):
+            self.model.dC_dt[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'km'):
+            self.model.km[index].set_value(val)
+
+        for (index, val) in self._state_items(obj, 'Dm'):
+            self.model.Dm[index].set_value(val)
+
+        for (index, val) in self._state_items(obj, 'Sc'):
+            self.model.Sc[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Sh'):
+            self.model.Sh[index].set_value(val)
         if self.isDataGasSpecSet == True:
-            for key in obj['model']['w']:
-                self.model.w[literal_eval(key)].set_value(obj['model']['w'][key])
+            for (index, val) in self._state_items(obj, 'w'):
+                self.model.w[index].set_value(val)
         if self.isDataSurfSpecSet == True:
-            for key in obj['model']['wq']:
-                self.model.wq[literal_eval(key)].set_value(obj['model']['wq'][key])
+            for (index, val) in self._state_items(obj, 'wq'):
+                self.model.wq[index].set_value(val)
         if self.isSurfSpecSet == True:
-            for key in obj['model']['q']:
-                self.model.q[literal_eval(key)].set_value(obj['model']['q'][key])
-            for key in obj['model']['dq_dt']:
-                self.model.dq_dt[literal_eval(key)].set_value(obj['model']['dq_dt'][key])
-            for key in obj['model']['u_q']:
-                self.model.u_q[literal_eval(key)].set_value(obj['model']['u_q'][key])
+            for (index, val) in self._state_items(obj, 'q'):
+                self.model.q[index].set_value(val)
+            for (index, val) in self._state_items(obj, 'dq_dt'):
+                self.model.dq_dt[index].set_value(val)
+            for (index, val) in self._state_items(obj, 'u_q'):
+                self.model.u_q[index].set_value(val)
 
             if self.isSitesSet == True:
-                for key in obj['model']['S']:
-                    self.model.S[literal_eval(key)].set_value(obj['model']['S'][key])
-                for key in obj['model']['Smax']:
-                    self.model.Smax[literal_eval(key)].set_value(obj['model']['Smax'][key])
-                for key in obj['model']['u_S']:
-                    self.model.u_S[literal_eval(key)].set_value(obj['model']['u_S'][key])
-
-        for key in obj['model']['u_C']:
-            self.model.u_C[literal_eval(key)].set_value(obj['model']['u_C'][key])
-        for key in obj['model']['rxn_orders']:
-            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+                for (index, val) in self._state_items(obj, 'S'):
+                    self.model.S[index].set_value(val)
+                for (index, val) in self._state_items(obj, 'Smax'):
+                    self.model.Smax[index].set_value(val)
+                for (index, val) in self._state_items(obj, 'u_S'):
+                    self.model.u_S[index].set_value(val)
+
+        for (index, val) in self._state_items(obj, 'u_C'):
+            self.model.u_C[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'rxn_orders'):
+            self.model.rxn_orders[index].set_value(val)
 
         # Need special treatment for reaction values
         for key in obj['model']['A']:
@@ -4107,6 +6218,7 @@ class Isothermal_Monolith_Simulator(object):
         self.isInitialized = True
         self.isIsothermalTempSet = True
 
+        self._close_model_state(obj)
         self.load_time = (TIME.time() - self.load_time)
         print("============ Loading Completed in "+str(self.load_time)+" (s) ============\n")
 
@@ -4130,11 +6242,12 @@ class Isothermal_Monolith_Simulator(object):
     #           (if applicable). Simulation will otherwise assume new temperatures
     #           are the prior temperatures extended from the final state.
     def load_model_state_as_IC(self, file_name, new_time_window, tstep=None, state=None, reset_param_bounds=False):
+        self.clear_result_cache()
         print("----------- Attempting to load model from file ------------\n")
         self.load_time = TIME.time()
 
         # Attempt to load json file
-        obj = json.load(open(file_name))
+        obj = self._read_model_state(file_name)
 
         # Check the new time window
         if type(new_time_window) is list:
@@ -4246,41 +6359,24 @@ class Isothermal_Monolith_Simulator(object):
                 self.model.add_component(rxn+"_reactants", Set(initialize=obj['model'][rxn+"_reactants"]))
                 self.model.add_component(rxn+"_products", Set(initialize=obj['model'][rxn+"_products"]))
                 self.isRxnBuilt[rxn] = True
+            self._compile_reaction_network_from_state(obj)
         except:
             print(file_name+" does not contain reaction info for reactants and products")
 
         #Manually set data from file
         try:
-            for key in obj['model']['Cb_data_full']:
-                self.model.Cb_data_full[literal_eval(key)].set_value(obj['model']['Cb_data_full'][key])
+            for (index, val) in self._state_items(obj, 'Cb_data_full'):
+                self.model.Cb_data_full[index].set_value(val)
             #Use manually set data to call the sub-routine to automate selection of data sub-set
-            for spec in self.model.data_gas_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        for loc in self.model.z_data:
-                            times = []
-                            values = []
-                            for time in self.model.t_data_full:
-                                times.append(time)
-                                values.append(self.model.Cb_data_full[spec,age,temp,loc,time].value)
-                            self.set_data_values_for(spec,age,temp,loc,times,values)
+            self._reload_data_window("Cb_data_full")
         except:
             print(file_name+" does not contain proper data for optimization")
 
         try:
-            for key in obj['model']['q_data_full']:
-                self.model.q_data_full[literal_eval(key)].set_value(obj['model']['q_data_full'][key])
+            for (index, val) in self._state_items(obj, 'q_data_full'):
+                self.model.q_data_full[index].set_value(val)
             #Use manually set data to call the sub-routine to automate selection of data sub-set
-            for spec in self.model.data_surface_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        for loc in self.model.z_data:
-                            times = []
-                            values = []
-                            for time in self.model.t_data_full:
-                                times.append(time)
-                                values.append(self.model.q_data_full[spec,age,temp,loc,time].value)
-                            self.set_data_values_for(spec,age,temp,loc,times,values)
+            self._reload_data_window("q_data_full")
         except:
             print(file_name+" does not contain proper surface data for optimization")
 
@@ -4304,88 +6400,76 @@ class Isothermal_Monolith_Simulator(object):
         print("\n........... loading time-space info for all vars ..........")
 
         # Set functions to perform AFTER discretization
-        for key in obj['model']['T']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.T[literal_eval(key)].set_value(obj['model']['T'][key])
+        for (index, val) in self._state_items(obj, 'T', time=IC_time):
+            self.model.T[index].set_value(val)
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 for loc in self.model.z:
                     for time in self.model.t:
                         self.model.T[age,temp,loc,time].set_value(self.model.T[age,temp,loc,IC_time].value)
-        for key in obj['model']['P']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.P[literal_eval(key)].set_value(obj['model']['P'][key])
+        for (index, val) in self._state_items(obj, 'P', time=IC_time):
+            self.model.P[index].set_value(val)
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 for loc in self.model.z:
                     for time in self.model.t:
                         self.model.P[age,temp,loc,time].set_value(self.model.P[age,temp,loc,IC_time].value)
-        for key in obj['model']['Tref']:
-            self.model.Tref[literal_eval(key)].set_value(obj['model']['Tref'][key])
-        for key in obj['model']['Pref']:
-            self.model.Pref[literal_eval(key)].set_value(obj['model']['Pref'][key])
-        for key in obj['model']['space_velocity']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.space_velocity[literal_eval(key)].set_value(obj['model']['space_velocity'][key])
+        for (index, val) in self._state_items(obj, 'Tref'):
+            self.model.Tref[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'Pref'):
+            self.model.Pref[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'space_velocity', time=IC_time):
+            self.model.space_velocity[index].set_value(val)
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 self.set_space_velocity(age,temp,self.model.space_velocity[age,temp,IC_time].value,self.model.Pref[age,temp].value,self.model.Tref[age,temp].value)
-        for key in obj['model']['Dm']:
-            self.model.Dm[key].set_value(obj['model']['Dm'][key])
+        for (index, val) in self._state_items(obj, 'Dm'):
+            self.model.Dm[index].set_value(val)
         self.isVelocityRecalculated = False
 
         if self.isDataGasSpecSet == True:
-            for key in obj['model']['w']:
-                self.model.w[literal_eval(key)].set_value(obj['model']['w'][key])
+            for (index, val) in self._state_items(obj, 'w'):
+                self.model.w[index].set_value(val)
 
         if self.isDataSurfSpecSet == True:
-            for key in obj['model']['wq']:
-                self.model.wq[literal_eval(key)].set_value(obj['model']['wq'][key])
-
-        for key in obj['model']['Cb']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.Cb[literal_eval(key)].set_value(obj['model']['Cb'][key])
-        for key in obj['model']['C']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.C[literal_eval(key)].set_value(obj['model']['C'][key])
-        for key in obj['model']['dCb_dz']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.dCb_dz[literal_eval(key)].set_value(obj['model']['dCb_dz'][key])
-        for key in obj['model']['dCb_dt']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.dCb_dt[literal_eval(key)].set_value(obj['model']['dCb_dt'][key])
-        for key in obj['model']['dC_dt']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.dC_dt[literal_eval(key)].set_value(obj['model']['dC_dt'][key])
-
-        for key in obj['model']['u_C']:
-            self.model.u_C[literal_eval(key)].set_value(obj['model']['u_C'][key])
-        for key in obj['model']['rxn_orders']:
-            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+            for (index, val) in self._state_items(obj, 'wq'):
+                self.model.wq[index].set_value(val)
+
+        for (index, val) in self._state_items(obj, 'Cb', time=IC_time):
+            self.model.Cb[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'C', time=IC_time):
+            self.model.C[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dCb_dz', time=IC_time):
+            self.model.dCb_dz[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dCb_dt', time=IC_time):
+            self.model.dCb_dt[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'dC_dt', time=IC_time):
+            self.model.dC_dt[index].set_value(val)
+
+        for (index, val) in self._state_items(obj, 'u_C'):
+            self.model.u_C[index].set_value(val)
+        for (index, val) in self._state_items(obj, 'rxn_orders'):
+            self.model.rxn_orders[index].set_value(val)
 
         if self.isSurfSpecSet == True:
-            for key in obj['model']['q']:
-                if literal_eval(key)[-1] == IC_time:
-                    self.model.q[literal_eval(key)].set_value(obj['model']['q'][key])
-            for key in obj['model']['dq_dt']:
-                if literal_eval(key)[-1] == IC_time:
-                    self.model.dq_dt[literal_eval(key)].set_value(obj['model']['dq_dt'][key])
-            for key in obj['model']['u_q']:
-                self.model.u_q[literal_eval(key)].set_value(obj['model']['u_q'][key])
+            for (index, val) in self._state_items(obj, 'q', time=IC_time):
+                self.model.q[index].set_value(val)
+            for (index, val) in self._state_items(obj, 'dq_dt', time=IC_time):
+                self.model.dq_dt[index].set_value(val)
+            for (index, val) in self._state_items(obj, 'u_q'):
+                self.model.u_q[index].set_value(val)
 
             if self.isSitesSet == True:
-                for key in obj['model']['S']:
-                    if literal_eval(key)[-1] == IC_time:
-                        self.model.S[literal_eval(key)].set_value(obj['model']['S'][key])
-                for key in obj['model']['Smax']:
-                    if literal_eval(key)[-1] == IC_time:
-                        self.model.Smax[literal_eval(key)].set_value(obj['model']['Smax'][key])
+                for (index, val) in self._state_items(obj, 'S', time=IC_time):
+                    self.model.S[index].set_value(val)
+                for (index, val) in self._state_items(obj, 'Smax', time=IC_time):
+                    self.model.Smax[index].set_value(val)
                 for site in self.model.site_set:
                     for age in self.model.age_set:
                         for loc in self.model.z:
                             self.set_site_density(site, age, self.model.Smax[site,age,loc,IC_time].value)
-                for key in obj['model']['u_S']:
-                    self.model.u_S[literal_eval(key)].set_value(obj['model']['u_S'][key])
+                for (index, val) in self._state_items(obj, 'u_S'):
+                    self.model.u_S[index].set_value(val)
 
         # Need special treatment for reaction values
         for key in obj['model']['A']:
@@ -4475,6 +6559,7 @@ class Isothermal_Monolith_Simulator(object):
                 for temp in self.model.T_set:
                     self.isInitialSet[spec][age][temp] = True
 
+        self._close_model_state(obj)
         self.load_time = (TIME.time() - self.load_time)
         print("============ Loading Completed in "+str(self.load_time)+" (s) ============\n")
 
@@ -4542,6 +6627,7 @@ class Isothermal_Monolith_Simulator(object):
 
         full_file_name = folder+file_name+"Plots"+file_type
 
+        results = self.get_result_arrays(spec_list, age_list, temp_list, true_loc_list)
         xvals = list(self.model.t.data())
         fig,ax = plt.subplots(figsize=(10,5))
         leg=[]
@@ -4551,26 +6637,14 @@ class Isothermal_Monolith_Simulator(object):
         ylab1 = ""
         for spec in spec_list:
             ylab1 += spec+"\n"
-            for age in age_list:
-                for temp in temp_list:
-                    for loc in true_loc_list:
+            for i, age in enumerate(age_list):
+                for j, temp in enumerate(temp_list):
+                    for k, loc in enumerate(true_loc_list):
                         leg_name = spec+"_"+age+"_"+temp+"_at_"+str(loc)
                         leg.append(leg_name)
-                        if spec in self.model.gas_set:
-                            yvals = list(self.model.Cb[spec,age,temp,loc,:].value)
-                            ax.plot(xvals,yvals)
-                        else:
-                            if self.isSurfSpecSet == True:
-                                if spec in self.model.surf_set:
-                                    yvals = list(self.model.q[spec,age,temp,loc,:].value)
-                                else:
-                                    if self.isSitesSet == True:
-                                        if spec in self.model.site_set:
-                                            yvals = list(self.model.S[spec,age,temp,loc,:].value)
-                                        else:
-                                            raise Exception("Error! Invalid species name given. "
-                                                            +str(spec)+" given does not exist in model")
-                            ax.plot(xvals,yvals)
+                        # Bulk values for gases
+                        yvals = self._species_result_arrays(results, spec, i, j)[0][k]
+                        ax.plot(xvals,yvals)
 
         plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Time "+x_units)
@@ -4648,6 +6722,8 @@ class Isothermal_Monolith_Simulator(object):
 
         full_file_name = folder+file_name+"Plots"+file_type
 
+        results = self.get_result_arrays(spec_list, age_list, temp_list)
+        t_list = list(self.model.t)
         xvals = list(self.model.z.data())
         fig,ax = plt.subplots(figsize=(10,5))
         leg=[]
@@ -4657,26 +6733,14 @@ class Isothermal_Monolith_Simulator(object):
         ylab1 = ""
         for spec in spec_list:
             ylab1 += spec+"\n"
-            for age in age_list:
-                for temp in temp_list:
+            for i, age in enumerate(age_list):
+                for j, temp in enumerate(temp_list):
                     for time in true_time_list:
                         leg_name = spec+"_"+age+"_"+temp+"_at_"+str(time)
                         leg.append(leg_name)
-                        if spec in self.model.gas_set:
-                            yvals = list(self.model.Cb[spec,age,temp,:,time].value)
-                            ax.plot(xvals,yvals)
-                        else:
-                            if self.isSurfSpecSet == True:
-                                if spec in self.model.surf_set:
-                                    yvals = list(self.model.q[spec,age,temp,:,time].value)
-                                else:
-                                    if self.isSitesSet == True:
-                                        if spec in self.model.site_set:
-                                            yvals = list(self.model.S[spec,age,temp,:,time].value)
-                                        else:
-                                            raise Exception("Error! Invalide species name given. "
-                                                            +str(spec)+" given does not exist in model")
-                            ax.plot(xvals,yvals)
+                        # Bulk values for gases
+                        yvals = self._species_result_arrays(results, spec, i, j)[0][:,t_list.index(time)]
+                        ax.plot(xvals,yvals)
 
         plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Z "+x_units)
@@ -4774,19 +6838,19 @@ class Isothermal_Monolith_Simulator(object):
         xlab = "Time "+x_units
 
         leg.append(spec+"_Data")
+        data = self._data_arrays()
+        data_index = (data["age"].index(age), data["temp"].index(temp), data["z"].index(true_data_loc))
         if self.isDataGasSpecSet == True:
             if spec in self.model.data_gas_set:
-                yvals_data = list(self.model.Cb_data[spec,age,temp,true_data_loc,:].value)
+                yvals_data = data["Cb_data"][(data["gas"].index(spec),) + data_index]
         if self.isDataSurfSpecSet == True:
             if spec in self.model.data_surface_set:
-                yvals_data = list(self.model.q_data[spec,age,temp,true_data_loc,:].value)
+                yvals_data = data["q_data"][(data["surf"].index(spec),) + data_index]
         ax.plot(xvals_data,yvals_data,'or')
 
         leg.append(spec+"_Model")
-        if spec in self.model.gas_set:
-            yvals_model = list(self.model.Cb[spec,age,temp,true_loc,:].value)
-        else:
-            yvals_model = list(self.model.q[spec,age,temp,true_loc,:].value)
+        results = self.get_result_arrays([spec], [age], [temp], [true_loc])
+        yvals_model = self._species_result_arrays(results, spec)[0][0]
         ax.plot(xvals_model,yvals_model,'-k')
 
         plt.legend(leg, loc='best')
@@ -4802,6 +6866,9 @@ class Isothermal_Monolith_Simulator(object):
 
 
 
+# Default folder for the binary copies of data files (see 'naively_read_data_file')
+_data_cache_dir = os.path.join(tempfile.gettempdir(), "catalyst_data_cache")
+
 # Function to read in data values to be used in objective functions
 #   This is the naive read function, which just reads in all information
 #   given by the user. There is an optional 'factor' argument that can
@@ -4832,149 +6899,243 @@ class Isothermal_Monolith_Simulator(object):
 #   the time. Each subsequent column must have an associated species
 #   name from the declared set of data names. Below each column header
 #   should be the time stamped data.
-def naively_read_data_file(data_file, factor=1, dict_of_tuples=False):
-    Data = {}
-    DataTuples = {}
-    Values = {}
-    TimeValue = 0
-    i = 0
-    ordered_list = []
-    # Read in file and save to dictionary
-    reset = {}
-    for line in open(data_file, "r"):
-        # Read in header that contains species names
-        if i==0:
-            firstItem = True
-            for item in line.split():
-                Data[item] = []
-                Values[item] = 0
-                reset[item] = 1
-                ordered_list.append(item)
-                if dict_of_tuples == True:
-                    if firstItem == True and "time" not in item.lower():
-                        raise Exception("Error! Time must be first column if trying to read as tuples")
-                    if "time" not in item.lower():
-                        DataTuples[item] = []
-                firstItem = False
-        # Read in data for each species
-        else:
-            j=0
-            for value in line.split():
-                Values[ordered_list[j]] += float(value)
-                if dict_of_tuples == True and "time" in ordered_list[j].lower():
-                    TimeValue += float(value)
-                j+=1
-            #End column loop
-            wasCalc = False
-            for item in Data:
-
-                if reset[item] == factor:
-                    Values[item] = Values[item]/float(factor)
-                    if wasCalc == False:
-                        temp_time = TimeValue/float(factor)
-                        wasCalc = True
-                    reset[item] = 1
-                    if dict_of_tuples == False:
-                        Data[item].append(Values[item])
-                    else:
-                        if "time" not in item.lower():
-                            DataTuples[item].append( (temp_time, Values[item]) )
-                    Values[item] = 0
-                    TimeValue = 0
-                else:
-                    reset[item]+=1
-        i+=1
-    #End line loop
+#
+#   Every 'factor' rows of the file are averaged into a single row (any
+#   rows left over at the end of the file are dropped). For large files,
+#   use_mmap=True will save the parsed table to a binary '.npy' file. Later
+#   reads memory-map that binary file instead of parsing the text again (it
+#   is remade whenever the data file is newer). The binary files are saved
+#   in the folder 'cache_dir' (by default, a 'catalyst_data_cache' folder in
+#   the temporary directory), never beside the data file. If the binary file
+#   cannot be written, the data are still returned and the text is parsed
+#   again on the next read.
+#
+#   NOTE: The data are always returned as lists, thus the memory-mapped table
+#           is copied into memory. The binary copy only saves the time spent
+#           parsing the text, not memory.
+def naively_read_data_file(data_file, factor=1, dict_of_tuples=False, use_mmap=False, cache_dir=None):
+    if factor < 1 or int(factor) != factor:
+        raise Exception("Error! Averaging 'factor' must be a positive integer")
+    factor = int(factor)
+    with open(data_file, "r") as file:
+        names = file.readline().split()
+    if dict_of_tuples == True:
+        if len(names) == 0 or "time" not in names[0].lower():
+            raise Exception("Error! Time must be first column if trying to read as tuples")
+
+    # Read in the table of values (or its binary copy)
+    table = None
+    if cache_dir == None:
+        cache_dir = _data_cache_dir
+    # Files of the same name in different folders get different binary files
+    key = hashlib.sha1(os.path.abspath(data_file).encode()).hexdigest()[0:12]
+    binary_file = os.path.join(cache_dir, os.path.basename(data_file) + "-" + key + ".npy")
+    if use_mmap == True and path.exists(binary_file) == True:
+        if os.path.getmtime(binary_file) >= os.path.getmtime(data_file):
+            try:
+                table = np.load(binary_file, mmap_mode="r")
+            except:
+                table = None
+            if table is not None and (table.ndim != 2 or table.shape[1] != len(names)):
+                table = None
+    if table is None:
+        with warnings.catch_warnings():
+            # Empty files simply give empty lists
+            warnings.simplefilter("ignore")
+            table = np.loadtxt(data_file, skiprows=1, ndmin=2)
+        if table.size == 0:
+            table = np.zeros((0, len(names)))
+        if table.shape[1] != len(names):
+            raise Exception("Error! Number of columns of data in "+data_file+
+                            " does not match the number of names in the header")
+        if use_mmap == True:
+            try:
+                if path.exists(cache_dir) == False:
+                    os.makedirs(cache_dir)
+                np.save(binary_file, table)
+            except OSError:
+                print("Warning! Unable to write "+binary_file+". Data file will be parsed again on next read...")
+                print("\tUse 'cache_dir' to give a writable folder for the binary files")
+
+    # Average each block of 'factor' rows
+    if factor > 1:
+        rows = (table.shape[0]//factor)*factor
+        table = table[0:rows].reshape(-1, factor, len(names)).mean(axis=1)
+
     if dict_of_tuples == False:
-        return Data
+        return {name: table[:,j].tolist() for (j, name) in enumerate(names)}
     else:
-        return DataTuples
+        times = table[:,0].tolist()
+        return {name: list(zip(times, table[:,j].tolist()))
+                    for (j, name) in enumerate(names) if "time" not in name.lower()}
 
 # Helper function to intellegently select data points to simulate
 #       User must provide...
 #           TimeDataList = list of time values that correspond to lists in VarDataDict
+#                           (must be in increasing order)
 #           VarDataDict = dictionary of lists of values of variables that derivatives
 #                           will be calculated from
 #           start_time = (optional) the first time point to return (default=0)
 #           end_time = (optional) the last time point to return
 #           maxStep = (optional) maximum allowable step size when selecting points
-def time_point_selector(TimeDataList, VarDataDict, start_time=None, end_time=None, maxStep=None):
-    if type(TimeDataList) is not list:
+#           tolerance = (optional) maximum allowable error of a linear interpolation
+#                       between the selected points, relative to the largest magnitude
+#                       of each variable (e.g., 0.01 = 1% error)
+#
+#       By default, points are selected where the derivatives of any variable
+#       change quickly (and at least every maxStep). If a tolerance is given,
+#       then points are selected such that a piecewise linear interpolation
+#       through the selected data points reproduces every variable in
+#       VarDataDict to within the tolerance. The points are chosen greedily,
+#       so the tolerance is always met, but the number of points is not
+#       guaranteed to be the smallest possible. In that case, maxStep only
+#       applies if given by the user.
+def time_point_selector(TimeDataList, VarDataDict, start_time=None, end_time=None, maxStep=None, tolerance=None):
+    if type(TimeDataList) is not list and type(TimeDataList) is not np.ndarray:
         raise Exception("Error! Must provide a list of time points to select from")
     if type(VarDataDict) is not dict:
         raise Exception("Error! Must provide a dictionary of lists of variable values")
-    DerivativeVarDataDict = {}
+    specs = []
     for spec in VarDataDict:
         if len(TimeDataList) != len(VarDataDict[spec]):
             raise Exception("Error! Dimensional mis-match in data sets. Must have same number of time points as corresponding values")
         if "time" not in spec.lower():
-            DerivativeVarDataDict[spec] = [0.0] * len(TimeDataList)
-    if maxStep==None:
+            specs.append(spec)
+    times = np.asarray(TimeDataList, dtype=float)
+    if np.any(np.diff(times) <= 0) == True:
+        raise Exception("Error! Time points to select from must be in increasing order")
+    values = np.array([np.asarray(VarDataDict[spec], dtype=float) for spec in specs]).reshape(len(specs), len(times))
+    if tolerance != None and tolerance < 0:
+        raise Exception("Error! Tolerance for selecting time points must be non-negative")
+    if maxStep==None and tolerance==None:
         maxStep = TimeDataList[-1]/100.0
     if end_time==None:
         end_time = TimeDataList[-1]
     if start_time==None:
         start_time = 0
 
-    selected_times = []
-    selected_times.append(start_time)
-
-    # Approximate true derivatives
-    i=0
-    for time in TimeDataList:
-        for spec in DerivativeVarDataDict:
-            if i==0:
-                DerivativeVarDataDict[spec][i] = 0
-            else:
-                DerivativeVarDataDict[spec][i] = (VarDataDict[spec][i] - VarDataDict[spec][i-1])/(TimeDataList[i]-TimeDataList[i-1])
-        i+=1
-
-    # Normalize derivatives and change all to derivative magnitudes
-    for spec in DerivativeVarDataDict:
-        maxval = max(DerivativeVarDataDict[spec])
-        minval = min(DerivativeVarDataDict[spec])
-        val = abs(maxval)
-        if abs(maxval) < abs(minval):
-            val = abs(minval)
-        if val < 1e-20:
-            val = 1e-20
-        DerivativeVarDataDict[spec][:] = [abs(x) / val for x in DerivativeVarDataDict[spec]]
-
-    # Now, selection points based on the derivatives
-    probable_times = []
-    stepsizes = []
-    probable_times.append(selected_times[0])
-    i=0
-    j=0
-    for time in TimeDataList:
-        if time >= start_time and time <= end_time:
-            for spec in DerivativeVarDataDict:
-                if DerivativeVarDataDict[spec][i] > 0.01:
-                    probable_times.append(time)
-                    stepsizes.append(probable_times[j+1]-probable_times[j])
-                    j+=1
-                    break
-            # Force another step if needed to prevent too large a step
-            if i>0:
-                if (time-probable_times[j]) > maxStep:
-                    probable_times.append(time)
-                    stepsizes.append(probable_times[j+1]-probable_times[j])
-                    j+=1
-        i+=1
+    # Range of data points within the start and end times
+    lo = int(np.searchsorted(times, start_time, side="left"))
+    hi = int(np.searchsorted(times, end_time, side="right"))
+
+    if tolerance != None:
+        return _time_points_by_tolerance(TimeDataList, times, values, start_time, end_time, lo, hi, maxStep, tolerance)
+
+    # Approximate true derivatives, then normalize to derivative magnitudes
+    derivatives = np.zeros(values.shape)
+    derivatives[:,1:] = np.diff(values, axis=1)/np.diff(times)
+    scale = np.max(np.abs(derivatives), axis=1, initial=0)
+    scale[scale < 1e-20] = 1e-20
+    changing = np.any(np.abs(derivatives)/scale[:,None] > 0.01, axis=0)
+
+    # Points with changing derivatives are always selected, then extra points
+    #   are forced wherever the step from the last point would exceed maxStep
+    #   (the first data point is never forced)
+    lo = max(lo, 1)
+    flagged = np.nonzero(changing[lo:hi])[0] + lo
+    forced = []
+    if len(flagged) == 0:
+        forced += _forced_time_points(times, start_time, maxStep, lo, hi)
+    else:
+        forced += _forced_time_points(times, start_time, maxStep, lo, flagged[0])
+        gaps = np.nonzero(times[flagged[1:]-1] - times[flagged[:-1]] > maxStep)[0]
+        for k in gaps:
+            forced += _forced_time_points(times, times[flagged[k]], maxStep, flagged[k]+1, flagged[k+1])
+        forced += _forced_time_points(times, times[flagged[-1]], maxStep, flagged[-1]+1, hi)
+    index = np.sort(np.concatenate((flagged, np.array(forced, dtype=int))))
+
+    probable_times = [start_time] + [TimeDataList[i] for i in index]
+    stepsizes = np.diff(np.array(probable_times, dtype=float))
     if probable_times[-1] <= end_time:
         probable_times.append(end_time)
+    if len(stepsizes) == 0:
+        raise Exception("Error! No data points between start_time and end_time to select from")
+    minstep = np.min(stepsizes)
 
-    minstep = min(stepsizes)
+    # Remove points that are too close to the previously selected point
+    probable = np.array(probable_times, dtype=float)
+    selected_times = [probable_times[0]]
+    i = 0
+    while i < len(probable)-1:
+        i = _first_point_past(probable, probable[i], minstep*1.2, i+1, len(probable))
+        if i >= len(probable):
+            break
+        selected_times.append(probable_times[i])
 
-    i=0
-    j=0
-    for time in probable_times:
-        if i>0:
-            if (probable_times[i]-selected_times[j]) <= minstep*1.2:
-                pass
-            else:
-                selected_times.append(probable_times[i])
-                j+=1
-        i+=1
+    return selected_times
 
+# Helper function to find the first index in the increasing 'values[start:end]'
+#       that is more than 'step' beyond 'last' (returns 'end' if none are)
+def _first_point_past(values, last, step, start, end):
+    i = start + int(np.searchsorted(values[start:end], last + step, side="right"))
+    # Correct for round-off, since the test below is what defines the step
+    while i > start and values[i-1] - last > step:
+        i -= 1
+    while i < end and values[i] - last <= step:
+        i += 1
+    return i
+
+# Helper function to give the indices of data points in 'times[start:end]' that
+#       must be selected to keep all steps from 'last' within 'maxStep'
+def _forced_time_points(times, last, maxStep, start, end):
+    forced = []
+    i = _first_point_past(times, last, maxStep, start, end)
+    while i < end:
+        forced.append(i)
+        i = _first_point_past(times, times[i], maxStep, i+1, end)
+    return forced
+
+# Helper function to select data points that keep the error of a linear
+#       interpolation of all variables within the tolerance
+#
+#       Each step is extended from the last selected point by doubling and
+#       then bisecting the length of the step, and a step is only accepted
+#       after its error has been checked. This greedy search meets the
+#       tolerance, but may select more points than an optimal selection.
+def _time_points_by_tolerance(TimeDataList, times, values, start_time, end_time, lo, hi, maxStep, tolerance):
+    t = times[lo:hi]
+    scale = np.max(np.abs(values[:,lo:hi]), axis=1, initial=0)
+    scale[scale < 1e-20] = 1e-20
+    scaled = values[:,lo:hi]/scale[:,None]
+
+    def _within_tolerance(i, k):
+        if maxStep != None and t[k] - t[i] > maxStep:
+            return False
+        frac = (t[i:k+1] - t[i])/(t[k] - t[i])
+        line = scaled[:,i:i+1] + (scaled[:,k:k+1] - scaled[:,i:i+1])*frac
+        return np.all(np.abs(scaled[:,i:k+1] - line) <= tolerance)
+
+    knots = []
+    i = 0
+    while i < len(t)-1:
+        # Next point is always allowed, so search for the furthest good step
+        good = i+1
+        bad = len(t)
+        step = 2
+        while i+step < len(t):
+            if _within_tolerance(i, i+step) == False:
+                bad = i+step
+                break
+            good = i+step
+            step = step*2
+        if bad == len(t) and good < len(t)-1:
+            if _within_tolerance(i, len(t)-1) == True:
+                good = len(t)-1
+            else:
+                bad = len(t)-1
+        while bad - good > 1:
+            k = (good + bad)//2
+            if _within_tolerance(i, k) == True:
+                good = k
+            else:
+                bad = k
+        knots.append(good)
+        i = good
+
+    selected_times = [start_time]
+    for k in [0] + knots:
+        if TimeDataList[lo+k] > start_time:
+            selected_times.append(TimeDataList[lo+k])
+    if selected_times[-1] < end_time:
+        selected_times.append(end_time)
     return selected_times
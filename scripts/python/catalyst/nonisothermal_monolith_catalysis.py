@@ -193,67 +193,16 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
     # Define a single arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
     def arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
-        r = 0
-        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], model.Tc[age,temp,loc,time])
-        r=k
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                r=r*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    r=r*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        r=r*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        return r
+        k = self._arrhenius_k(model, rxn, model.Tc[age,temp,loc,time])
+        return self._rate_concentration_terms(rxn, "reactants", model, age, temp, loc, time, k)
 
     # Define a single equilibrium arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
     def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
-        r = 0
-        (Ar, Er) = equilibrium_arrhenius_consts(model.Af[rxn], model.Ef[rxn], model.dH[rxn], model.dS[rxn])
-        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], model.Tc[age,temp,loc,time])
-        kr = arrhenius_rate_const(Ar, 0, Er, model.Tc[age,temp,loc,time])
-        rf=kf
-        rr=kr
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                rf=rf*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    rf=rf*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        rf=rf*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        for spec in model.component(rxn+"_products"):
-             if spec in model.gas_set:
-                 rr=rr*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-             if self.isSurfSpecSet == True:
-                 if spec in model.surf_set:
-                     rr=rr*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                 if self.isSitesSet == True:
-                     if spec in model.site_set:
-                         rr=rr*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        r = rf-rr
-        return r
-
-    # Define a function for the reaction sum for gas species
-    def reaction_sum_gas(self, gas_spec, model, age, temp, loc, time):
-        r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
-        return r_sum
-
-    # Define a function for the reaction sum for surface species
-    def reaction_sum_surf(self, surf_spec, model, age, temp, loc, time):
-        r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
-        return r_sum
+        (kf, kr) = self._equilibrium_arrhenius_k(model, rxn, model.Tc[age,temp,loc,time])
+        rf = self._rate_concentration_terms(rxn, "reactants", model, age, temp, loc, time, kf)
+        rr = self._rate_concentration_terms(rxn, "products", model, age, temp, loc, time, kr)
+        return rf-rr
 
     # Define a function for the reaction sum for energy balance
     def reaction_sum_heats(self, model, age, temp, loc, time):
@@ -344,6 +293,9 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             if self.isRxnBuilt[rxn] == False:
                 raise Exception("Error! Cannot build constraints until reaction info is set. "
                                 +str(rxn)+ " given has not yet been constructed")
+        start = TIME.time()
+        if self.isLogParameterized == True:
+            self._build_log_parameters()
         self.model.bulk_cons = Constraint(self.model.gas_set, self.model.age_set,
                                 self.model.T_set, self.model.z,
                                 self.model.t, rule=self.bulk_mb_constraint)
@@ -373,6 +325,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                 self.model.t, rule=self.wall_eb_constraint)
 
         self.isConBuilt = True
+        self._log_performance("build_constraints", start)
 
     # Override 'discretize_model'
     def discretize_model(self, method=DiscretizationMethod.FiniteDifference,
@@ -493,6 +446,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
     # Create a 'set_const_temperature_IC' function
     def set_const_temperature_IC(self,age,temp,value):
+        self.clear_result_cache()
         if self.isDiscrete == False:
             raise Exception("Error! User should call the discretizer before setting initial conditions")
         self.model.T[age,temp, :, self.model.t.first()].set_value(value)
@@ -506,6 +460,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
     # Create a 'set_const_temperature_BC' function
     def set_const_temperature_BC(self,age,temp,value):
+        self.clear_result_cache()
         if self.isInitialTempSet[age][temp] == False:
             raise Exception("Error! User must specify initial conditions before boundary conditions. "
                             +str(age)+","+str(temp)+" given does not have IC for temperature")
@@ -899,6 +854,20 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             self.model.scaling_factor.set_value(self.model.wall_energy, scale_to/maxval)
 
 
+    # Override '_checkpoint_var_names' to include the temperature variables
+    def _checkpoint_var_names(self):
+        var_list = Isothermal_Monolith_Simulator._checkpoint_var_names(self)
+        var_list += ["T", "Tc", "Tw", "dT_dt", "dTc_dt", "dTw_dt", "dT_dz", "d2Tc_dz2", "d2Tw_dz2"]
+        return var_list
+
+    # Override '_init_temperature_slices'
+    #       Temperatures are solved for, so only the initial, inlet, and ambient
+    #       temperatures are inputs to the initializer
+    def _init_temperature_slices(self):
+        m = self.model
+        return [m.T[:, :, m.z.first(), :], m.T[:, :, :, m.t.first()], m.Tc[:, :, :, m.t.first()],
+                m.Tw[:, :, :, m.t.first()], m.Ta.values()]
+
     # Override 'initialize_simulator'
     def initialize_simulator(self, console_out=False, options={'print_user_options': 'yes',
                                                     'linear_solver': LinearSolverMethod.MA27,
@@ -908,7 +877,17 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                                     'constr_viol_tol': 1e-8,
                                                     'max_iter': 3000,
                                                     'obj_scaling_factor': 1,
-                                                    'diverging_iterates_tol': 1e50}):
+                                                    'diverging_iterates_tol': 1e50},
+                                                    workers=1,
+                                                    checkpoint_file=None,
+                                                    checkpoint_every=10,
+                                                    resume=False,
+                                                    windowed_steps=False,
+                                                    max_window=8,
+                                                    substeps=4,
+                                                    step_change_tol=0.1,
+                                                    warm_start=WarmStartMethod.PreviousTime,
+                                                    solver_stats=False):
 
         for age in self.isIsothermal:
             for temp in self.isIsothermal[age]:
@@ -920,7 +899,17 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         if self.isAllIsothermal == True:
             return Isothermal_Monolith_Simulator.initialize_simulator(self,
                                                                 console_out=console_out,
-                                                                options=options)
+                                                                options=options,
+                                                                workers=workers,
+                                                                checkpoint_file=checkpoint_file,
+                                                                checkpoint_every=checkpoint_every,
+                                                                resume=resume,
+                                                                windowed_steps=windowed_steps,
+                                                                max_window=max_window,
+                                                                substeps=substeps,
+                                                                step_change_tol=step_change_tol,
+                                                                warm_start=warm_start,
+                                                                solver_stats=solver_stats)
         else:
             for spec in self.model.gas_set:
                 for age in self.model.age_set:
@@ -947,8 +936,12 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             if self.isVelocityRecalculated == False:
                 self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
 
+            # Stoichiometry may have been changed directly
+            self._update_reaction_network()
+
             # Setup a dictionary to determine which reaction to unfix after solve
             self.initialize_time = TIME.time()
+            self.result_cache = None
             fixed_dict = {}
             fixed_heat_dict = {}
             for rxn in self.rxn_list:
@@ -970,6 +963,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                         fixed_heat_dict[item][rxn] = self.heats_list[item][rxn]
             self.fix_all_reactions()
             self.fix_all_heats()
+            self._kinetics_to_log_parameters()
 
             # Run a solve of the model without objective function
             if self.isObjectiveSet == True:
@@ -1024,16 +1018,26 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                     self.model.site_cons[:, :, :, :, :].deactivate()
 
             # Loops over specific sub-problems to solve
+            checkpoint = self._setup_init_checkpoint(checkpoint_file, checkpoint_every, resume)
+            results = None
             for age_solve in self.model.age_set:
                 for temp_solve in self.model.T_set:
 
                     # Inside age_solve && temp_solve
                     print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
 
+                    # Load any time steps that were already solved from the checkpoint
+                    steps_done = self._restore_block_checkpoint(checkpoint, age_solve, temp_solve)
+                    if steps_done > 1:
+                        print("\tRestored time steps up to " + str(self.model.t.at(steps_done)) + " from checkpoint")
+
                     i=0
                     for time_solve in self.model.t:
                         # Solve 1 time at a time starting with the i=1 time step (since IC is known)
-                        if i > 0:
+                        #   Time steps restored from the checkpoint stay fixed
+                        if i > 0 and i < steps_done:
+                            pass
+                        elif i > 0:
                             start = TIME.time()
                             print("\t... time_step " + str(time_solve))
                             self.model.Cb[:, age_solve, temp_solve, :, time_solve].unfix()
@@ -1207,7 +1211,8 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                             else:
                                 solver.options['nlp_scaling_method'] = 'gradient-based'
 
-                            results = solver.solve(self.model, tee=console_out, load_solutions=False)
+                            results = self._solve_logged(solver, console_out, "initialize_step",
+                                                        age=age_solve, temp=temp_solve, time=time_solve)
                             if results.solver.status == SolverStatus.ok:
                                 self.model.solutions.load_from(results)
                             elif results.solver.status == SolverStatus.warning:
@@ -1269,11 +1274,15 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                     self.model.S[:, age_solve, temp_solve, :, time_solve].fix()
                                     self.model.site_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
 
+                            # Record the converged time step in the checkpoint
+                            self._checkpoint_time_step(checkpoint, age_solve, temp_solve, i)
+
                         else:
                             # i = 0, don't do anything
                             pass
                         i+=1
                     # End time_solve loop
+                    self._write_init_checkpoint(checkpoint, age_solve, temp_solve)
                 # End temp_solve loop
             # End age_solve loop
 
@@ -1373,7 +1382,12 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                             self.unfix_heat(rxn)
 
             self.isInitialized = True
-            self.initialize_time = (TIME.time() - self.initialize_time)
+            initialize_start = self.initialize_time
+            self.initialize_time = (TIME.time() - initialize_start)
+            self._log_performance("initialize_simulator", initialize_start)
+            if results == None:
+                # All time steps were restored from the checkpoint
+                return (SolverStatus.ok, TerminationCondition.optimal)
             return (results.solver.status, results.solver.termination_condition)
             # End Initializer
 
@@ -1417,7 +1431,10 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
         if self.isVelocityRecalculated == False:
             self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
+        # Stoichiometry may have been changed directly
+        self._update_reaction_network()
         self.solve_time = TIME.time()
+        self.result_cache = None
 
         solver = SolverFactory('ipopt')
 
@@ -1551,7 +1568,8 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         else:
             solver.options['nlp_scaling_method'] = 'gradient-based'
 
-        results = solver.solve(self.model, tee=console_out, load_solutions=False)
+        self._kinetics_to_log_parameters()
+        results = self._solve_logged(solver, console_out, "run_solver")
         if results.solver.status == SolverStatus.ok:
             self.model.solutions.load_from(results)
         elif results.solver.status == SolverStatus.warning:
@@ -1563,6 +1581,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             print("An Error has occurred!")
             print("\tStatus: " + str(results.solver.status))
             print("\tTermination Condition: " + str(results.solver.termination_condition))
+        self._log_parameters_to_kinetics()
 
         self.solve_time = (TIME.time() - self.solve_time)
 
@@ -1574,6 +1593,17 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         print()
         return (results.solver.status, results.solver.termination_condition)
 
+    # Override '_result_temperature_names' to include the catalyst and wall temperatures
+    def _result_temperature_names(self):
+        return ["T", "Tc", "Tw"]
+
+    # Override 'run_decomposed_solver'
+    #       The (age, temp) block sub-problems do not include the energy balances,
+    #       and the blocks are coupled through the temperatures
+    def run_decomposed_solver(self, *args, **kwargs):
+        raise Exception("Error! Decomposed parameter estimation is not supported for nonisothermal systems. "
+                        "Use 'run_solver' or 'run_multistart_solver' instead.")
+
     # # TODO: Override saving and loading of models
 
     # # TODO: Override 'print_kinetic_parameter_info' and add in heat of reaction parameters
@@ -1637,6 +1667,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
         full_file_name = folder+file_name+"Plots"+file_type
 
+        results = self.get_result_arrays([], age_list, temp_list, true_loc_list)
         xvals = list(self.model.t.data())
         fig,ax = plt.subplots(figsize=(10,5))
         leg=[]
@@ -1647,20 +1678,13 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         var_list = ["T","Tc", "Tw"]
         for var in var_list:
             ylab1 += var+"\n"
-            for age in age_list:
-                for temp in temp_list:
-                    for loc in true_loc_list:
+            for i, age in enumerate(age_list):
+                for j, temp in enumerate(temp_list):
+                    for k, loc in enumerate(true_loc_list):
                         leg_name = var+"_"+age+"_"+temp+"_at_"+str(loc)
                         leg.append(leg_name)
-                        if var == "T":
-                            yvals = list(self.model.T[age,temp,loc,:].value)
-                            ax.plot(xvals,yvals)
-                        elif var == "Tc":
-                            yvals = list(self.model.Tc[age,temp,loc,:].value)
-                            ax.plot(xvals,yvals)
-                        else:
-                            yvals = list(self.model.Tw[age,temp,loc,:].value)
-                            ax.plot(xvals,yvals)
+                        yvals = results[var][i,j,k]
+                        ax.plot(xvals,yvals)
 
         plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Time "+x_units)
@@ -1729,6 +1753,8 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
         full_file_name = folder+file_name+"Plots"+file_type
 
+        results = self.get_result_arrays([], age_list, temp_list)
+        t_list = list(self.model.t)
         xvals = list(self.model.z.data())
         fig,ax = plt.subplots(figsize=(10,5))
         leg=[]
@@ -1739,20 +1765,13 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         var_list = ["T","Tc", "Tw"]
         for var in var_list:
             ylab1 += var+"\n"
-            for age in age_list:
-                for temp in temp_list:
+            for i, age in enumerate(age_list):
+                for j, temp in enumerate(temp_list):
                     for time in true_time_list:
                         leg_name = var+"_"+age+"_"+temp+"_at_"+str(time)
                         leg.append(leg_name)
-                        if var == "T":
-                            yvals = list(self.model.T[age,temp,:,time].value)
-                            ax.plot(xvals,yvals)
-                        elif var == "Tc":
-                            yvals = list(self.model.Tc[age,temp,:,time].value)
-                            ax.plot(xvals,yvals)
-                        else:
-                            yvals = list(self.model.Tw[age,temp,:,time].value)
-                            ax.plot(xvals,yvals)
+                        yvals = results[var][i,j,:,t_list.index(time)]
+                        ax.plot(xvals,yvals)
 
         plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Z "+x_units)
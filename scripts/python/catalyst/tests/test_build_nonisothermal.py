@@ -372,6 +372,17 @@ class TestBasicNonisothermalCatalystBuild():
             value(obj_inert.model.Cb["N2","Unaged","250C",
                     obj_inert.model.z.first(),2.0])
 
+        # Only the inlet (not the solved) temperatures are inputs for the initializer checkpoint
+        inputs = obj._init_inputs_hash()
+        T = obj.model.T["Unaged","250C",obj.model.z.last(),obj.model.t.last()]
+        T.set_value(T.value + 10)
+        assert obj._init_inputs_hash() == inputs
+        T.set_value(T.value - 10)
+        T = obj.model.T["Unaged","250C",obj.model.z.first(),obj.model.t.last()]
+        T.set_value(T.value + 10)
+        assert obj._init_inputs_hash() != inputs
+        T.set_value(T.value - 10)
+
     @pytest.mark.initialization
     def test_initialize_auto_scaling(self, nonisothermal_object, nonisothermal_object_no_rxns):
         obj = nonisothermal_object
@@ -110,6 +110,126 @@ class TestIsothermalCatalystInputOutputOptions():
         assert pytest.approx(0.0000057, rel=1e-3) == test.model.Cb_data["NH3","Unaged","250C",2.5,12.75].value
         assert pytest.approx(0.000000006, rel=1e-3) == test.model.Cb_data["NH3","Unaged","250C",5,12.75].value
 
+    @pytest.mark.unit
+    def test_data_values_from_table(self, isothermal_io_object):
+        test = isothermal_io_object
+
+        data = naively_read_data_file("sample_data.txt", factor=2)
+        full = {index: test.model.Cb_data_full[index].value for index in test.model.Cb_data_full}
+        window = {index: test.model.Cb_data[index].value for index in test.model.Cb_data}
+        for index in test.model.Cb_data_full:
+            test.model.Cb_data_full[index].set_value(0)
+        for index in test.model.Cb_data:
+            test.model.Cb_data[index].set_value(0)
+
+        test.set_data_values_from_table(data, {"NH3_2.5": ("NH3","Unaged","250C",2.5),
+                                                "NH3_5": ("NH3","Unaged","250C",5)})
+        assert {index: test.model.Cb_data_full[index].value for index in test.model.Cb_data_full} == full
+        assert {index: test.model.Cb_data[index].value for index in test.model.Cb_data} == window
+
+        # Objects holding a 'data_map' and 'time_key' (e.g., TransientData) are also accepted
+        class DataMap():
+            pass
+        table = DataMap()
+        table.time_key = "Elapsed Time (min)"
+        table.data_map = {"Elapsed Time (min)": np.array(data["time"]), "NH3": np.array(data["NH3_5"])*2}
+        test.set_data_values_from_table(table, age="Unaged", temp="250C", loc=5)
+        assert test.model.Cb_data_full["NH3","Unaged","250C",5,12.75].value == pytest.approx(2*full[("NH3","Unaged","250C",5,12.75)])
+        assert test.model.Cb_data["NH3","Unaged","250C",5,12.75].value == pytest.approx(2*window[("NH3","Unaged","250C",5,12.75)])
+        assert test.model.Cb_data["NH3","Unaged","250C",2.5,12.75].value == window[("NH3","Unaged","250C",2.5,12.75)]
+
+        with pytest.raises(Exception):
+            test.set_data_values_from_table(table, age="Unaged", temp="250C")
+        with pytest.raises(Exception):
+            test.set_data_values_from_table({"time": [100.0], "NH3": [1.0]}, age="Unaged", temp="250C", loc=5)
+        with pytest.raises(Exception):
+            test.set_data_values_from_table(data, {"NH3_5": ("H2O","Unaged","250C",5)})
+
+        test.set_data_values_from_table(data, {"NH3_5": ("NH3","Unaged","250C",5)})
+        assert {index: test.model.Cb_data[index].value for index in test.model.Cb_data} == window
+
+    @pytest.mark.unit
+    def test_read_data_file_mmap(self, tmp_path, monkeypatch):
+        data = naively_read_data_file("sample_data.txt", factor=3)
+        assert len(data["time"]) == 13
+        assert data["NH3_5"][2] == pytest.approx(sum(naively_read_data_file("sample_data.txt")["NH3_5"][6:9])/3)
+
+        tuples = naively_read_data_file("sample_data.txt", factor=3, dict_of_tuples=True)
+        assert list(tuples.keys()) == ["NH3_2.5", "NH3_5"]
+        assert tuples["NH3_5"][2] == (data["time"][2], data["NH3_5"][2])
+
+        with pytest.raises(Exception):
+            naively_read_data_file("sample_data.txt", factor=0)
+
+        # Binary copy is only made when asked for
+        with open("sample_data.txt", "r") as file:
+            text = file.read()
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        data_file = str(data_dir / "mmap_data.txt")
+        with open(data_file, "w") as file:
+            file.write(text)
+        assert naively_read_data_file(data_file, factor=3) == data
+        assert os.listdir(str(data_dir)) == ["mmap_data.txt"]
+
+        # Binary copy is made in the default cache folder (never beside the
+        #   data file) on first read and used on later reads
+        import catalyst.isothermal_monolith_catalysis as module
+        default_dir = str(tmp_path / "default_cache")
+        monkeypatch.setattr(module, "_data_cache_dir", default_dir)
+        loadtxt = np.loadtxt
+        assert naively_read_data_file(data_file, factor=3, use_mmap=True) == data
+        assert os.listdir(str(data_dir)) == ["mmap_data.txt"]
+        assert len(os.listdir(default_dir)) == 1
+        def fail_loadtxt(*args, **kwargs):
+            raise Exception("Error! Data file was parsed instead of read from the binary copy!")
+        monkeypatch.setattr(np, "loadtxt", fail_loadtxt)
+        assert naively_read_data_file(data_file, factor=3, use_mmap=True) == data
+        monkeypatch.setattr(np, "loadtxt", loadtxt)
+
+        # Binary copy goes in 'cache_dir' (made if needed) when given
+        cache_dir = str(tmp_path / "cache")
+        assert naively_read_data_file(data_file, factor=3, use_mmap=True, cache_dir=cache_dir) == data
+        assert os.listdir(str(data_dir)) == ["mmap_data.txt"]
+        assert len(os.listdir(cache_dir)) == 1
+        assert os.listdir(cache_dir)[0].startswith("mmap_data.txt-") == True
+        monkeypatch.setattr(np, "loadtxt", fail_loadtxt)
+        assert naively_read_data_file(data_file, factor=3, use_mmap=True, cache_dir=cache_dir) == data
+        monkeypatch.setattr(np, "loadtxt", loadtxt)
+
+        # Read-only cache folder still returns the data (root can write anyway)
+        locked_dir = tmp_path / "locked_cache"
+        locked_dir.mkdir()
+        os.chmod(str(locked_dir), 0o555)
+        try:
+            assert naively_read_data_file(data_file, factor=3, use_mmap=True, cache_dir=str(locked_dir)) == data
+            if os.geteuid() != 0:
+                assert os.listdir(str(locked_dir)) == []
+        finally:
+            os.chmod(str(locked_dir), 0o755)
+
+    @pytest.mark.unit
+    def test_time_point_selector_tolerance(self):
+        data = naively_read_data_file("sample_data.txt", factor=1)
+
+        for tol in [0.1, 0.01]:
+            time_list = time_point_selector(data["time"], data, tolerance=tol)
+            assert time_list[0] == 0
+            assert time_list[-1] == data["time"][-1]
+            assert len(time_list) < len(data["time"])
+            for spec in ["NH3_2.5", "NH3_5"]:
+                values = np.interp(time_list, data["time"], data[spec])
+                error = np.abs(np.interp(data["time"], time_list, values) - data[spec])
+                assert np.max(error) <= tol*np.max(np.abs(data[spec]))*(1+1e-9)
+        assert len(time_point_selector(data["time"], data, tolerance=0.01)) > len(time_point_selector(data["time"], data, tolerance=0.1))
+
+        time_list = time_point_selector(data["time"], data, end_time=10, maxStep=1, tolerance=0.1)
+        assert time_list[-1] == 10
+        assert np.max(np.diff(time_list)) <= 1
+
+        with pytest.raises(Exception):
+            time_point_selector(data["time"][::-1], data)
+
     @pytest.mark.build
     def test_read_data_list_for_inputs(self, isothermal_io_object_with_surface_data):
         test = isothermal_io_object_with_surface_data
@@ -448,6 +568,41 @@ class TestIsothermalCatalystInputOutputOptions():
 
         assert pytest.approx(151515.15151515152, rel=1e-3) == test.model.w["NH3","Unaged","250C", test.model.t_data.first()].value
 
+    @pytest.mark.unit
+    def test_multistart_points(self, isothermal_io_object):
+        test = isothermal_io_object
+
+        # Only A has a range of bounds (E = 0 has none)
+        params = test._multistart_parameters()
+        assert [(var.name, isLogScale) for (var, isLogScale) in params] == [("A[r1]", True)]
+
+        # Each interval (on a log scale) is sampled exactly once
+        points = test._latin_hypercube_points(params, 5, seed=0)
+        assert points.shape == (5, 1)
+        (lb, ub) = (test.model.A["r1"].lb, test.model.A["r1"].ub)
+        assert np.all(points >= lb) and np.all(points <= ub)
+        u = (np.log(points[:,0]) - np.log(lb))/(np.log(ub) - np.log(lb))
+        assert sorted(np.floor(u*5).astype(int)) == [0, 1, 2, 3, 4]
+        assert np.all(points == test._latin_hypercube_points(params, 5, seed=0))
+
+        with pytest.raises(Exception):
+            test.run_multistart_solver(n_starts=0)
+
+    @pytest.mark.unit
+    def test_decomposed_objective(self, isothermal_io_object):
+        test = isothermal_io_object
+
+        # Shared parameters are all free kinetic parameters (bounded or not)
+        assert [var.name for var in test._shared_parameters()] == ["A[r1]", "E[r1]"]
+
+        # The objectives of the (age, temp) blocks sum to the full objective
+        test.model.block_obj = Expression(test.model.data_age_set, test.model.data_T_set,
+                                    rule=test.block_objective)
+        total = sum(value(test.model.block_obj[age,temp]) for age in test.model.data_age_set
+                                                            for temp in test.model.data_T_set)
+        assert pytest.approx(total, rel=1e-8) == value(test.model.obj)
+        test.model.del_component(test.model.block_obj)
+
     @pytest.mark.solver
     def test_optimization(self, isothermal_io_object):
         test = isothermal_io_object
@@ -466,6 +621,51 @@ class TestIsothermalCatalystInputOutputOptions():
         assert path.exists("output/final_result_endComparisonPlots.png") == True
         assert path.exists("output/final_result_midComparisonPlots.png") == True
 
+    @pytest.mark.solver
+    def test_multistart_optimization(self, isothermal_io_object):
+        test = isothermal_io_object
+        obj_single = value(test.model.obj)
+
+        (stat, cond) = test.run_multistart_solver(n_starts=3, workers=2, seed=0)
+        assert stat == SolverStatus.ok
+        assert len(test.multistart_results) == 4
+
+        # The current parameters are one of the starts, so the best fit is no worse
+        best = min([result["objective"] for result in test.multistart_results])
+        assert pytest.approx(best, rel=1e-6) == value(test.model.obj)
+        assert value(test.model.obj) <= obj_single*(1+1e-6)
+
+    @pytest.mark.solver
+    def test_decomposed_optimization(self, isothermal_io_object):
+        test = isothermal_io_object
+
+        tol = 1e-3
+        (stat, cond) = test.run_decomposed_solver(workers=2, max_iter=20, tol=tol)
+        assert stat == SolverStatus.ok
+        assert len(test.decomposed_history) > 0
+        assert len(test.decomposed_history) <= 20
+
+        # ADMM exited because the consensus residuals converged (not on max_iter)
+        assert test.decomposed_history[-1]["primal"] < tol
+        assert test.decomposed_history[-1]["dual"] < tol
+
+        # All blocks are consistent with the single set of consensus parameters
+        assert test.model.A["r1"].value >= test.model.A["r1"].lb
+        assert test.model.A["r1"].value <= test.model.A["r1"].ub
+        params = {var.name: var.value for var in test._shared_parameters()}
+        obj_decomposed = value(test.model.obj)
+
+        # The full NLP fit agrees with the decomposed fit
+        (stat, cond) = test.run_solver()
+        assert stat == SolverStatus.ok
+        assert pytest.approx(value(test.model.obj), rel=1e-2, abs=1e-8) == obj_decomposed
+        for var in test._shared_parameters():
+            if var.lb != None and var.ub != None:
+                scale = var.ub - var.lb
+            else:
+                scale = max(abs(var.value), 1)
+            assert abs(params[var.name] - var.value)/scale < 10*tol
+
     @pytest.mark.unit
     def test_print_result_files(self, isothermal_io_object):
         test = isothermal_io_object
@@ -479,6 +679,50 @@ class TestIsothermalCatalystInputOutputOptions():
         test.print_results_of_integral_average(["q1","S1"], "Unaged", "250C", file_name="")
         assert path.exists("output/q1_S1_Unaged_250C_integral_avg.txt") == True
 
+    @pytest.mark.unit
+    def test_export_results(self, isothermal_io_object, tmp_path, monkeypatch):
+        test = isothermal_io_object
+        monkeypatch.chdir(tmp_path)
+
+        # Arrays are indexed by (spec, age, temp, z, t) in the order of the model sets
+        results = test.get_result_arrays(["NH3","q1"], ["Unaged"], ["250C"])
+        assert results["gas"] == ["NH3"] and results["surf"] == ["q1"] and results["site"] == []
+        assert results["Cb"].shape == (1, 1, 1, len(test.model.z), len(test.model.t))
+        assert results["S"].shape[0] == 0
+        z = list(test.model.z)[3]
+        t = list(test.model.t)[7]
+        assert results["Cb"][0,0,0,3,7] == test.model.Cb["NH3","Unaged","250C",z,t].value
+        assert results["C"][0,0,0,3,7] == test.model.C["NH3","Unaged","250C",z,t].value
+        assert results["q"][0,0,0,3,7] == test.model.q["q1","Unaged","250C",z,t].value
+        assert results["T"][0,0,3,7] == test.model.T["Unaged","250C",z,t].value
+
+        with pytest.raises(Exception):
+            test.get_result_arrays(["NH3"], ["Aged"], ["250C"])
+
+        test.export_results("all_results", ".npz")
+        data = np.load("output/all_results.npz")
+        assert list(data["gas"]) == list(test.model.gas_set)
+        assert data["S"][0,0,0,3,7] == test.model.S["S1","Unaged","250C",z,t].value
+
+        test.export_results("all_results", ".csv", spec_list=["NH3","S1"])
+        with open("output/all_results.csv") as file:
+            lines = file.readlines()
+        assert lines[0].strip() == "age,temp,z,t,NH3_b,NH3_w,S1,T"
+        assert len(lines) == 1 + len(test.model.z)*len(test.model.t)
+        assert float(lines[1].split(",")[4]) == test.model.Cb["NH3","Unaged","250C",test.model.z.first(),test.model.t.first()].value
+
+        with pytest.raises(Exception):
+            test.export_results("all_results", ".parquet")
+
+        # Data arrays are only pulled again after the data are changed
+        data = test._data_arrays()
+        assert data["Cb_data"].shape == (1, 1, 1, len(test.model.z_data), len(test.model.t_data))
+        t = list(test.model.t_data)[4]
+        assert data["Cb_data"][0,0,0,1,4] == test.model.Cb_data["NH3","Unaged","250C",5,t].value
+        assert test._data_arrays() is data
+        test.set_data_values_for("NH3","Unaged","250C",5,[t],[test.model.Cb_data["NH3","Unaged","250C",5,t].value])
+        assert test.data_cache == None
+
     @pytest.mark.unit
     def test_print_kinetics(self, isothermal_io_object):
         test = isothermal_io_object
@@ -698,6 +942,95 @@ class TestIsothermalCatalystInputOutputOptions():
         assert pytest.approx(8.440922883914233, rel=1e-3) == test6.model.wq["q1","Unaged","250C", test6.model.t_data.first()].value
         assert pytest.approx(137931.0344827586, rel=1e-3) == test6.model.w["NH3","Unaged","250C", test6.model.t_data.first()].value
 
+    @pytest.mark.unit
+    def test_binary_model_state(self, isothermal_io_object_with_surface_data, tmp_path, monkeypatch):
+        test = isothermal_io_object_with_surface_data
+        monkeypatch.chdir(tmp_path)
+
+        test.save_model_state(file_name="sample_model_with_surface.npz")
+        test.save_model_state(file_name="sample_model_with_surface.json")
+        assert path.exists("output/sample_model_with_surface.npz") == True
+
+        # Full model loads the same from either format
+        test1 = Isothermal_Monolith_Simulator()
+        test1.load_model_full("output/sample_model_with_surface.npz")
+        test2 = Isothermal_Monolith_Simulator()
+        test2.load_model_full("output/sample_model_with_surface.json")
+
+        for name in ["Cb", "C", "q", "S", "Smax", "T", "v", "u_C", "u_q", "q_data", "wq"]:
+            for key in test2.model.component(name).index_set():
+                assert test1.model.component(name)[key].value == test2.model.component(name)[key].value
+        assert test1.model.Af["r1"].value == test2.model.Af["r1"].value
+
+        # Only the requested time slice is loaded as the IC
+        test3 = Isothermal_Monolith_Simulator()
+        test3.load_model_state_as_IC("output/sample_model_with_surface.npz", new_time_window=(8,18), tstep=10, state=8)
+        test4 = Isothermal_Monolith_Simulator()
+        test4.load_model_state_as_IC("output/sample_model_with_surface.json", new_time_window=(8,18), tstep=10, state=8)
+
+        for name in ["Cb", "C", "q", "S", "T", "P", "space_velocity"]:
+            for key in test4.model.component(name).index_set():
+                assert test3.model.component(name)[key].value == test4.model.component(name)[key].value
+
+        test5 = Isothermal_Monolith_Simulator()
+        with pytest.raises(KeyError):
+            test5.load_model_state_as_IC("output/sample_model_with_surface.npz", new_time_window=(60,80), tstep=10)
+
+    @pytest.mark.unit
+    def test_load_keeps_reaction_terms(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        test = Isothermal_Monolith_Simulator()
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+        test.add_age_set("Unaged")
+        test.add_temperature_set("150C")
+        test.add_gas_species(["NH3","NO"])
+
+        test.set_bulk_porosity(0.3309)
+        test.set_washcoat_porosity(0.4)
+        test.set_reactor_radius(1)
+        test.set_space_velocity_all_runs(500)
+        test.set_cell_density(62)
+
+        test.add_reactions({"r1": ReactionType.Arrhenius})
+        test.set_reaction_info("r1", {"parameters": {"A": 1e5, "E": 0, "B": 0},
+                                      "mol_reactants": {"NH3": 1},
+                                      "mol_products": {},
+                                      "rxn_orders": {"NH3": 1}})
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+        test.build_constraints()
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=5,elems=5,colpoints=2)
+        test.set_const_IC("NH3","Unaged","150C",0)
+        test.set_const_IC("NO","Unaged","150C",0)
+        test.set_const_BC("NH3","Unaged","150C",1e-6)
+        test.set_const_BC("NO","Unaged","150C",0)
+
+        test.save_model_state(file_name="one_rxn.npz")
+        test.save_model_state(file_name="one_rxn.json")
+
+        # Reaction terms must be rebuilt in the constraints of a loaded model
+        loaded = []
+        for file in ["output/one_rxn.npz", "output/one_rxn.json"]:
+            test1 = Isothermal_Monolith_Simulator()
+            test1.load_model_full(file)
+            loaded.append(test1)
+            test2 = Isothermal_Monolith_Simulator()
+            test2.load_model_state_as_IC(file, new_time_window=(0,10), tstep=5)
+            loaded.append(test2)
+        for test1 in loaded:
+            assert test1.rxn_network["r1"]["u_C"] == {"NH3": -1}
+            names = [v.parent_component().name for v in
+                        identify_variables(test1.model.pore_cons["NH3","Unaged","150C",2,test1.model.t.last()].body)]
+            assert "A" in names
+            names = [v.parent_component().name for v in
+                        identify_variables(test1.model.pore_cons["NO","Unaged","150C",2,test1.model.t.last()].body)]
+            assert "A" not in names
+
+            # Loaded stoichiometry matches the compiled network (nothing to rebuild)
+            test1._update_reaction_network()
+            assert test1.rxn_network["r1"]["u_C"] == {"NH3": -1}
+
     @pytest.mark.build
     def test_remove_select_weight_factors(self, isothermal_io_object_with_surface_data):
         test = isothermal_io_object_with_surface_data
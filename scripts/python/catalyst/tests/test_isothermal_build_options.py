@@ -6,6 +6,8 @@ import unittest
 import pytest
 from catalyst.isothermal_monolith_catalysis import *
 
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.common.collections import ComponentSet
 import logging
 
 __author__ = "Austin Ladshaw"
@@ -725,3 +727,631 @@ class TestIsothermalCatalystBuildOptions():
         assert test.model.Smax["k","Unaged",3,3].value == 0.2
         assert test.model.Smax["k","Unaged",4,4].value == 0.1
         assert test.model.Smax["k","Unaged",5,5].value == 0.1
+
+    @pytest.mark.unit
+    def test_block_value_transfer(self, catalyst_zoning_varying_site_densities):
+        test = catalyst_zoning_varying_site_densities
+        values = test._grab_block_values("Unaged","150C")
+
+        assert "Cb" in values
+        assert "q" in values
+        assert "S" in values
+        assert len(values["Cb"]) == len(test.model.gas_set)*len(test.model.z)*len(test.model.t)
+
+        # Perturb the block, then restore from the grabbed values
+        for name in values:
+            for index, val in values[name]:
+                test.model.component(name)[index].set_value(0.5)
+        test._load_block_values(values)
+
+        for name in values:
+            for index, val in values[name]:
+                assert test.model.component(name)[index].value == val
+
+    @pytest.mark.unit
+    def test_block_subproblem(self, catalyst_zoning_varying_site_densities):
+        test = catalyst_zoning_varying_site_densities
+        block = test._build_block_subproblem("Unaged","150C")
+
+        assert hasattr(block, 'bulk_cons')
+        assert hasattr(block, 'surf_cons')
+        assert hasattr(block, 'site_cons')
+        assert hasattr(block, 'dCbdz_edge')
+
+        # Block constraints are the same objects as in the full model
+        assert len(block.bulk_cons) == len(test.model.bulk_cons)
+        for con in block.bulk_cons.values():
+            assert con.parent_component() is test.model.bulk_cons
+
+    @pytest.mark.solver
+    @pytest.mark.skipif(SolverFactory('ipopt').available(exception_flag=False) == False,
+                        reason="ipopt is not available")
+    def test_parallel_block_initialization(self):
+        temps = {"150C": 150, "200C": 200}
+        serial = self._build_small_test_model(temps)
+        (status, condition) = serial.initialize_simulator(workers=1)
+        assert status == SolverStatus.ok
+
+        parallel = self._build_small_test_model(temps)
+        (status, condition) = parallel.initialize_simulator(workers=2)
+        assert status == SolverStatus.ok
+
+        # Blocks are independent, so workers give the same state as the serial loop
+        for temp in temps:
+            for z in [serial.model.z.first(), list(serial.model.z)[2], serial.model.z.last()]:
+                for t in [list(serial.model.t)[1], 4, serial.model.t.last()]:
+                    assert pytest.approx(serial.model.Cb["NH3","Unaged",temp,z,t].value, rel=1e-6, abs=1e-14) == \
+                        parallel.model.Cb["NH3","Unaged",temp,z,t].value
+                    assert pytest.approx(serial.model.C["NH3","Unaged",temp,z,t].value, rel=1e-6, abs=1e-14) == \
+                        parallel.model.C["NH3","Unaged",temp,z,t].value
+                    assert pytest.approx(serial.model.q["q1","Unaged",temp,z,t].value, rel=1e-6, abs=1e-14) == \
+                        parallel.model.q["q1","Unaged",temp,z,t].value
+                    assert pytest.approx(serial.model.S["S1","Unaged",temp,z,t].value, rel=1e-6, abs=1e-14) == \
+                        parallel.model.S["S1","Unaged",temp,z,t].value
+
+    @pytest.mark.unit
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="parallel initialization requires fork")
+    def test_parallel_failure_releases_model(self, monkeypatch):
+        import catalyst.isothermal_monolith_catalysis as module
+        test = self._build_small_test_model({"150C": 150, "200C": 200})
+        def fail_block(self, age, temp, *args, **kwargs):
+            raise Exception("Error! Block failed in the worker")
+        monkeypatch.setattr(Isothermal_Monolith_Simulator, "_initialize_block", fail_block)
+
+        # Errors from the workers reach the parent without leaving the model in the module global
+        with pytest.raises(Exception, match="Block failed"):
+            test.initialize_simulator(workers=2)
+        assert module._parallel_init_simulator == None
+
+    @pytest.mark.unit
+    def test_compiled_reaction_network(self):
+        test = Isothermal_Monolith_Simulator()
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+
+        test.add_age_set("Unaged")
+        test.add_temperature_set("150C")
+        test.add_gas_species(["NH3","NO"])
+        test.add_surface_species(["q1"])
+        test.add_surface_sites(["S1"])
+
+        test.set_bulk_porosity(0.3309)
+        test.set_washcoat_porosity(0.4)
+        test.set_reactor_radius(1)
+        test.set_space_velocity_all_runs(500)
+        test.set_cell_density(62)
+
+        test.add_reactions({"r1": ReactionType.EquilibriumArrhenius})
+        test.set_site_balance("S1",{"mol_occupancy": {"q1": 1}})
+        test.set_reaction_info("r1", {"parameters": {"A": 250000, "E": 0, "dH": -55373.27775, "dS": -9.890904876},
+                                      "mol_reactants": {"NH3": 1, "S1": 1},
+                                      "mol_products": {"q1": 1},
+                                      "rxn_orders": {"NH3": 1, "S1": 1, "q1": 1}})
+
+        network = test.rxn_network["r1"]
+        assert network["gas_reactants"] == ["NH3"]
+        assert network["site_reactants"] == ["S1"]
+        assert network["surf_products"] == ["q1"]
+        assert network["u_C"] == {"NH3": -1}
+        assert network["u_q"] == {"q1": 1}
+
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+        test.build_constraints()
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=5,elems=5,colpoints=2)
+
+        # Species without stoichiometry in r1 get no reaction terms
+        names = [v.parent_component().name for v in
+                    identify_variables(test.model.pore_cons["NO","Unaged","150C",2,10].body)]
+        assert "q" not in names
+        names = [v.parent_component().name for v in
+                    identify_variables(test.model.pore_cons["NH3","Unaged","150C",2,10].body)]
+        assert "q" in names
+        assert value(test.model.u_C["NH3","r1",2]) == -1
+
+        # Terms made non-zero after the build (even if only downstream) are
+        #   added to the network and the reaction constraints are rebuilt
+        for loc in test.model.z:
+            if loc >= 3:
+                test.model.u_C["NO","r1",loc].set_value(-1)
+        test._update_reaction_network()
+        assert test.rxn_network["r1"]["u_C"] == {"NH3": -1, "NO": -1}
+        names = [v.parent_component().name for v in
+                    identify_variables(test.model.pore_cons["NO","Unaged","150C",4,10].body)]
+        assert "q" in names
+        assert "Af" in names
+
+    @pytest.mark.unit
+    def test_interpolation_weights(self, catalyst_zoning_varying_site_densities):
+        test = catalyst_zoning_varying_site_densities
+
+        # Points on a node only need the node itself
+        weights = test._interpolation_weights(test.model.z.at(2), test.model.t.at(3))
+        assert weights == [((test.model.z.at(2), test.model.t.at(3)), 1)]
+
+        # Weights are consistent with the linear approximation of 'interpret_var'
+        weights = test._interpolation_weights(1.3, 4.4)
+        assert len(weights) == 3
+        assert pytest.approx(1, rel=1e-6) == sum([w for (node, w) in weights])
+
+        for (z, t) in test.model.Cb["A","Unaged","150C",:,:].wildcard_keys():
+            test.model.Cb["A","Unaged","150C",z,t].set_value(2*z + 3*t)
+        assert pytest.approx(2*1.3 + 3*4.4, rel=1e-5) == \
+            value(test.interpret_var(test.model.Cb,"A","Unaged","150C",1.3,4.4))
+
+    @pytest.mark.unit
+    def test_init_checkpoint(self, tmp_path):
+        test = Isothermal_Monolith_Simulator()
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+
+        test.add_age_set("Unaged")
+        test.add_temperature_set("150C")
+        test.add_gas_species(["NH3"])
+        test.add_surface_species(["q1"])
+        test.add_surface_sites(["S1"])
+
+        test.set_bulk_porosity(0.3309)
+        test.set_washcoat_porosity(0.4)
+        test.set_reactor_radius(1)
+        test.set_space_velocity_all_runs(500)
+        test.set_cell_density(62)
+
+        test.add_reactions({"r1": ReactionType.EquilibriumArrhenius})
+        test.set_site_balance("S1",{"mol_occupancy": {"q1": 1}})
+        test.set_reaction_info("r1", {"parameters": {"A": 250000, "E": 0, "dH": -55373.27775, "dS": -9.890904876},
+                                      "mol_reactants": {"NH3": 1, "S1": 1},
+                                      "mol_products": {"q1": 1},
+                                      "rxn_orders": {"NH3": 1, "S1": 1, "q1": 1}})
+        test.set_site_density("S1","Unaged",0.1)
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+
+        test.build_constraints()
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=5,elems=5,colpoints=2)
+
+        test.set_const_IC("NH3","Unaged","150C",0)
+        test.set_const_IC("q1","Unaged","150C",0)
+        test.set_const_BC("NH3","Unaged","150C",1e-5)
+
+        # Record 'converged' values for every time step of the block
+        for name in test._checkpoint_var_names():
+            for var in test.model.component(name)[:,"Unaged","150C",:,:]:
+                var.set_value(1e-6*var.index()[-1])
+        file = str(tmp_path / "init_checkpoint.npz")
+        checkpoint = test._setup_init_checkpoint(file, 2, False)
+        for step in range(1, len(test.model.t)):
+            test._checkpoint_time_step(checkpoint, "Unaged", "150C", step)
+        test._write_init_checkpoint(checkpoint, "Unaged", "150C")
+        assert os.path.isfile(file)
+        values = test._grab_block_values("Unaged","150C")
+
+        # Perturb the block (not the ICs or fixed BCs), then resume from the checkpoint
+        #   (all steps already converged)
+        for name in values:
+            for index, val in values[name]:
+                if index[-1] != test.model.t.first() and test.model.component(name)[index].fixed == False:
+                    test.model.component(name)[index].set_value(0.5)
+        (status, condition) = test.initialize_simulator(checkpoint_file=file, resume=True)
+
+        assert status == SolverStatus.ok
+        assert test.isInitialized == True
+        for name in values:
+            for index, val in values[name]:
+                assert test.model.component(name)[index].value == val
+
+        # A checkpoint of a different model is ignored
+        checkpoint = test._setup_init_checkpoint(file, 2, False)
+        checkpoint["data"]["header"] = np.array("{}")
+        test._read_init_checkpoint(checkpoint)
+        assert test._restore_block_checkpoint(checkpoint, "Unaged", "150C") == 0
+
+        # ... as is a checkpoint of the same model with different inputs
+        steps = test._restore_block_checkpoint(test._setup_init_checkpoint(file, 2, True), "Unaged", "150C")
+        assert steps == len(test.model.t)
+        test.model.Af["r1"].set_value(2*test.model.Af["r1"].value)
+        assert test._restore_block_checkpoint(test._setup_init_checkpoint(file, 2, True), "Unaged", "150C") == 0
+        test.model.Af["r1"].set_value(test.model.Af["r1"].value/2)
+        test.model.T["Unaged","150C",3,4].set_value(160+273.15)
+        assert test._restore_block_checkpoint(test._setup_init_checkpoint(file, 2, True), "Unaged", "150C") == 0
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+        test.set_const_BC("NH3","Unaged","150C",2e-5)
+        assert test._restore_block_checkpoint(test._setup_init_checkpoint(file, 2, True), "Unaged", "150C") == 0
+
+    def _build_small_test_model(self, temps={"150C": 150}, log_kinetics=False, perf_log=None):
+        test = Isothermal_Monolith_Simulator()
+        if perf_log != None:
+            test.set_performance_log(perf_log)
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+
+        test.add_age_set("Unaged")
+        test.add_temperature_set(list(temps.keys()))
+        test.add_gas_species(["NH3"])
+        test.add_surface_species(["q1"])
+        test.add_surface_sites(["S1"])
+
+        test.set_bulk_porosity(0.3309)
+        test.set_washcoat_porosity(0.4)
+        test.set_reactor_radius(1)
+        test.set_space_velocity_all_runs(500)
+        test.set_cell_density(62)
+
+        test.add_reactions({"r1": ReactionType.EquilibriumArrhenius})
+        test.set_site_balance("S1",{"mol_occupancy": {"q1": 1}})
+        test.set_reaction_info("r1", {"parameters": {"A": 250000, "E": 0, "dH": -55373.27775, "dS": -9.890904876},
+                                      "mol_reactants": {"NH3": 1, "S1": 1},
+                                      "mol_products": {"q1": 1},
+                                      "rxn_orders": {"NH3": 1, "S1": 1, "q1": 1}})
+        test.set_site_density("S1","Unaged",0.1)
+        for temp in temps:
+            test.set_isothermal_temp("Unaged",temp,temps[temp]+273.15)
+        if log_kinetics == True:
+            test.set_log_parameterized_kinetics()
+
+        test.build_constraints()
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=5,elems=5,colpoints=2)
+
+        for temp in temps:
+            test.set_const_IC("NH3","Unaged",temp,0)
+            test.set_const_IC("q1","Unaged",temp,0)
+            test.set_time_dependent_BC("NH3","Unaged",temp,
+                                        time_value_pairs=[(4,6.9e-6)],
+                                        initial_value=0)
+        return test
+
+    @pytest.mark.unit
+    def test_discretizer_restores_gc(self):
+        import gc
+        for gc_enabled in [True, False]:
+            test = Isothermal_Monolith_Simulator()
+            test.add_axial_dim(0,5)
+            test.add_temporal_dim(0,10)
+            test.add_age_set("Unaged")
+            test.add_temperature_set("150C")
+            test.add_gas_species(["NH3"])
+            test.set_bulk_porosity(0.3309)
+            test.set_washcoat_porosity(0.4)
+            test.set_reactor_radius(1)
+            test.set_space_velocity_all_runs(500)
+            test.set_cell_density(62)
+            test.add_reactions({"r1": ReactionType.Arrhenius})
+            test.set_reaction_info("r1", {"parameters": {"A": 100, "E": 0},
+                                          "mol_reactants": {"NH3": 1},
+                                          "mol_products": {},
+                                          "rxn_orders": {"NH3": 1}})
+            test.set_isothermal_temp("Unaged","150C",150+273.15)
+            test.build_constraints()
+
+            if gc_enabled == True:
+                gc.enable()
+            else:
+                gc.disable()
+            try:
+                test.discretize_model(tstep=5, elems=5)
+                assert gc.isenabled() == gc_enabled
+
+                # State is also restored when the discretizer fails part way through
+                #   (pyomo will not apply the same discretization twice)
+                with pytest.raises(ValueError):
+                    test.discretize_model(tstep=5, elems=5)
+                assert gc.isenabled() == gc_enabled
+            finally:
+                gc.enable()
+
+    @pytest.mark.unit
+    def test_windowed_step_helpers(self):
+        test = self._build_small_test_model()
+
+        # Only the inputs that change between the times are listed
+        inputs = test._block_time_inputs("Unaged","150C",4,2)
+        assert [(var.name, val, ref) for (var, val, ref) in inputs] == \
+                [(test.model.Cb["NH3","Unaged","150C",0,4].name, 6.9e-6, 1e-20)]
+        assert test._block_time_inputs("Unaged","150C",8,6) == []
+
+        # Relative change of the states between two times
+        for z in test.model.z:
+            test.model.Cb["NH3","Unaged","150C",z,6].set_value(1e-5)
+            test.model.Cb["NH3","Unaged","150C",z,8].set_value(1.5e-5)
+            test.model.C["NH3","Unaged","150C",z,6].set_value(1e-5)
+            test.model.C["NH3","Unaged","150C",z,8].set_value(1e-5)
+            test.model.q["q1","Unaged","150C",z,6].set_value(0.01)
+            test.model.q["q1","Unaged","150C",z,8].set_value(0.01)
+            test.model.S["S1","Unaged","150C",z,6].set_value(0.09)
+            test.model.S["S1","Unaged","150C",z,8].set_value(0.09)
+        assert pytest.approx(1/3, rel=1e-6) == test._block_step_change("Unaged","150C",8,6)
+
+        # Fixing and unfixing a single time slice
+        test._fix_time_slice("Unaged","150C",8)
+        assert test.model.C["NH3","Unaged","150C",2,8].fixed == True
+        assert test.model.pore_cons["NH3","Unaged","150C",2,8].active == False
+        assert test.model.site_cons["S1","Unaged","150C",2,8].active == False
+        test._unfix_time_slice("Unaged","150C",8)
+        assert test.model.C["NH3","Unaged","150C",2,8].fixed == False
+        assert test.model.pore_cons["NH3","Unaged","150C",2,8].active == True
+        assert test.model.site_cons["S1","Unaged","150C",2,8].active == True
+
+    @pytest.mark.solver
+    def test_windowed_initialization(self):
+        test = self._build_small_test_model()
+        (status, condition) = test.initialize_simulator()
+        assert status == SolverStatus.ok
+
+        windowed = self._build_small_test_model()
+        (status, condition) = windowed.initialize_simulator(windowed_steps=True, max_window=4)
+        assert status == SolverStatus.ok
+
+        # Every time step of the grid is solved, so results are the same
+        for var in test.model.Cb["NH3","Unaged","150C",:,:]:
+            assert pytest.approx(var.value, rel=1e-4, abs=1e-12) == \
+                windowed.model.Cb[var.index()].value
+        for var in test.model.q["q1","Unaged","150C",:,:]:
+            assert pytest.approx(var.value, rel=1e-4, abs=1e-12) == \
+                windowed.model.q[var.index()].value
+
+    @pytest.mark.unit
+    def test_warm_start_helpers(self):
+        temps = {"250C": 250, "150C": 150, "300C": 300, "200C": 200}
+        test = self._build_small_test_model(temps)
+        block_list = [("Unaged", temp) for temp in temps]
+
+        # Blocks are only re-ordered for interpolation (coldest, hottest, then bisection)
+        assert test._warm_start_order(block_list, WarmStartMethod.PreviousTime) == block_list
+        assert test._warm_start_order(block_list, WarmStartMethod.TemperatureInterpolation) == \
+                [("Unaged","150C"), ("Unaged","300C"), ("Unaged","200C"), ("Unaged","250C")]
+
+        # Source blocks and weights
+        solved = [("Unaged","150C"), ("Unaged","300C")]
+        assert test._warm_start_sources("Unaged","200C",solved,WarmStartMethod.PreviousTime) == []
+        assert test._warm_start_sources("Unaged","200C",[],WarmStartMethod.NearestBlock) == []
+        assert test._warm_start_sources("Unaged","200C",solved,WarmStartMethod.NearestBlock) == \
+                [("Unaged","150C",1)]
+        sources = test._warm_start_sources("Unaged","200C",solved,WarmStartMethod.TemperatureInterpolation)
+        assert [(a, t) for (a, t, w) in sources] == solved
+        assert pytest.approx(2/3) == sources[0][2]
+        assert pytest.approx(1/3) == sources[1][2]
+
+        # Only the unknowns of the block are set (not the ICs and BCs)
+        for z in test.model.z:
+            for t in test.model.t:
+                test.model.Cb["NH3","Unaged","150C",z,t].set_value(3e-6)
+                test.model.Cb["NH3","Unaged","300C",z,t].set_value(6e-6)
+        assert test._warm_start_block("Unaged","200C",solved,WarmStartMethod.PreviousTime) == False
+        assert test._warm_start_block("Unaged","200C",solved,WarmStartMethod.TemperatureInterpolation) == True
+        assert pytest.approx(4e-6) == test.model.Cb["NH3","Unaged","200C",1,2].value
+        assert pytest.approx(1e-20) == test.model.Cb["NH3","Unaged","200C",1,0].value
+        assert pytest.approx(6.9e-6) == test.model.Cb["NH3","Unaged","200C",0,4].value
+
+        # Ipopt only writes an output file when the solver stats are needed
+        solver = test._setup_initializer_solver({})
+        assert solver.options.get('output_file') == None
+        solver = test._setup_initializer_solver({}, log_stats=True)
+        assert solver.options['output_file'] == test._solver_log_file()
+        assert solver.options['file_print_level'] == 5
+        solver = test._setup_initializer_solver({'output_file': 'ipopt.log'}, log_stats=True)
+        assert solver.options['output_file'] == 'ipopt.log'
+
+    @pytest.mark.unit
+    def test_shared_rate_constants(self):
+        test = self._build_small_test_model({"150C": 150, "200C": 200})
+        con = test.model.pore_cons["NH3","Unaged","200C",2,6]
+        node_T = test.model.T["Unaged","200C",2,6]
+        assert test._is_rate_const_shared("Unaged","200C") == True
+        assert node_T not in ComponentSet(identify_variables(con.body))
+        assert pytest.approx(value(test.model.kf_rxn["r1","Unaged","200C"])) == \
+                value(arrhenius_rate_const(test.model.Af["r1"], 0, test.model.Ef["r1"], 200+273.15))
+
+        # A temperature ramp switches the block to per node rate constants
+        test.set_temperature_ramp("Unaged","200C",2,8,250+273.15)
+        assert test._is_rate_const_shared("Unaged","200C") == False
+        assert test._is_rate_const_shared("Unaged","150C") == True
+        assert node_T in ComponentSet(identify_variables(con.body))
+
+        # ... and back once the temperature is uniform again
+        test.set_isothermal_temp("Unaged","200C",200+273.15)
+        assert test._is_rate_const_shared("Unaged","200C") == True
+        assert node_T not in ComponentSet(identify_variables(con.body))
+
+        # Temperatures set directly are picked up by the check done before each solve
+        node_T.set_value(250+273.15)
+        test._update_rate_const_sharing()
+        assert test._is_rate_const_shared("Unaged","200C") == False
+        assert node_T in ComponentSet(identify_variables(con.body))
+
+    @pytest.mark.unit
+    def test_shared_rate_constants_from_temperatures(self):
+        test = Isothermal_Monolith_Simulator()
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+        test.add_age_set("Unaged")
+        test.add_temperature_set(["150C","200C"])
+        test.add_gas_species(["NH3"])
+        test.add_reactions({"r1": ReactionType.Arrhenius})
+        test.set_reaction_info("r1", {"parameters": {"A": 1e5, "E": 0, "B": 0},
+                                      "mol_reactants": {"NH3": 1},
+                                      "mol_products": {},
+                                      "rxn_orders": {"NH3": 1}})
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+        test.set_isothermal_temp("Unaged","200C",200+273.15)
+
+        # Sharing is decided from the temperatures at build time (not assumed)
+        test.model.T["Unaged","200C",5,10].set_value(250+273.15)
+        test.build_constraints()
+        assert test._is_rate_const_shared("Unaged","150C") == True
+        assert test._is_rate_const_shared("Unaged","200C") == False
+        con = test.model.pore_cons["NH3","Unaged","200C",5,10]
+        assert test.model.T["Unaged","200C",5,10] in ComponentSet(identify_variables(con.body))
+
+        # Discretization makes each block isothermal again
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=5,elems=5,colpoints=2)
+        assert test._is_rate_const_shared("Unaged","200C") == True
+        con = test.model.pore_cons["NH3","Unaged","200C",2,6]
+        assert test.model.T["Unaged","200C",2,6] not in ComponentSet(identify_variables(con.body))
+
+    @pytest.mark.unit
+    def test_log_parameterized_kinetics(self):
+        assert pytest.approx(value(arrhenius_rate_const(1e10, 0.5, 8e4, 450))) == \
+                value(log_arrhenius_rate_const(np.log(1e10) + 0.5*np.log(400) - 8e4/8.3145/400,
+                                                0.5, 8e4/8.3145/400, 400, 450))
+
+        temps = {"150C": 150, "200C": 200}
+        test = self._build_small_test_model(temps)
+        logs = self._build_small_test_model(temps, log_kinetics=True)
+        with pytest.raises(Exception):
+            logs.set_log_parameterized_kinetics()
+        logs._kinetics_to_log_parameters()
+        assert pytest.approx(175+273.15) == value(logs.model.T_kin_ref)
+        assert pytest.approx(np.log(0.8*250000)) == value(logs.model.lnA_lb["r1"])
+        assert pytest.approx(np.log(1.2*250000)) == value(logs.model.lnA_ub["r1"])
+
+        # Same reaction rates as the standard form
+        for model in [test.model, logs.model]:
+            model.C[:,:,:,:,:].set_value(1e-5)
+            model.q[:,:,:,:,:].set_value(0.01)
+            model.S[:,:,:,:,:].set_value(0.09)
+        for temp in temps:
+            assert pytest.approx(value(test.model.pore_cons["NH3","Unaged",temp,2,6].body)) == \
+                    value(logs.model.pore_cons["NH3","Unaged",temp,2,6].body)
+            assert pytest.approx(value(test.model.surf_cons["q1","Unaged",temp,2,6].body)) == \
+                    value(logs.model.surf_cons["q1","Unaged",temp,2,6].body)
+
+        # Solved values are converted back to A and E
+        logs.model.lnkf_ref["r1"].set_value(logs.model.lnkf_ref["r1"].value + 1)
+        logs._log_parameters_to_kinetics()
+        assert pytest.approx(250000*np.exp(1)) == logs.model.Af["r1"].value
+        assert pytest.approx(0, abs=1e-8) == logs.model.Ef["r1"].value
+
+        # Fixed reactions stay fixed
+        logs.fix_reaction("r1")
+        logs._kinetics_to_log_parameters()
+        assert logs.model.lnkf_ref["r1"].fixed == True
+        assert logs.model.lnA_bounds["r1"].active == False
+
+    @pytest.mark.unit
+    def test_performance_log(self, tmp_path, monkeypatch):
+        ipopt_log = os.path.abspath("sample_ipopt_log.txt")
+        monkeypatch.chdir(tmp_path)
+        test = self._build_small_test_model(perf_log="test_performance_log.jsonl")
+
+        # Every build phase is recorded in memory and in the log file
+        phases = [record["phase"] for record in test.perf_records]
+        assert phases == ["build_constraints", "discretize_time", "discretize_space",
+                            "discretize_model", "build"]
+        with open("output/test_performance_log.jsonl") as file:
+            records = [json.loads(line) for line in file]
+        assert [record["phase"] for record in records] == phases
+        assert all(record["run"] == test.perf_run_id for record in records)
+
+        # Model size is only what the solver sees (active constraints and unfixed vars)
+        build = test.perf_records[-1]
+        assert build["constraints"] == len(list(test.model.component_data_objects(Constraint, active=True)))
+        assert 0 < build["variables"] <= build["nonzeros"]
+        assert build["wall_time"] >= 0
+
+        # Whole build is timed from its own start, so it covers the phases inside it
+        for record in test.perf_records[:-1]:
+            assert build["wall_time"] >= record["wall_time"]
+
+        # Memory is the current (not the peak) memory at the end of each phase
+        assert "peak_memory" not in build
+        if sys.platform.startswith("linux"):
+            assert all(record["memory"] > 0 for record in test.perf_records)
+
+        # Iterations and entries into the restoration phase are read from the Ipopt log
+        #   (sample log was written by Ipopt 3.14 at the same 'file_print_level' as the
+        #   simulator uses, for a small problem that enters the restoration phase 3 times)
+        assert test._read_ipopt_stats(ipopt_log) == {"iterations": 29, "restorations": 3}
+        assert test._read_ipopt_stats(None) == {"iterations": 0, "restorations": 0}
+
+        # Turning off the log stops the records
+        test.set_performance_log(None)
+        test._log_performance("test", TIME.time())
+        assert len(test.perf_records) == 5
+
+    @pytest.mark.unit
+    def test_result_arrays(self):
+        test = self._build_small_test_model(temps={"150C": 150, "200C": 200})
+        for i, vardata in enumerate(test.model.q.values()):
+            vardata.set_value(i)
+
+        # Looking up a single block gives the same values as pulling all blocks
+        full = test.get_result_arrays()
+        block = test.get_result_arrays(["q1","NH3"], ["Unaged"], ["200C"])
+        assert full["temp"] == ["150C", "200C"]
+        assert block["gas"] == ["NH3"] and block["surf"] == ["q1"]
+        assert np.array_equal(full["q"][:,:,1:2], block["q"])
+        assert np.array_equal(full["Cb"][:,:,1:2], block["Cb"])
+        assert np.array_equal(full["T"][:,1:2], block["T"])
+        assert block["q"][0,0,0,2,3] == test.model.q["q1","Unaged","200C",list(test.model.z)[2],list(test.model.t)[3]].value
+
+        node = test.get_result_arrays(["q1"], loc_list=[list(test.model.z)[2]])
+        assert np.array_equal(full["q"][:,:,:,2:3], node["q"])
+        with pytest.raises(Exception):
+            test.get_result_arrays(["q1"], loc_list=[2.2])
+
+    @pytest.mark.unit
+    def test_result_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        test = self._build_small_test_model(temps={"150C": 150, "200C": 200})
+        for i, vardata in enumerate(test.model.Cb.values()):
+            vardata.set_value(i)
+        z = list(test.model.z)[2]
+        t = list(test.model.t)[3]
+
+        # No cache before the model is initialized
+        test.get_result_arrays()
+        assert test.result_cache == None
+
+        # After initializing, all results are cached and sliced for each call
+        test.isInitialized = True
+        block = test.get_result_arrays(["NH3"], ["Unaged"], ["200C"], [z])
+        assert test.result_cache != None
+        assert block["Cb"].shape == (1, 1, 1, 1, len(test.model.t))
+        assert block["Cb"][0,0,0,0,3] == test.model.Cb["NH3","Unaged","200C",z,t].value
+        assert np.array_equal(block["Cb"], test._pull_result_arrays(["NH3"], ["Unaged"], ["200C"], [z])["Cb"])
+
+        # Changing the slices does not change the cache
+        block["Cb"][:] = -1
+        assert test.get_result_arrays(["NH3"], ["Unaged"], ["200C"], [z])["Cb"][0,0,0,0,3] >= 0
+
+        # Cache is only updated when cleared (e.g., by a solve)
+        test.model.Cb["NH3","Unaged","200C",z,t].set_value(-5)
+        assert test.get_result_arrays(["NH3"], ["Unaged"], ["200C"])["Cb"][0,0,0,2,3] != -5
+        test._set_model_values(test._grab_model_values())
+        assert test.result_cache == None
+        assert test.get_result_arrays(["NH3"], ["Unaged"], ["200C"])["Cb"][0,0,0,2,3] == -5
+
+        # Setting new BCs (or ICs or temperatures) also clears the cache
+        assert test.result_cache != None
+        test.set_const_BC("NH3","Unaged","200C",1e-6)
+        assert test.result_cache == None
+        assert test.get_result_arrays(["NH3"], ["Unaged"], ["200C"])["Cb"][0,0,0,0,3] == 1e-6
+
+        # Plots read from the cache
+        test.plot_at_locations(["NH3","q1"], ["Unaged"], ["150C","200C"], [z], file_name="cache_loc_")
+        test.plot_at_times(["NH3","S1"], ["Unaged"], ["200C"], [t], file_name="cache_time_")
+        assert path.exists("output/cache_loc_Plots.png") == True
+        assert path.exists("output/cache_time_Plots.png") == True
+
+    @pytest.mark.solver
+    def test_warm_start_initialization(self):
+        temps = {"150C": 150, "200C": 200, "250C": 250}
+        test = self._build_small_test_model(temps)
+        (status, condition) = test.initialize_simulator()
+        assert status == SolverStatus.ok
+        assert test.init_warm_start_stats == {}
+
+        warm = self._build_small_test_model(temps)
+        (status, condition) = warm.initialize_simulator(warm_start=WarmStartMethod.TemperatureInterpolation,
+                                                        solver_stats=True)
+        assert status == SolverStatus.ok
+        assert str(WarmStartMethod.TemperatureInterpolation) in warm.init_warm_start_stats
+        assert warm.init_warm_start_stats[str(WarmStartMethod.TemperatureInterpolation)]["iterations"] > 0
+        assert os.path.exists(warm._solver_log_file()) == False
+
+        # Warm starts only change the initial guesses, so results are the same
+        for var in test.model.q["q1","Unaged",:,:,:]:
+            assert pytest.approx(var.value, rel=1e-4, abs=1e-12) == \
+                warm.model.q[var.index()].value
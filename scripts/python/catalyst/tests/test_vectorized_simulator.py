@@ -0,0 +1,166 @@
+''' Testing of the vectorized (numpy) forward simulator '''
+import sys
+sys.path.append('../..')
+
+import unittest
+import pytest
+from catalyst.vectorized_monolith_simulator import *
+from pyomo.repn import generate_standard_repn
+
+import logging
+
+__author__ = "Austin Ladshaw"
+
+_log = logging.getLogger(__name__)
+
+# Start test class
+class TestVectorizedMonolithSimulator():
+    @pytest.fixture(scope="class")
+    def isothermal_object(self):
+        obj = Isothermal_Monolith_Simulator()
+        obj.add_axial_dim(0,5)
+        obj.add_temporal_dim(0,60)
+
+        obj.add_age_set("Unaged")
+        obj.add_temperature_set("150C")
+        obj.add_gas_species(["NH3"])
+        obj.add_surface_species(["q1"])
+        obj.add_surface_sites(["S1"])
+
+        obj.set_bulk_porosity(0.3309)
+        obj.set_washcoat_porosity(0.4)
+        obj.set_reactor_radius(1)
+        obj.set_space_velocity_all_runs(1000)
+        obj.set_cell_density(62)
+
+        obj.add_reactions({"r1": ReactionType.EquilibriumArrhenius,
+                            "r2": ReactionType.Arrhenius})
+        obj.set_site_balance("S1",{"mol_occupancy": {"q1": 1}})
+        obj.set_reaction_info("r1",{"parameters": {"A": 2.5e6, "E": 0, "dH": -5e4, "dS": -10},
+                                    "mol_reactants": {"NH3": 1, "S1": 1},
+                                    "mol_products": {"q1": 1},
+                                    "rxn_orders": {"NH3": 1, "S1": 1, "q1": 1}})
+        obj.set_reaction_info("r2",{"parameters": {"A": 1e2, "E": 0},
+                                    "mol_reactants": {"q1": 1},
+                                    "mol_products": {"S1": 1},
+                                    "rxn_orders": {"q1": 1}})
+        obj.set_site_density("S1","Unaged",0.05)
+        obj.set_isothermal_temp("Unaged","150C",423.15)
+
+        obj.build_constraints()
+        obj.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=30,elems=10,colpoints=2)
+
+        obj.set_const_IC("NH3","Unaged","150C",0)
+        obj.set_const_IC("q1","Unaged","150C",0)
+        obj.set_const_BC("NH3","Unaged","150C",6.9e-6)
+        return obj
+
+    @pytest.mark.unit
+    def test_spatial_derivative_matrix(self):
+        z = np.linspace(0,5,11)
+        D = spatial_derivative_matrix(z)
+        y = 2*z + 1
+        assert np.allclose(D.dot(y)[1:], 2)
+
+        # Non-uniform mesh must use the same stencil as the pyomo 'CENTRAL' scheme
+        m = ConcreteModel()
+        m.z = ContinuousSet(initialize=[0,0.5,1.5,3,5])
+        m.y = Var(m.z)
+        m.dy = DerivativeVar(m.y, wrt=m.z)
+        TransformationFactory('dae.finite_difference').apply_to(m,nfe=4,wrt=m.z,scheme='CENTRAL')
+        z = np.array(list(m.z))
+        D = spatial_derivative_matrix(z).toarray()
+        for i in range(1,len(z)-1):
+            repn = generate_standard_repn(m.dy_disc_eq[z[i]].body)
+            coefs = {}
+            for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+                coefs[var.name] = coef
+            for j in range(len(z)):
+                assert D[i,j] == pytest.approx(-coefs.get("y["+str(m.z.at(j+1))+"]", 0))
+
+    @pytest.mark.unit
+    def test_run_simulation(self, isothermal_object):
+        test = isothermal_object
+        sim = Vectorized_Monolith_Simulator(test)
+        results = sim.run_simulation(load_to_model=True)
+
+        block = results["Unaged"]["150C"]
+        assert block["Cb"].shape == (1, len(test.model.z), len(test.model.t))
+        assert block["q"].shape == (1, len(test.model.z), len(test.model.t))
+        assert block["S"].shape == (1, len(test.model.z), len(test.model.t))
+
+        # Inlet is held at the BC and the site balance is satisfied
+        assert np.allclose(block["Cb"][0,0,:], 6.9e-6)
+        assert np.allclose(block["S"] + block["q"], 0.05)
+        assert test.isInitialized == True
+
+        # Loaded values satisfy the pyomo mass balances (same kinetics)
+        cons = {"bulk_cons": "NH3", "pore_cons": "NH3", "surf_cons": "q1", "site_cons": "S1"}
+        for name in cons:
+            con = test.model.component(name)[cons[name],"Unaged","150C",2.5,60]
+            scale = max(abs(value(con.body)), 1e-6)
+            assert abs(value(con.body) - value(con.upper)) <= 1e-6*scale + 1e-12
+
+    @pytest.mark.unit
+    def test_load_clears_result_cache(self, isothermal_object):
+        test = isothermal_object
+        sim = Vectorized_Monolith_Simulator(test)
+        results = sim.run_simulation(load_to_model=True)
+        test.get_result_arrays(["NH3"])
+        assert test.result_cache != None
+
+        # Results loaded again into the model replace any cached results
+        results["Unaged"]["150C"]["Cb"][:,1:,:] *= 2
+        sim.load_results_to_model()
+        assert test.result_cache == None
+        assert np.array_equal(test.get_result_arrays(["NH3"])["Cb"][:,0,0], results["Unaged"]["150C"]["Cb"])
+
+    @pytest.mark.unit
+    def test_invalid_method(self, isothermal_object):
+        sim = Vectorized_Monolith_Simulator(isothermal_object)
+        with pytest.raises(Exception):
+            sim.run_simulation(method="RK45")
+
+    @pytest.mark.unit
+    def test_reaction_rates_not_clipped(self, isothermal_object):
+        sim = Vectorized_Monolith_Simulator(isothermal_object)
+        # Rows are (NH3, q1, S1) at two nodes, with a small negative undershoot
+        Y = np.array([[-1e-9, 1e-6], [0.01, -1e-8], [0.04, 0.05]])
+        T = np.array([423.15, 423.15])
+        r = sim.reaction_rates(Y, T)
+
+        (Ar, Er) = equilibrium_arrhenius_consts(2.5e6, 0, -5e4, -10)
+        kf = arrhenius_rate_const(2.5e6, 0, 0, 423.15)
+        kr = value(arrhenius_rate_const(Ar, 0, Er, 423.15))
+        assert np.allclose(r[0,:], kf*Y[0,:]*Y[2,:] - kr*Y[1,:], rtol=1e-10, atol=0)
+        assert np.allclose(r[1,:], 1e2*Y[1,:], rtol=1e-10, atol=0)
+        assert r[1,1] < 0
+
+    @pytest.mark.unit
+    def test_requires_finite_difference(self):
+        obj = Isothermal_Monolith_Simulator()
+        obj.add_axial_dim(0,5)
+        obj.add_temporal_dim(0,60)
+        obj.add_age_set("Unaged")
+        obj.add_temperature_set("150C")
+        obj.add_gas_species(["NH3"])
+        obj.set_bulk_porosity(0.3309)
+        obj.set_washcoat_porosity(0.4)
+        obj.set_reactor_radius(1)
+        obj.set_space_velocity_all_runs(1000)
+        obj.set_cell_density(62)
+        obj.add_reactions({"r1": ReactionType.Arrhenius})
+        obj.set_reaction_info("r1",{"parameters": {"A": 1e2, "E": 0},
+                                    "mol_reactants": {"NH3": 1},
+                                    "mol_products": {},
+                                    "rxn_orders": {"NH3": 1}})
+        obj.set_isothermal_temp("Unaged","150C",423.15)
+        obj.build_constraints()
+        obj.discretize_model(method=DiscretizationMethod.OrthogonalCollocation,
+                            tstep=30,elems=5,colpoints=2)
+        obj.set_const_IC("NH3","Unaged","150C",0)
+        obj.set_const_BC("NH3","Unaged","150C",6.9e-6)
+
+        with pytest.raises(ValueError):
+            Vectorized_Monolith_Simulator(obj)
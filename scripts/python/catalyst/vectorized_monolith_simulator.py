@@ -0,0 +1,391 @@
+'''
+    This file creates an object to run forward simulations of the
+    isothermal monolith catalysis model without going through pyomo
+    and ipopt. The kinetics and mass balances are evaluated as batched
+    numpy array operations over all species and nodes (z) at each time
+    level. The resulting method-of-lines system is integrated with an
+    implicit (stiff) integrator from scipy using a sparse Jacobian.
+
+    This is primarily intended for pure simulations with fixed kinetic
+    parameters (or for generating initial guesses for the pyomo model).
+    The user must first build the model through the standard interface
+    of the Isothermal_Monolith_Simulator (up to and including setting
+    temperatures, ICs, and BCs after 'discretize_model').
+
+    Author:     Austin Ladshaw
+    Date:       03/02/2021
+    Copyright:  This kernel was designed and built at Oak Ridge National
+                Laboratory by Austin Ladshaw for research in the area
+                of adsorption, catalysis, and surface science.
+'''
+
+from catalyst.isothermal_monolith_catalysis import *
+
+# Import the scipy integrator and sparse tools
+from scipy.integrate import solve_ivp
+from scipy import sparse
+
+# Ideal gas constant (J/K/mol) used in the Arrhenius expressions
+_R_GAS = 8.3145
+
+# Helper function for vectorized Arrhenius rate constants
+#       Same as 'arrhenius_rate_const', but accepts numpy arrays for T
+def vectorized_arrhenius_rate_const(A, B, E, T):
+    return A*T**B*np.exp(-E/_R_GAS/T)
+
+# Helper function to linearly interpolate the last axis of an array in time
+#       arr = numpy array with last dimension equal to len(times)
+#       times = numpy array of (sorted) time points
+#       time = time to interpolate at
+def _interp_last_axis(arr, times, time):
+    if time <= times[0]:
+        return arr[...,0]
+    if time >= times[-1]:
+        return arr[...,-1]
+    i = np.searchsorted(times, time)
+    w = (time - times[i-1])/(times[i] - times[i-1])
+    return arr[...,i-1]*(1-w) + arr[...,i]*w
+
+# Helper function to build a sparse first derivative operator in space
+#       Uses the same central difference as the 'CENTRAL' pyomo scheme at
+#       interior nodes, (y[i+1]-y[i-1])/(z[i+1]-z[i-1]), so that results
+#       match the pyomo model on non-uniform meshes too, and a backwards
+#       difference at the last node (same as the 'dCbdz_edge' constraint).
+#       The first node is not used (it is the boundary condition).
+def spatial_derivative_matrix(z):
+    nz = len(z)
+    D = sparse.lil_matrix((nz, nz))
+    for i in range(1, nz-1):
+        D[i,i-1] = -1/(z[i+1]-z[i-1])
+        D[i,i+1] = 1/(z[i+1]-z[i-1])
+    D[nz-1,nz-2] = -1/(z[nz-1]-z[nz-2])
+    D[nz-1,nz-1] = 1/(z[nz-1]-z[nz-2])
+    return D.tocsr()
+
+# Class object for the vectorized (numpy) forward simulation
+#
+#       State variables (per age/temp block) are stored as 2D arrays
+#       of shape (species, z) and flattened into a single vector of:
+#
+#           [Cb (excluding z=0), C, q]
+#
+#       Site balances are algebraic and are substituted directly:
+#
+#           S = Smax - SUM(all qi, u_si*qi)
+#
+#       Results are held in 'self.results[age][temp]' as a dictionary
+#       of numpy arrays with shape (species, z, t) for Cb, C, q, and S.
+class Vectorized_Monolith_Simulator(object):
+    #Default constructor
+    # Pass a discretized Isothermal_Monolith_Simulator object
+    def __init__(self, simulator):
+        if simulator.isDiscrete == False:
+            raise Exception("Error! Must discretize the model before creating a vectorized simulator")
+        # Spatial derivatives are only built for the finite difference scheme
+        if simulator.DiscType != "DiscretizationMethod.FiniteDifference":
+            raise ValueError("Error! Vectorized simulator requires a model discretized with "
+                            +"DiscretizationMethod.FiniteDifference. "+str(simulator.DiscType)+" given is not supported")
+        for spec in simulator.model.gas_set:
+            for age in simulator.model.age_set:
+                for temp in simulator.model.T_set:
+                    if simulator.isBoundarySet[spec][age][temp] == False:
+                        raise Exception("Error! Must specify boundaries before attempting to simulate. "
+                                        +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
+        if simulator.isSurfSpecSet == True:
+            for spec in simulator.model.surf_set:
+                for age in simulator.model.age_set:
+                    for temp in simulator.model.T_set:
+                        if simulator.isInitialSet[spec][age][temp] == False:
+                            raise Exception("Error! Must specify initial conditions before attempting to simulate. "
+                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+        if simulator.isIsothermalTempSet == False:
+            raise Exception("Error! Cannot simulate if temperatures are not set first")
+        if hasattr(simulator, "isIsothermal"):
+            for age in simulator.isIsothermal:
+                for temp in simulator.isIsothermal[age]:
+                    if simulator.isIsothermal[age][temp] == False:
+                        raise Exception("Error! Vectorized simulator does not support energy balances. "
+                                        +str(age)+","+str(temp)+" given is not isothermal")
+        if simulator.isVelocityRecalculated == False:
+            simulator.recalculate_linear_velocities(interally_called=True,isMonolith=simulator.isMonolith)
+
+        self.simulator = simulator
+        self.results = {}
+        self.simulate_time = 0
+        self.isSimulated = False
+        self._grab_model_info()
+
+    # Grab all parameters and reaction info from the pyomo model (only done once)
+    def _grab_model_info(self):
+        m = self.simulator.model
+        self.gas_list = list(m.gas_set)
+        self.surf_list = []
+        self.site_list = []
+        if self.simulator.isSurfSpecSet == True:
+            self.surf_list = list(m.surf_set)
+            if self.simulator.isSitesSet == True:
+                self.site_list = list(m.site_set)
+        self.age_list = list(m.age_set)
+        self.temp_list = list(m.T_set)
+        self.z = np.array(list(m.z))
+        self.t = np.array(list(m.t))
+        self.D = spatial_derivative_matrix(self.z)
+
+        self.eb = value(m.eb)
+        self.ew = value(m.ew)
+        self.Ga = value(m.Ga)
+        if self.simulator.isReactionSetByTotalVolume == False:
+            self.f = 1-self.eb
+        else:
+            self.f = 1
+
+        # Map each species name to a row in the combined (C, q, S) array
+        spec_list = self.gas_list + self.surf_list + self.site_list
+        self.spec_index = {}
+        for i, spec in enumerate(spec_list):
+            self.spec_index[spec] = i
+
+        # Reaction info (reactant/product rows and orders)
+        self.rxn_list = list(m.all_rxns)
+        self.rxn_info = []
+        for rxn in self.rxn_list:
+            info = {}
+            reactants = list(m.component(rxn+"_reactants"))
+            products = list(m.component(rxn+"_products"))
+            info["reactants"] = np.array([self.spec_index[s] for s in reactants], dtype=int)
+            info["reactant_orders"] = np.array([value(m.rxn_orders[rxn,s]) for s in reactants])
+            if rxn in m.arrhenius_rxns:
+                info["type"] = ReactionType.Arrhenius
+                info["A"] = value(m.A[rxn])
+                info["B"] = value(m.B[rxn])
+                info["E"] = value(m.E[rxn])
+            else:
+                info["type"] = ReactionType.EquilibriumArrhenius
+                info["products"] = np.array([self.spec_index[s] for s in products], dtype=int)
+                info["product_orders"] = np.array([value(m.rxn_orders[rxn,s]) for s in products])
+                info["Af"] = value(m.Af[rxn])
+                info["Ef"] = value(m.Ef[rxn])
+                (Ar, Er) = equilibrium_arrhenius_consts(value(m.Af[rxn]), value(m.Ef[rxn]),
+                                                        value(m.dH[rxn]), value(m.dS[rxn]))
+                info["Ar"] = value(Ar)
+                info["Er"] = value(Er)
+            self.rxn_info.append(info)
+
+        # Stoichiometry arrays of shape (species, rxn, z)
+        nz = len(self.z)
+        nr = len(self.rxn_list)
+        self.u_C = np.zeros((len(self.gas_list), nr, nz))
+        for i, spec in enumerate(self.gas_list):
+            for j, rxn in enumerate(self.rxn_list):
+                self.u_C[i,j,:] = [value(m.u_C[spec,rxn,loc]) for loc in m.z]
+        self.u_q = np.zeros((len(self.surf_list), nr, nz))
+        for i, spec in enumerate(self.surf_list):
+            for j, rxn in enumerate(self.rxn_list):
+                self.u_q[i,j,:] = [value(m.u_q[spec,rxn,loc]) for loc in m.z]
+        self.u_S = np.zeros((len(self.site_list), len(self.surf_list)))
+        for i, site in enumerate(self.site_list):
+            for j, spec in enumerate(self.surf_list):
+                self.u_S[i,j] = value(m.u_S[site,spec])
+
+    # Grab the time varying inputs and initial conditions of an (age, temp) block
+    def _grab_block_inputs(self, age, temp):
+        m = self.simulator.model
+        inputs = {}
+        inputs["T"] = np.array([[value(m.T[age,temp,loc,time]) for time in m.t] for loc in m.z])
+        inputs["v"] = np.array([[value(m.v[age,temp,loc,time]) for time in m.t] for loc in m.z])
+        inputs["km"] = np.array([[[value(m.km[spec,age,temp,loc,time]) for time in m.t] for loc in m.z] for spec in self.gas_list])
+        inputs["Cb_in"] = np.array([[value(m.Cb[spec,age,temp,m.z.first(),time]) for time in m.t] for spec in self.gas_list])
+        if len(self.site_list) > 0:
+            inputs["Smax"] = np.array([[[value(m.Smax[site,age,loc,time]) for time in m.t] for loc in m.z] for site in self.site_list])
+        inputs["Cb0"] = np.array([[value(m.Cb[spec,age,temp,loc,m.t.first()]) for loc in m.z] for spec in self.gas_list])
+        inputs["C0"] = np.array([[value(m.C[spec,age,temp,loc,m.t.first()]) for loc in m.z] for spec in self.gas_list])
+        inputs["q0"] = np.array([[value(m.q[spec,age,temp,loc,m.t.first()]) for loc in m.z] for spec in self.surf_list])
+        return inputs
+
+    # Function to compute open sites from surface species
+    #       q = array of shape (surf, z)
+    #       Smax = array of shape (site, z)
+    def site_balance(self, q, Smax):
+        return Smax - self.u_S.dot(q)
+
+    # Function to compute all reaction rates
+    #       Y = array of shape (species, z) holding C, q, and S rows
+    #       T = array of temperatures (z)
+    #
+    #       Returns an array of rates with shape (rxn, z)
+    #
+    #   NOTE: Concentrations are used as given (no clipping of negative values),
+    #           which is the same as the rate expressions in the pyomo model
+    def reaction_rates(self, Y, T):
+        r = np.zeros((len(self.rxn_info), Y.shape[1]))
+        for j, info in enumerate(self.rxn_info):
+            if info["type"] == ReactionType.Arrhenius:
+                k = vectorized_arrhenius_rate_const(info["A"], info["B"], info["E"], T)
+                r[j,:] = k*np.prod(Y[info["reactants"],:]**info["reactant_orders"][:,None], axis=0)
+            else:
+                kf = vectorized_arrhenius_rate_const(info["Af"], 0, info["Ef"], T)
+                kr = vectorized_arrhenius_rate_const(info["Ar"], 0, info["Er"], T)
+                rf = kf*np.prod(Y[info["reactants"],:]**info["reactant_orders"][:,None], axis=0)
+                rr = kr*np.prod(Y[info["products"],:]**info["product_orders"][:,None], axis=0)
+                r[j,:] = rf - rr
+        return r
+
+    # Function to split the state vector into (Cb, C, q) arrays
+    def _unpack(self, y, Cb_in):
+        ng = len(self.gas_list)
+        nq = len(self.surf_list)
+        nz = len(self.z)
+        nb = ng*(nz-1)
+        Cb = np.empty((ng, nz))
+        Cb[:,0] = Cb_in
+        Cb[:,1:] = y[0:nb].reshape(ng, nz-1)
+        C = y[nb:nb+ng*nz].reshape(ng, nz)
+        q = y[nb+ng*nz:nb+ng*nz+nq*nz].reshape(nq, nz)
+        return (Cb, C, q)
+
+    # Function to evaluate the time derivatives of all states
+    #       Returns a tuple of arrays (dCb_dt, dC_dt, dq_dt, dCb_dz, S)
+    def _derivatives(self, time, Cb, C, q, inputs):
+        T = _interp_last_axis(inputs["T"], self.t, time)
+        v = _interp_last_axis(inputs["v"], self.t, time)
+        km = _interp_last_axis(inputs["km"], self.t, time)
+        if len(self.site_list) > 0:
+            S = self.site_balance(q, _interp_last_axis(inputs["Smax"], self.t, time))
+        else:
+            S = np.zeros((0, len(self.z)))
+
+        r = self.reaction_rates(np.vstack((C, q, S)), T)
+        dCb_dz = self.D.dot(Cb.T).T
+        mass_transfer = self.Ga*km*(Cb - C)
+
+        dCb_dt = -v*dCb_dz - (1-self.eb)/self.eb*mass_transfer
+        dC_dt = ((1-self.eb)*mass_transfer + self.f*np.einsum('irz,rz->iz', self.u_C, r))/(self.ew*(1-self.eb))
+        dq_dt = np.einsum('irz,rz->iz', self.u_q, r)
+        return (dCb_dt, dC_dt, dq_dt, dCb_dz, S)
+
+    # Function to evaluate the right-hand side of the ODE system
+    def _rhs(self, time, y, inputs):
+        Cb_in = _interp_last_axis(inputs["Cb_in"], self.t, time)
+        (Cb, C, q) = self._unpack(y, Cb_in)
+        (dCb_dt, dC_dt, dq_dt, dCb_dz, S) = self._derivatives(time, Cb, C, q, inputs)
+        return np.concatenate((dCb_dt[:,1:].ravel(), dC_dt.ravel(), dq_dt.ravel()))
+
+    # Function to build the sparsity pattern of the Jacobian
+    #       All states at a node are coupled through the kinetics and
+    #       the bulk concentrations are coupled to their neighbors
+    def jacobian_sparsity(self):
+        ng = len(self.gas_list)
+        nq = len(self.surf_list)
+        nz = len(self.z)
+        # Node of each entry in the state vector
+        node = np.concatenate((np.tile(np.arange(1,nz), ng), np.tile(np.arange(nz), ng+nq)))
+        rows = []
+        cols = []
+        for k in range(nz):
+            idx = np.where(node == k)[0]
+            rows.append(np.repeat(idx, len(idx)))
+            cols.append(np.tile(idx, len(idx)))
+        # Bulk concentrations at neighboring nodes (same species)
+        for i in range(ng):
+            bulk = np.arange(i*(nz-1), (i+1)*(nz-1))
+            rows += [bulk[1:], bulk[:-1]]
+            cols += [bulk[:-1], bulk[1:]]
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        n = len(node)
+        return sparse.csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n,n))
+
+    # Function to run the simulation for an (age, temp) block
+    def _simulate_block(self, age, temp, method, rtol, atol, max_step):
+        inputs = self._grab_block_inputs(age, temp)
+        y0 = np.concatenate((inputs["Cb0"][:,1:].ravel(), inputs["C0"].ravel(), inputs["q0"].ravel()))
+
+        sol = solve_ivp(self._rhs, (self.t[0], self.t[-1]), y0, method=method,
+                        t_eval=self.t, args=(inputs,), rtol=rtol, atol=atol,
+                        max_step=max_step, jac_sparsity=self.jacobian_sparsity())
+        if sol.success == False:
+            raise Exception("Error! Integration failed for " + str(age) + " -> " + str(temp)
+                            + ": " + str(sol.message))
+
+        ng = len(self.gas_list)
+        nq = len(self.surf_list)
+        ns = len(self.site_list)
+        nz = len(self.z)
+        nt = len(self.t)
+        block = {"Cb": np.zeros((ng,nz,nt)), "C": np.zeros((ng,nz,nt)),
+                 "q": np.zeros((nq,nz,nt)), "S": np.zeros((ns,nz,nt)),
+                 "dCb_dt": np.zeros((ng,nz,nt)), "dC_dt": np.zeros((ng,nz,nt)),
+                 "dq_dt": np.zeros((nq,nz,nt)), "dCb_dz": np.zeros((ng,nz,nt))}
+        for k, time in enumerate(self.t):
+            (Cb, C, q) = self._unpack(sol.y[:,k], inputs["Cb_in"][:,k])
+            (dCb_dt, dC_dt, dq_dt, dCb_dz, S) = self._derivatives(time, Cb, C, q, inputs)
+            block["Cb"][:,:,k] = Cb
+            block["C"][:,:,k] = C
+            block["q"][:,:,k] = q
+            block["S"][:,:,k] = S
+            block["dCb_dt"][:,:,k] = dCb_dt
+            block["dC_dt"][:,:,k] = dC_dt
+            block["dq_dt"][:,:,k] = dq_dt
+            block["dCb_dz"][:,:,k] = dCb_dz
+        # Inlet concentrations are set by BCs (not by the PDE), so use the
+        #   same backwards difference in time as the discretized model
+        block["dCb_dt"][:,0,0] = 0
+        block["dCb_dt"][:,0,1:] = np.diff(inputs["Cb_in"], axis=1)/np.diff(self.t)
+        return block
+
+    # Function to run the simulation
+    #       method = implicit integrator to use from scipy ('BDF' or 'Radau')
+    #       rtol = relative tolerance of the integrator
+    #       atol = absolute tolerance of the integrator
+    #       max_step = maximum time step size (useful for sharp step changes in BCs)
+    #       load_to_model = if True, results are loaded into the pyomo model
+    def run_simulation(self, method="BDF", rtol=1e-6, atol=1e-12, max_step=np.inf, load_to_model=False):
+        if method not in ["BDF", "Radau"]:
+            raise Exception("Error! Invalid integrator method. "
+                            +str(method)+ " given is not a supported stiff integrator ('BDF' or 'Radau')")
+        start = TIME.time()
+        for age in self.age_list:
+            self.results[age] = {}
+            for temp in self.temp_list:
+                print("Simulating for " + str(age) + " -> " + str(temp))
+                self.results[age][temp] = self._simulate_block(age, temp, method, rtol, atol, max_step)
+        self.isSimulated = True
+        self.simulate_time = TIME.time() - start
+        print("\tComplete! Elapsed time (s) = "+str(self.simulate_time))
+
+        if load_to_model == True:
+            self.load_results_to_model()
+        return self.results
+
+    # Function to load results of the simulation into the pyomo model
+    #       After loading, the model is considered initialized, so the
+    #       standard print/plot functions (or 'run_solver') can be used.
+    def load_results_to_model(self):
+        if self.isSimulated == False:
+            raise Exception("Error! Cannot load results before running the simulation")
+        self.simulator.clear_result_cache()
+        m = self.simulator.model
+        var_list = ["Cb", "C", "dCb_dt", "dC_dt", "dCb_dz"]
+        spec_lists = {"Cb": self.gas_list, "C": self.gas_list, "dCb_dt": self.gas_list,
+                      "dC_dt": self.gas_list, "dCb_dz": self.gas_list}
+        if self.simulator.isSurfSpecSet == True:
+            var_list += ["q", "dq_dt"]
+            spec_lists["q"] = self.surf_list
+            spec_lists["dq_dt"] = self.surf_list
+            if self.simulator.isSitesSet == True:
+                var_list += ["S"]
+                spec_lists["S"] = self.site_list
+        for age in self.age_list:
+            for temp in self.temp_list:
+                block = self.results[age][temp]
+                for name in var_list:
+                    var = m.component(name)
+                    for i, spec in enumerate(spec_lists[name]):
+                        for j, loc in enumerate(m.z):
+                            for k, time in enumerate(m.t):
+                                if name != "Cb" or j > 0:
+                                    var[spec,age,temp,loc,time].set_value(block[name][i,j,k])
+                # Keep dCb_dt fixed at z=0 and t=0 (as in the discretizer)
+                for spec in self.gas_list:
+                    m.dCb_dt[spec,age,temp,m.z.first(),m.t.first()].set_value(0)
+        self.simulator.isInitialized = True
@@ -0,0 +1,230 @@
+''' Testing of the TransientData reader and its accessors '''
+import sys
+sys.path.append('../..')
+
+import pytest
+import numpy as np
+import os
+import math
+from labview_processing.transient_data import TransientData, PairedTransientData, set_data_cache, disable_data_cache
+
+## Name of the sample file (follows the CLEERS file naming convention)
+sample_name = "20160209-CLRK-BASFCuSSZ13-700C4h-NH3H2Ocomp-30k-0_2pctO2-150C.dat"
+
+## Helper function to write a small sample data file
+#
+#   The file has a numeric column, a text column, and a repeat of the column names
+#   (i.e., a change in input conditions) halfway down the file.
+def write_sample_file(path, num_rows = 12):
+    header = "Elapsed Time (min)\tNH3 (300)\tT (C)\tStatus\t\n"
+    lines = ["Sample LabVIEW data file\n", header]
+    for i in range(num_rows):
+        if i == num_rows//2:
+            lines.append(header)
+        if i < num_rows//2:
+            nh3 = round(0.5*i*i - 2.0*i, 3)
+            status = "ramp"
+        else:
+            nh3 = round(30 + 0.75*i, 3)
+            status = "hold"
+        lines.append(str(round(0.25*i, 2)) + "\t" + str(nh3) + "\t" + str(150 + i % 3) + "\t" + status + "\t\n")
+    with open(path, "w") as file:
+        file.writelines(lines)
+    return str(path)
+
+@pytest.fixture
+def sample_file(tmp_path):
+    disable_data_cache()
+    return write_sample_file(tmp_path / sample_name)
+
+@pytest.fixture
+def cache_folder(tmp_path):
+    folder = str(tmp_path / "cache")
+    set_data_cache(folder)
+    yield folder
+    disable_data_cache()
+
+## Helper function to list the files in the data cache
+def cache_files(folder):
+    return sorted(file for file in os.listdir(folder) if file.endswith(".npz"))
+
+# Expected values were produced by the list based reader (before columns were stored as numpy arrays)
+@pytest.mark.unit
+def test_read_sample_file(sample_file):
+    obj = TransientData(sample_file)
+    assert obj.time_key == "Elapsed Time (min)"
+    assert obj.getNumRows() == 12
+    assert obj.getNumCols() == 4
+    assert obj.getTimeFrames() == [(0, 1.25), (1.25, 2.75)]
+    assert list(obj.data_map[obj.time_key]) == [0.25*i for i in range(12)]
+    assert list(obj.data_map["NH3 (300)"]) == [0.0, -1.5, -2.0, -1.5, 0.0, 2.5, 34.5, 35.25, 36.0, 36.75, 37.5, 38.25]
+    assert list(obj.data_map["T (C)"]) == [150.0, 151.0, 152.0]*4
+    assert obj.data_map["Status"] == ["ramp"]*6 + ["hold"]*6
+
+@pytest.mark.unit
+def test_sample_accessors(sample_file):
+    obj = TransientData(sample_file)
+    assert obj.getMaximum("NH3 (300)") == 38.25
+    assert obj.getMinimum("NH3 (300)") == -2.0
+    assert obj.getAverage("NH3 (300)") == pytest.approx(17.979166666666668)
+    assert obj.getDataRange("T (C)") == 2.0
+    assert obj.getMaximum("Bad Key") == None
+
+    rows = obj.extractRows(0.5, 1.5)
+    assert list(rows[obj.time_key]) == [0.5, 0.75, 1.0, 1.25, 1.5]
+    assert list(rows["NH3 (300)"]) == [-2.0, -1.5, 0.0, 2.5, 34.5]
+    assert list(rows["T (C)"]) == [152.0, 150.0, 151.0, 152.0, 150.0]
+    assert rows["Status"] == ["ramp", "ramp", "ramp", "ramp", "hold"]
+
+@pytest.mark.unit
+def test_sample_data_points(sample_file):
+    obj = TransientData(sample_file)
+    times = [0, 0.1, 0.5, 1.3, 1.4, 2.75, 3.0]
+    expected = {}
+    expected["NH3 (300)"] = [0.0, -0.6, -2.0, 8.9, 21.7, 38.25, 38.25]
+    expected["T (C)"] = [150.0, 150.4, 152.0, 151.6, 150.8, 152.0, 152.0]
+    expected["Status"] = ["ramp", "ramp", "ramp", "hold", "hold", "hold", "hold"]
+    points = obj.getDataPoints(times, list(expected.keys()))
+    for name in expected:
+        assert [obj.getDataPoint(time, name) for time in times] == pytest.approx(expected[name])
+        assert list(points[name]) == pytest.approx(expected[name])
+    assert list(obj.getDataPoints(times, "T (C)")) == pytest.approx(expected["T (C)"])
+    assert obj.getDataPoints(times, "Bad Key") == None
+
+@pytest.mark.unit
+def test_cache_round_trip(sample_file, cache_folder, monkeypatch):
+    uncached = TransientData(sample_file, use_cache=False)
+    assert cache_files(cache_folder) == []
+    TransientData(sample_file)
+    assert len(cache_files(cache_folder)) == 1
+
+    #The second read must come from the cache
+    def fail_read(self):
+        raise Exception("Error! File was re-parsed instead of read from the cache!")
+    monkeypatch.setattr(TransientData, "readFile", fail_read)
+    cached = TransientData(sample_file)
+    assert cached.exp_header == uncached.exp_header
+    assert cached.time_key == uncached.time_key
+    assert cached.ordered_key_list == uncached.ordered_key_list
+    assert cached.change_time == uncached.change_time
+    assert cached.time_frames == uncached.time_frames
+    assert cached.getNumRows() == uncached.getNumRows()
+    assert list(cached.data_map.keys()) == list(uncached.data_map.keys())
+    for name in uncached.data_map:
+        assert type(cached.data_map[name]) == type(uncached.data_map[name])
+        assert list(cached.data_map[name]) == list(uncached.data_map[name])
+
+@pytest.mark.unit
+def test_cache_rebuilt_after_source_changes(sample_file, cache_folder):
+    old = TransientData(sample_file)
+    old_path = old.cachePath()
+    assert os.path.exists(old_path)
+
+    #Rewrite the file with more rows and make sure the modification time changes
+    write_sample_file(sample_file, num_rows = 16)
+    statinfo = os.stat(sample_file)
+    os.utime(sample_file, ns=(statinfo.st_atime_ns, statinfo.st_mtime_ns + 10**9))
+    new = TransientData(sample_file)
+    assert new.cachePath() != old_path
+    assert new.getNumRows() == 16
+    assert new.getTimeFrames() == [(0, 1.75), (1.75, 3.75)]
+    assert list(new.data_map[new.time_key]) == list(TransientData(sample_file, use_cache=False).data_map[new.time_key])
+    assert len(cache_files(cache_folder)) == 2
+
+@pytest.mark.unit
+def test_cache_eviction_at_size_limit(tmp_path, cache_folder):
+    paths = []
+    for temp in ["150C", "200C", "250C"]:
+        file = write_sample_file(tmp_path / sample_name.replace("150C", temp))
+        paths.append(TransientData(file).cachePath())
+    sizes = [os.stat(path).st_size for path in paths]
+
+    #Mark the files as used from oldest to newest, then shrink the cache to fit only two files
+    for i in range(len(paths)):
+        os.utime(paths[i], (1000000 + i, 1000000 + i))
+    set_data_cache(cache_folder, max_size = (sizes[1] + sizes[2] + sizes[0]/2)/1E6)
+    assert os.path.exists(paths[0]) == False
+    assert os.path.exists(paths[1]) == True
+    assert os.path.exists(paths[2]) == True
+
+    #Writing a new file evicts the least recently used file, but never the new file
+    os.utime(paths[1], (2000000, 2000000))
+    file = write_sample_file(tmp_path / sample_name.replace("150C", "300C"))
+    path = TransientData(file).cachePath()
+    assert cache_files(cache_folder) == sorted(os.path.basename(item) for item in [paths[1], path])
+
+@pytest.mark.unit
+def test_align_cache_matches_uncached(tmp_path, cache_folder, monkeypatch):
+    #Frames are long enough that the bypass columns get scaled by frame ratios other than 1
+    bypass_file = write_sample_file(tmp_path / sample_name.replace("150C", "bp"), num_rows = 48)
+    result_file = write_sample_file(tmp_path / sample_name, num_rows = 40)
+    uncached = PairedTransientData(bypass_file, result_file, use_cache = False)
+    uncached.compressColumns()
+    uncached.alignData(addNoise = False)
+    assert cache_files(cache_folder) == []
+    first = PairedTransientData(bypass_file, result_file)
+    first.compressColumns()
+    first.alignData(addNoise = False)
+    assert len(cache_files(cache_folder)) == 3
+
+    #The second alignment must come from the cache
+    def fail_autoreg(self, data_key, avg_points = 10, non_neg = True):
+        raise Exception("Error! Data was re-aligned instead of read from the cache!")
+    monkeypatch.setattr(TransientData, "autoregChangedInput", fail_autoreg)
+    cached = PairedTransientData(bypass_file, result_file)
+    cached.compressColumns()
+    cached.alignData(addNoise = False)
+    assert cached.aligned == True
+    for side in ["bypass_trans_obj", "result_trans_obj"]:
+        obj = getattr(cached, side)
+        ref = getattr(uncached, side)
+        assert obj.getNumRows() == ref.getNumRows()
+        assert obj.input_change == ref.input_change
+        assert list(obj.data_map.keys()) == list(ref.data_map.keys())
+        for name in ref.data_map:
+            assert list(obj.data_map[name]) == list(ref.data_map[name])
+
+    #Bypass columns of the results hold the scaled bypass data
+    raw = TransientData(bypass_file, use_cache = False).data_map["NH3 (300)"]
+    scaled = cached.result_trans_obj.data_map["NH3 (300)[bypass]"]
+    assert list(scaled) == list(cached.bypass_trans_obj.data_map["NH3 (300)"])
+    assert list(scaled) != pytest.approx(list(raw[0:len(scaled)]))
+
+## Helper function to check that two TransientData objects hold the same frame of data
+def assert_same_frame(obj, ref):
+    assert obj.time_key == ref.time_key
+    assert obj.getNumRows() == ref.getNumRows()
+    assert obj.change_time == ref.change_time
+    assert obj.time_frames == ref.time_frames
+    assert list(obj.data_map.keys()) == list(ref.data_map.keys())
+    for name in ref.data_map:
+        assert type(obj.data_map[name]) == type(ref.data_map[name])
+        assert list(obj.data_map[name]) == pytest.approx(list(ref.data_map[name]))
+
+@pytest.mark.unit
+@pytest.mark.parametrize("partial_line", [False, True])
+def test_stream_matches_full_reader(sample_file, partial_line, monkeypatch):
+    if partial_line == True:
+        #Last line of the file was cut off mid-row (no trailing columns or newline)
+        with open(sample_file, "a") as file:
+            file.write("3.0\t40.5")
+    #Read in small chunks so that rows span several chunks
+    monkeypatch.setattr(TransientData.readFileStream, "__defaults__", (1, None, 64))
+
+    full = TransientData(sample_file)
+    stream = TransientData(sample_file, time_window = (-math.inf, math.inf))
+    assert_same_frame(stream, full)
+    assert full.getNumRows() == (13 if partial_line == True else 12)
+
+    compressed = TransientData(sample_file, stream_factor = 2)
+    full.compressRows(2)
+    assert_same_frame(compressed, full)
+
+@pytest.mark.unit
+def test_stream_time_window(sample_file):
+    full = TransientData(sample_file)
+    stream = TransientData(sample_file, time_window = (0.5, 1.5))
+    rows = full.extractRows(0.5, 1.5)
+    assert stream.getNumRows() == 5
+    for name in rows:
+        assert list(stream.data_map[name]) == list(rows[name])
@@ -0,0 +1,84 @@
+''' Testing of the TransientDataFolder reader '''
+import sys
+sys.path.append('../..')
+
+import pytest
+import multiprocessing
+import random
+from labview_processing.transient_data import disable_data_cache
+from labview_processing.transient_data_sets import TransientDataFolder
+from test_transient_data import sample_name, write_sample_file
+
+## Helper function to fill a folder with a bypass file, two result files, and one unpaired file
+@pytest.fixture
+def sample_folder(tmp_path):
+    disable_data_cache()
+    folder = tmp_path / "data"
+    folder.mkdir()
+    write_sample_file(folder / sample_name.replace("150C", "bp"), num_rows = 16)
+    write_sample_file(folder / sample_name, num_rows = 12)
+    write_sample_file(folder / sample_name.replace("150C", "200C"), num_rows = 14)
+    write_sample_file(folder / sample_name.replace("NH3H2Ocomp", "TPD").replace("150C", "250C"), num_rows = 10)
+    return str(folder)
+
+## Helper function to check that two folder objects hold the same data
+def assert_same_folder_data(parallel, serial):
+    assert parallel.grabFileList() == serial.grabFileList()
+    assert list(parallel.paired_data.keys()) == list(serial.paired_data.keys())
+    assert list(parallel.unpaired_data.keys()) == list(serial.unpaired_data.keys())
+    assert parallel.getTotalDataProcessed() == serial.getTotalDataProcessed()
+    assert parallel.time_key == serial.time_key
+    assert parallel.conditions == serial.conditions
+    for file in serial.paired_data:
+        for side in ["bypass_trans_obj", "result_trans_obj"]:
+            s_obj = getattr(serial.paired_data[file], side)
+            p_obj = getattr(parallel.paired_data[file], side)
+            assert p_obj.time_frames == s_obj.time_frames
+            assert list(p_obj.data_map.keys()) == list(s_obj.data_map.keys())
+            for name in s_obj.data_map:
+                assert list(p_obj.data_map[name]) == list(s_obj.data_map[name])
+    for file in serial.unpaired_data:
+        s_obj = serial.unpaired_data[file]
+        p_obj = parallel.unpaired_data[file]
+        assert p_obj.time_frames == s_obj.time_frames
+        assert list(p_obj.data_map.keys()) == list(s_obj.data_map.keys())
+        for name in s_obj.data_map:
+            assert list(p_obj.data_map[name]) == list(s_obj.data_map[name])
+
+@pytest.mark.unit
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="parallel reading requires fork")
+def test_parallel_folder_matches_serial(sample_folder):
+    serial = TransientDataFolder(sample_folder, addNoise=False, workers=1)
+    parallel = TransientDataFolder(sample_folder, addNoise=False, workers=3)
+
+    assert len(serial.grabFileList()) == 3
+    assert_same_folder_data(parallel, serial)
+
+@pytest.mark.unit
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="parallel reading requires fork")
+def test_parallel_folder_noise_matches_serial(tmp_path):
+    # Frames must be long enough to take the deviation of their last few points
+    disable_data_cache()
+    folder = tmp_path / "noisy_data"
+    folder.mkdir()
+    write_sample_file(folder / sample_name.replace("150C", "bp"), num_rows = 24)
+    write_sample_file(folder / sample_name, num_rows = 20)
+    write_sample_file(folder / sample_name.replace("150C", "200C"), num_rows = 32)
+    sample_folder = str(folder)
+
+    random.seed(42)
+    serial = TransientDataFolder(sample_folder, addNoise=True, workers=1)
+    random.seed(42)
+    parallel = TransientDataFolder(sample_folder, addNoise=True, workers=3)
+    assert_same_folder_data(parallel, serial)
+
+    # Noise was actually added to fill the gaps in the aligned data
+    quiet = TransientDataFolder(sample_folder, addNoise=False, workers=1)
+    changed = False
+    for file in serial.paired_data:
+        s_obj = serial.paired_data[file].result_trans_obj
+        q_obj = quiet.paired_data[file].result_trans_obj
+        for name in s_obj.data_map:
+            if list(s_obj.data_map[name]) != list(q_obj.data_map[name]):
+                changed = True
+    assert changed == True
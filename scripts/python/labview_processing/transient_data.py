@@ -21,8 +21,11 @@
 
 import math
 import os, sys
+import hashlib, json, tempfile
+from bisect import bisect_left, bisect_right
 from statistics import mean, stdev
 import random
+import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 from scipy.stats import norm
@@ -55,6 +58,179 @@ def double_peak_normal(x, avg1, std1, scale1, avg2, std2, scale2):
     p.append([avg2,std2,scale2])
     return normal_sum_func(x, n, p)
 
+## Helper function to check whether or not a single data value is numeric
+# Data values may either be python numbers or numpy scalars (i.e., values pulled
+#   out of a numeric column in the data_map).
+def is_numeric(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, (int, float, np.number))
+
+## Helper function to check whether or not a column of the data_map is numeric
+# Numeric columns are stored as numpy arrays, all other columns are python lists.
+def is_numeric_column(column):
+    if isinstance(column, np.ndarray):
+        return column.dtype.kind in "iuf"
+    if len(column) == 0:
+        return False
+    return is_numeric(column[0])
+
+## Helper function to convert a data set into the columnar storage of the data_map
+# Columns in the data_map are stored as follows...
+#
+#   (i)     Columns of only numeric data are stored as contiguous numpy arrays of floats
+#           (8 bytes per value instead of a python list of python floats)  \n
+#   (ii)    Columns holding any non-numeric data (e.g., strings) are kept as python lists
+#
+#   Numpy arrays are returned as is (i.e., not copied).
+#
+#   @param data_set list or numpy array of data for a single column
+def columnize(data_set):
+    if isinstance(data_set, np.ndarray):
+        return data_set
+    for value in data_set:
+        if is_numeric(value) == False:
+            return data_set
+    return np.array(data_set, dtype=float)
+
+## Settings for the binary cache of parsed (and aligned) data files
+#
+#   When a cache folder is set, TransientData objects store their parsed columns
+#   in a .npz file keyed by the path, modification time, and size of the data file,
+#   and PairedTransientData objects store the results of alignData() keyed by the
+#   contents of the data being aligned. Later sessions load those files instead of
+#   re-parsing text and re-aligning data. Caching is disabled (folder = None) until
+#   set_data_cache() is called.
+#
+#   NOTE:
+#
+#       Do not place the cache folder inside of a folder of data files. The
+#       TransientDataFolder objects expect those folders to only contain data files.
+data_cache = {"folder": None, "max_size": 2000}
+
+## Version of the cache file format (changing this invalidates old cache files)
+DATA_CACHE_VERSION = 1
+
+## Function to enable the binary cache of parsed data files
+#
+#   @param folder name of the folder to hold the cache files (created if needed)
+#   @param max_size maximum total size of the cache files in MB. When the cache grows
+#                   larger than this, the least recently used files are deleted.
+def set_data_cache(folder, max_size = 2000):
+    if os.path.exists(folder) == False:
+        os.makedirs(folder)
+    data_cache["folder"] = folder
+    data_cache["max_size"] = max_size
+    trim_data_cache()
+
+## Function to disable the binary cache of parsed data files (existing files are kept)
+def disable_data_cache():
+    data_cache["folder"] = None
+
+## Function to delete all files in the binary cache of parsed data files
+def clear_data_cache():
+    if data_cache["folder"] == None:
+        return
+    for file in os.listdir(data_cache["folder"]):
+        if file.endswith(".npz"):
+            os.remove(os.path.join(data_cache["folder"], file))
+
+## Helper function to create the path of a cache file from a list of identifying strings
+def data_cache_path(prefix, key_items):
+    key = hashlib.sha1()
+    key.update(str(DATA_CACHE_VERSION).encode())
+    for item in key_items:
+        key.update(str(item).encode())
+    return os.path.join(data_cache["folder"], prefix + "-" + key.hexdigest() + ".npz")
+
+## Helper function to pack the columns of a data_map into a map of arrays for saving
+#
+#   Numeric columns are saved as is. Non-numeric columns are saved as arrays of strings
+#   along with a flag array denoting which of the entries were numbers.
+def pack_columns(data_map, prefix, arrays):
+    names = []
+    i = 0
+    for item in data_map:
+        column = data_map[item]
+        key = prefix + str(i)
+        if type(column) is np.ndarray:
+            arrays[key] = column
+        else:
+            arrays[key] = np.array([str(value) for value in column], dtype=str)
+            arrays[key+"-num"] = np.array([is_numeric(value) for value in column], dtype=bool)
+        names.append(item)
+        i+=1
+    return names
+
+## Helper function to unpack the arrays made by pack_columns() into a data_map
+def unpack_columns(arrays, prefix, names):
+    data_map = {}
+    i = 0
+    for item in names:
+        key = prefix + str(i)
+        if key+"-num" in arrays.keys():
+            data_map[item] = []
+            for value, num in zip(arrays[key].tolist(), arrays[key+"-num"].tolist()):
+                if num == True:
+                    data_map[item].append(float(value))
+                else:
+                    data_map[item].append(value)
+        else:
+            data_map[item] = arrays[key]
+        i+=1
+    return data_map
+
+## Helper function to read a cache file
+#
+#   Returns the (arrays, meta) loaded from the file, or None if the file does not exist
+#   or cannot be read. Successful reads mark the file as recently used.
+def read_data_cache(path):
+    if os.path.exists(path) == False:
+        return None
+    try:
+        with np.load(path) as file:
+            arrays = {key: file[key] for key in file.files}
+        meta = json.loads(str(arrays["meta"]))
+        os.utime(path)
+    except:
+        print("Warning! Unable to read cache file " + path + ". Data will be re-processed...")
+        return None
+    return arrays, meta
+
+## Helper function to write a cache file and enforce the size limit of the cache
+def write_data_cache(path, arrays, meta):
+    arrays["meta"] = np.array(json.dumps(meta))
+    try:
+        #Write to a temporary file first so an interrupted write never leaves a partial cache file
+        handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=data_cache["folder"])
+        with os.fdopen(handle, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temp_path, path)
+    except:
+        print("Warning! Unable to write cache file " + path + "...")
+        return
+    trim_data_cache(path)
+
+## Helper function to delete the least recently used cache files until the cache fits within max_size
+#
+#   @param keep path of a cache file that should not be deleted (e.g., the file just written)
+def trim_data_cache(keep = None):
+    files = []
+    total_size = 0
+    for file in os.listdir(data_cache["folder"]):
+        if file.endswith(".npz"):
+            statinfo = os.stat(os.path.join(data_cache["folder"], file))
+            files.append((statinfo.st_mtime, statinfo.st_size, file))
+            total_size += statinfo.st_size
+    files.sort()
+    for mtime, size, file in files:
+        if total_size <= data_cache["max_size"]*1E6:
+            break
+        if os.path.join(data_cache["folder"], file) == keep:
+            continue
+        os.remove(os.path.join(data_cache["folder"], file))
+        total_size -= size
+
 ## TransientData
 # This is the basic object to read, operate on, plot, and save transient CLEERS data
 #
@@ -107,7 +283,8 @@ class TransientData(object):
     ## Constructor for the class
     # Initialize data object by passing the current file to it
     # Each key in the data_map represents a column label
-    #       Each key maps to a data list
+    #       Each key maps to a column of data (numeric columns are numpy arrays,
+    #       non-numeric columns are python lists)
     # The input file should have a specific convention for naming a file
     #       e.g., 20160209-CLRK-BASFCuSSZ13-700C4h-NH3H2Ocomp-30k-0_2pctO2-11-3pctH2O-400ppmNH3-150C.dat
     #
@@ -125,7 +302,18 @@ class TransientData(object):
     #                   (Also note, item[-1] will carry the file extension with it)
     #
     #   @param file the name of the data file we are reading
-    def __init__(self, file):
+    #   @param use_cache if True, then the parsed data is loaded from (or saved to) the data cache
+    #                    when a cache folder has been set (see set_data_cache())
+    #   @param stream_factor row compression factor applied while streaming the file (see readFileStream())
+    #   @param time_window tuple of the (min, max) elapsed times of the rows to keep while streaming the
+    #                       file (default is to keep all rows)
+    #
+    #   NOTE:
+    #
+    #       If a stream_factor > 1 or a time_window is given, then the file is read with
+    #       readFileStream() instead of readFile(). Only the reduced data is ever stored,
+    #       which is useful for very large files.
+    def __init__(self, file, use_cache = True, stream_factor = 1, time_window = None):
         #Check the given file name for any path information and truncate the path information
         file_name = file.split("/")[-1]
         #Parse the file name to gain specific information
@@ -180,6 +368,9 @@ class TransientData(object):
         ##Contains the first line of the data file
         self.exp_header = ''
         ##Contains a map of all the data by column
+        #
+        #   Columns of numeric data are stored as numpy arrays of floats, while columns
+        #   with any non-numeric data are stored as python lists (see columnize())
         self.data_map = {}
         ##Contains the number of rows of data
         self.num_rows = 0
@@ -229,12 +420,39 @@ class TransientData(object):
         #   catalyst. User must manually override this value if needed.
 
         self.void_frac = 0.3309
+        ##Flag to denote whether or not this object may use the data cache
+        self.use_cache = use_cache
+        ##Row compression factor and time window used when streaming the file
+        self.stream_factor = int(stream_factor)
+        self.time_window = time_window
+        if self.readCache() == True:
+            self.closeFile()
+            return
         if statinfo.st_size >= 10000000:
             print("\nReading " + str(statinfo.st_size/1E6) + " MB file. Please wait...")
-        self.readFile()
+        if self.stream_factor > 1 or self.time_window != None:
+            self.readFileStream(self.stream_factor, self.time_window)
+        else:
+            self.readFile()
+        self.writeCache()
         if statinfo.st_size >= 10000000:
             print("Finished!")
 
+    ## Function to return the object state for pickling (e.g., when reading files in other processes)
+    #
+    #   The (closed) data file can not be pickled, so only its name is stored
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["data_file"] = self.data_file.name
+        return state
+
+    ## Function to restore the object state after pickling
+    def __setstate__(self, state):
+        file_name = state["data_file"]
+        self.__dict__.update(state)
+        self.data_file = open(file_name,"r")
+        self.closeFile()
+
     ## Function to print object information to the console
     def __str__(self):
         message = "\nFile Name:\t" + self.data_file.name
@@ -319,7 +537,7 @@ class TransientData(object):
                                         self.data_map[self.ordered_key_list[n]].append(item)
                                     else:
                                         if len(self.data_map[self.ordered_key_list[n]]) > 0:
-                                            if type(self.data_map[self.ordered_key_list[n]][-1]) is not int and type(self.data_map[self.ordered_key_list[n]][-1]) is not float:
+                                            if is_numeric(self.data_map[self.ordered_key_list[n]][-1]) == False:
                                                 self.data_map[self.ordered_key_list[n]].append(item)
                                 has_read_map[self.ordered_key_list[n]] = True
                     n+=1
@@ -327,16 +545,207 @@ class TransientData(object):
                     has_read_map[item] = False
             i+=1
         #END of line loop
+        #Convert the parsed lists into columnar storage
+        for item in self.data_map:
+            self.data_map[item] = columnize(self.data_map[item])
         self.num_rows = len(self.data_map[self.time_key])
         for i in range(1,len(self.change_time)):
             self.time_frames.append((self.change_time[i-1],self.change_time[i]))
         self.time_frames.append((self.change_time[-1],self.data_map[self.time_key][-1]))
         self.closeFile()
 
+    ## Function to read in the data file as a stream of chunks
+    #
+    #   This function reads the data file in chunks of lines and reduces the data on the fly,
+    #   such that the memory used is proportional to the reduced data (not the size of the file).
+    #   The constructor calls this function (instead of readFile()) when a stream_factor > 1
+    #   or a time_window is given.
+    #
+    #   Rows outside of the time_window are discarded as they are read. Then, every 'factor' values
+    #   that are kept in a column are averaged into a single value (the last value is kept for
+    #   non-numeric data). The result is the same as calling readFile() followed by compressRows(),
+    #   including the renaming of the columns, but without ever storing the full data set.
+    #
+    #   Repeats of the column names (i.e., changes in input conditions) are still recorded in
+    #   change_time, as long as they occur within the time_window.
+    #
+    #   @param factor row compression factor (1 = no compression)
+    #   @param time_window tuple of the (min, max) elapsed times of the rows to keep (None keeps all rows)
+    #   @param chunk_size approximate number of bytes to read from the file at a time
+    def readFileStream(self, factor = 1, time_window = None, chunk_size = 1000000):
+        factor = int(factor)
+        if time_window == None:
+            min_time = -math.inf
+            max_time = math.inf
+        else:
+            min_time = time_window[0]
+            max_time = time_window[1]
+        i = 0
+        has_read_map = {}
+        #Number of values read and whether or not the last value read was non-numeric (per column)
+        #   (used to mimic the rules in readFile() for storing non-numeric data)
+        num_read = {}
+        last_is_text = {}
+        #Values kept, but not yet reduced (per column)
+        pending = {}
+        last_time = None
+        last_kept_time = None
+        time_index = 0
+        lines = self.data_file.readlines(chunk_size)
+        while len(lines) > 0:
+            for line in lines:
+                line_list = line.split('\t')
+                #Ignore the first line of the data file and stores as header
+                if (i == 0):
+                    self.exp_header = line
+
+                # This is the first real header of the data
+                if (i == 1):
+                    for item in line_list:
+                        #Ignore the ending character
+                        if item != '\n':
+                            if item.strip().split("(")[0] == "Elapsed Time ":
+                                self.time_key = item.strip()
+                                time_index = len(self.ordered_key_list)
+                            self.data_map[item.strip()] = []
+                            has_read_map[item.strip()] = False
+                            num_read[item.strip()] = 0
+                            last_is_text[item.strip()] = False
+                            pending[item.strip()] = []
+                            self.ordered_key_list.append(item.strip())
+                        else:
+                            # Force a new column for input conditions
+                            self.change_time.append(0)
+
+                if (i > 1):
+                    #Determine whether or not this row is within the time window
+                    try:
+                        row_time = float(line_list[time_index])
+                        keep = row_time >= min_time and row_time <= max_time
+                    except:
+                        keep = False
+                    n = 0
+                    for item in line_list:
+                        if item.strip() in self.data_map.keys():
+                            if (n == 0) and last_time != None:
+                                if last_time >= min_time and last_time <= max_time:
+                                    self.change_time.append(last_time)
+                        else:
+                            if item != '\n':
+                                key = self.ordered_key_list[n]
+                                if has_read_map[key] == False:
+                                    try:
+                                        value = float(item)
+                                        last_is_text[key] = False
+                                    except:
+                                        value = None
+                                        if i == 2 or (num_read[key] > 0 and last_is_text[key] == True):
+                                            value = item
+                                            last_is_text[key] = True
+                                    if value != None:
+                                        num_read[key] += 1
+                                        if key == self.time_key:
+                                            last_time = value
+                                        if keep == True:
+                                            pending[key].append(value)
+                                            if key == self.time_key:
+                                                last_kept_time = value
+                                            if len(pending[key]) == factor:
+                                                self.data_map[key].append(self.reduceRows(pending[key]))
+                                                pending[key] = []
+                                    has_read_map[key] = True
+                        n+=1
+                    for item in has_read_map:
+                        has_read_map[item] = False
+                i+=1
+            lines = self.data_file.readlines(chunk_size)
+        #END of chunk loop
+        if last_kept_time == None:
+            print("Error! No data rows were found within the given time_window!")
+            self.closeFile()
+            return
+
+        #Convert the reduced lists into columnar storage (with the same names given by compressRows())
+        if factor > 1:
+            new_map = {}
+            for item in self.data_map:
+                new_map[str(item) + "-" + str(factor) + "x Compression"] = columnize(self.data_map[item])
+            self.data_map = new_map
+        else:
+            for item in self.data_map:
+                self.data_map[item] = columnize(self.data_map[item])
+        for i in range(1,len(self.change_time)):
+            self.time_frames.append((self.change_time[i-1],self.change_time[i]))
+        self.time_frames.append((self.change_time[-1],last_kept_time))
+        if factor > 1:
+            self.time_key += "-" + str(factor) + "x Compression"
+        self.num_rows = len(self.data_map[self.time_key])
+        self.closeFile()
+
+    ## Helper function to reduce a set of rows into a single value when streaming a file
+    #
+    #   Numeric rows are averaged, otherwise the last row is used
+    def reduceRows(self, values):
+        for value in values:
+            if is_numeric(value) == False:
+                return values[-1]
+        avg = 0
+        for value in values:
+            avg += value
+        return avg/float(len(values))
+
     ## Function to manually close the open data file
     def closeFile(self):
         self.data_file.close()
 
+    ## Function to return the path of this file's cache file (None if caching is disabled)
+    #
+    #   Cache files are keyed by the full path, modification time, and size of the data file,
+    #   so any change to the data file results in the data being re-parsed.
+    def cachePath(self):
+        if data_cache["folder"] == None or self.use_cache == False:
+            return None
+        statinfo = os.stat(self.data_file.name)
+        key_items = [os.path.abspath(self.data_file.name), statinfo.st_mtime_ns, statinfo.st_size]
+        if self.stream_factor > 1 or self.time_window != None:
+            key_items += [self.stream_factor, self.time_window]
+        return data_cache_path("td", key_items)
+
+    ## Function to load the parsed file data from the data cache
+    #
+    #   Returns True if the data was loaded, False if the data needs to be read from the file
+    def readCache(self):
+        path = self.cachePath()
+        if path == None:
+            return False
+        cache = read_data_cache(path)
+        if cache == None:
+            return False
+        arrays, meta = cache
+        self.exp_header = meta["exp_header"]
+        self.ordered_key_list = meta["ordered_key_list"]
+        self.change_time = meta["change_time"]
+        self.time_frames = [tuple(frame) for frame in meta["time_frames"]]
+        self.time_key = meta["time_key"]
+        self.data_map = unpack_columns(arrays, "col", meta["columns"])
+        self.num_rows = len(self.data_map[self.time_key])
+        return True
+
+    ## Function to save the parsed file data to the data cache
+    def writeCache(self):
+        path = self.cachePath()
+        if path == None:
+            return
+        arrays = {}
+        meta = {}
+        meta["columns"] = pack_columns(self.data_map, "col", arrays)
+        meta["exp_header"] = self.exp_header
+        meta["ordered_key_list"] = self.ordered_key_list
+        meta["change_time"] = self.change_time
+        meta["time_frames"] = self.time_frames
+        meta["time_key"] = self.time_key
+        write_data_cache(path, arrays, meta)
+
     ## Function to set the system volume
     def defineVolume(self, vol):
         try:
@@ -360,17 +769,18 @@ class TransientData(object):
     ## This function will add a column to the data map given the column name and associated data
     #
     #   NOTE:
-    #       Appending the column does NOT copy the column into the map. It merely directs
-    #       the map to point to the given data_set. If you change the data_set that you pass
-    #       to this function, then the data in this object's map will also change.
+    #       Appending a numpy array (or a list of non-numeric data) does NOT copy the column
+    #       into the map. It merely directs the map to point to the given data_set. If you change
+    #       the data_set that you pass to this function, then the data in this object's map will
+    #       also change. A list of numeric data is converted into a new numpy array.
     def appendColumn(self, column_name, data_set):
         #First, check to make sure the map has been prepared
         if (len(self.data_map) == 0):
             print("Error! File has not been read and stored!")
             return
 
-        #Make sure the data_set is actually a list of data
-        if type(data_set) is not list:
+        #Make sure the data_set is actually a list (or array) of data
+        if type(data_set) is not list and type(data_set) is not np.ndarray:
             print("Error! The data_set must be a list of data!")
             return
 
@@ -385,7 +795,7 @@ class TransientData(object):
             print("Error! The data set size does not match the existing data set size!")
             return
 
-        self.data_map[column_name] = data_set
+        self.data_map[column_name] = columnize(data_set)
 
     ## This function is used to create a step input column based on data frames
     #
@@ -402,12 +812,13 @@ class TransientData(object):
             return
 
         #Loop through all time values
-        self.data_map[column_name] = []
+        new_column = []
         index = 0
         for time in self.data_map[self.time_key]:
             if time > self.time_frames[index][1]:
                 index+=1
-            self.data_map[column_name].append(column_value_list[index])
+            new_column.append(column_value_list[index])
+        self.data_map[column_name] = columnize(new_column)
 
 
     ## This function will extract column sets from the data_map and return a new, reduced map
@@ -438,24 +849,21 @@ class TransientData(object):
     #
     # @param column_list Name or list of names of the columns to remove negative values from
     def removeNegatives(self, column_list):
-        if type(column_list) is list:
-            for item in column_list:
-                #Check to make sure the item is a key in data_map
-                if item in self.data_map.keys():
+        if type(column_list) is not list:
+            column_list = [column_list]
+        for item in column_list:
+            #Check to make sure the item is a key in data_map
+            if item in self.data_map.keys():
+                column = self.data_map[item]
+                if type(column) is np.ndarray:
+                    #Replace in place (other objects may point to this column)
+                    column[column < 0] = 0
+                else:
                     i=0
-                    for value in self.data_map[item]:
-                        if value < 0:
-                            self.data_map[item][i] = 0
+                    for value in column:
+                        if is_numeric(value) and value < 0:
+                            column[i] = 0
                         i+=1
-                else:
-                    print("Error! Invalid Key!")
-        else:
-            if column_list in self.data_map.keys():
-                i=0
-                for value in self.data_map[column_list]:
-                    if value < 0:
-                        self.data_map[item][i] = 0
-                    i+=1
             else:
                 print("Error! Invalid Key!")
 
@@ -516,103 +924,49 @@ class TransientData(object):
         if operator != "*" and operator != "/" and operator != "+" and operator != "-":
             print("Error! Unsupported operator...")
             return
-        if type(self.data_map[column_name][0]) is not int and type(self.data_map[column_name][0]) is not float:
+        if is_numeric_column(self.data_map[column_name]) == False:
             print("Error! Non-numeric data in the given first column...")
             return
+        operation = {"*": np.multiply, "/": np.divide, "+": np.add, "-": np.subtract}[operator]
 
         #Check the value_or_column variable type
         if type(value_or_column) is str:
             if value_or_column not in self.data_map.keys():
                 print("Error! Argument given as the value is not a valid key...")
                 return
-            if type(self.data_map[value_or_column][0]) is not int and type(self.data_map[value_or_column][0]) is not float:
+            if is_numeric_column(self.data_map[value_or_column]) == False:
                 print("Error! Non-numeric data in the given second column...")
                 return
-            if append_new == True:
-                new_name = append_name
-                if new_name == "":
-                    new_name = column_name + operator + value_or_column
-                self.data_map[new_name] = []
-                i=0
-                for value in self.data_map[column_name]:
-                    if operator == "*":
-                        self.data_map[new_name].append(value*self.data_map[value_or_column][i])
-                    elif operator == "/":
-                        self.data_map[new_name].append(value/self.data_map[value_or_column][i])
-                    elif operator == "-":
-                        self.data_map[new_name].append(value-self.data_map[value_or_column][i])
-                    elif operator == "+":
-                        self.data_map[new_name].append(value+self.data_map[value_or_column][i])
-                    else:
-                        print("Error! How did you even get here...?")
-                        return
-                    i+=1
-            else:
-                i=0
-                for value in self.data_map[column_name]:
-                    if operator == "*":
-                        self.data_map[column_name][i] = (value*self.data_map[value_or_column][i])
-                    elif operator == "/":
-                        self.data_map[column_name][i] = (value/self.data_map[value_or_column][i])
-                    elif operator == "-":
-                        self.data_map[column_name][i] = (value-self.data_map[value_or_column][i])
-                    elif operator == "+":
-                        self.data_map[column_name][i] = (value+self.data_map[value_or_column][i])
-                    else:
-                        print("Error! How did you even get here...?")
-                        return
-                    i+=1
+            new_name = column_name + operator + value_or_column
+            value = np.asarray(self.data_map[value_or_column], dtype=float)
         else:
-            if append_new == True:
+            new_name = column_name + operator + str(value_or_column)
+            value = value_or_column
+
+        column = columnize(self.data_map[column_name])
+        if append_new == True:
+            if append_name != "":
                 new_name = append_name
-                if new_name == "":
-                    new_name = column_name + operator + str(value_or_column)
-                self.data_map[new_name] = []
-                i=0
-                for value in self.data_map[column_name]:
-                    if operator == "*":
-                        self.data_map[new_name].append(value*value_or_column)
-                    elif operator == "/":
-                        self.data_map[new_name].append(value/value_or_column)
-                    elif operator == "-":
-                        self.data_map[new_name].append(value-value_or_column)
-                    elif operator == "+":
-                        self.data_map[new_name].append(value+value_or_column)
-                    else:
-                        print("Error! How did you even get here...?")
-                        return
-                    i+=1
-            else:
-                i=0
-                for value in self.data_map[column_name]:
-                    if operator == "*":
-                        self.data_map[column_name][i] = (value*value_or_column)
-                    elif operator == "/":
-                        self.data_map[column_name][i] = (value/value_or_column)
-                    elif operator == "-":
-                        self.data_map[column_name][i] = (value-value_or_column)
-                    elif operator == "+":
-                        self.data_map[column_name][i] = (value+value_or_column)
-                    else:
-                        print("Error! How did you even get here...?")
-                        return
-                    i+=1
+            self.data_map[new_name] = operation(column, value)
+        else:
+            #Operate in place (other objects may point to this column)
+            operation(column, value, out=column)
+            self.data_map[column_name] = column
 
     ##This function will extract a row of data (or set of rows) based on the value of Elapsed time provided
+    #
+    #   The time column is always sorted, so the range of rows is found by bisection
+    #   and each column is copied by slicing.
     def extractRows(self, min_time, max_time):
         new_map = {}
+        time = self.data_map[self.time_key]
+        start = bisect_left(time, min_time)
+        stop = bisect_right(time, max_time)
         for item in self.data_map:
-            new_map[item] = []
-        #loop through all time data
-        n = 0
-        for time in self.data_map[self.time_key]:
-            if time > max_time:
-                break
-            if time >= min_time:
-                for item in self.data_map:
-                    if len(self.data_map[item]) > n:
-                        new_map[item].append(self.data_map[item][n])
-            n+=1
+            if type(self.data_map[item]) is np.ndarray:
+                new_map[item] = self.data_map[item][start:stop].copy()
+            else:
+                new_map[item] = self.data_map[item][start:stop]
 
         return new_map
 
@@ -622,41 +976,85 @@ class TransientData(object):
         if column_name not in self.data_map.keys():
             print("Error! Invalid Key!")
             return
-        n = 0
-        start_time = 0
-        start_point = 0
-        end_time = 0
-        end_point = 0
-        if time_value >= self.data_map[self.time_key][-1]:
-            return self.data_map[column_name][-1]
+        time = self.data_map[self.time_key]
+        column = self.data_map[column_name]
         #What should we do if we reach beyond the total time?
-        for time in self.data_map[self.time_key]:
-            if time > time_value:
-                if n == 0:
-                    start_time = 0
-                    start_point = self.data_map[column_name][n]
-                else:
-                    start_time = self.data_map[self.time_key][n-1]
-                    start_point = self.data_map[column_name][n-1]
-                end_time = time
-                end_point = self.data_map[column_name][n]
-                break
-            n+=1
+        if time_value >= time[-1]:
+            point = column[-1]
+            if is_numeric(point):
+                point = float(point)
+            return point
+        #Index of the first time value after the given time_value (time is always sorted)
+        n = bisect_right(time, time_value)
+        if n == 0:
+            start_time = 0
+            start_point = column[n]
+        else:
+            start_time = time[n-1]
+            start_point = column[n-1]
+        end_time = time[n]
+        end_point = column[n]
         #Perform linear interpolation between start_point and end_point
-        if type(end_point) is not int and type(end_point) is not float:
+        if is_numeric(end_point) == False:
             point = end_point
+        elif end_time == start_time:
+            point = float(end_point)
         else:
             try:
-                point = (end_point - start_point)/(end_time - start_time)*(time_value - start_time) + start_point
+                point = float((end_point - start_point)/(end_time - start_time)*(time_value - start_time) + start_point)
             except:
-                point = end_point
+                point = float(end_point)
         return point
 
+    ## This function will get a set of data points based on a list of elapsed times and column names
+    #
+    #   Each point is the same as would be given by getDataPoint(), but all times are
+    #   located and interpolated at once.
+    #
+    #   @param times list (or array) of elapsed time values
+    #   @param column_names name or list of names of the columns to get data from
+    #
+    #   Returns an array of points for the given column name (a list for non-numeric columns),
+    #   or a map of column names to those points if a list of column names was given.
+    def getDataPoints(self, times, column_names):
+        if type(column_names) is not list:
+            if column_names not in self.data_map.keys():
+                print("Error! Invalid Key!")
+                return
+            return self.getDataPoints(times, [column_names])[column_names]
+        for name in column_names:
+            if name not in self.data_map.keys():
+                print("Error! Invalid Key!")
+                return
+        times = np.asarray(times, dtype=float)
+        time = np.asarray(self.data_map[self.time_key], dtype=float)
+        #Index of the first time value after each given time (clipped at the last row)
+        n = np.minimum(np.searchsorted(time, times, side="right"), len(time)-1)
+        past_end = times >= time[-1]
+        start_time = np.where(n == 0, 0, time[n-1])
+        end_time = time[n]
+        points = {}
+        for name in column_names:
+            column = self.data_map[name]
+            if is_numeric_column(column) == False:
+                points[name] = [column[-1] if past_end[i] else column[n[i]] for i in range(len(times))]
+                continue
+            column = np.asarray(column, dtype=float)
+            start_point = np.where(n == 0, column[0], column[n-1])
+            end_point = column[n]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                point = (end_point - start_point)/(end_time - start_time)*(times - start_time) + start_point
+            point = np.where(end_time == start_time, end_point, point)
+            points[name] = np.where(past_end, column[-1], point)
+        return points
+
     ##Function to retrive the maximum value in a given column
     def getMaximum(self, column_name):
         if column_name not in self.data_map.keys():
             print("Error! Invalid Key!")
             return
+        if type(self.data_map[column_name]) is np.ndarray:
+            return float(np.max(self.data_map[column_name]))
         return max(self.data_map[column_name])
 
     ##Function to retrive the minimum value in a given column
@@ -664,6 +1062,8 @@ class TransientData(object):
         if column_name not in self.data_map.keys():
             print("Error! Invalid Key!")
             return
+        if type(self.data_map[column_name]) is np.ndarray:
+            return float(np.min(self.data_map[column_name]))
         return min(self.data_map[column_name])
 
     ##Function to calculate and retrive the average value in a given column
@@ -671,6 +1071,8 @@ class TransientData(object):
         if column_name not in self.data_map.keys():
             print("Error! Invalid Key!")
             return
+        if type(self.data_map[column_name]) is np.ndarray:
+            return float(np.mean(self.data_map[column_name]))
         try:
             return mean(self.data_map[column_name])
         except:
@@ -762,32 +1164,18 @@ class TransientData(object):
                         new_name += "," + str(int(val_list[j]))
                     j+=1
                 new_name += ")"
-                self.data_map[new_name] = []
-                #Now loop through all rows and insert proper data into new column
-                n = 0
-                for value in self.data_map[frac_keys[item][0]]:
-                    #value we are on here corresponds to the val_list[0] limit
-                    #Loop through all other columns that can compress and
-                    #find value to register based on limits in val_list
-                    dist = []
-                    dist.append(val_list[0] - value)
-                    for i in range(1,len(frac_keys[item])):
-                        dist.append(val_list[i] - self.data_map[frac_keys[item][i]][n])
-
-                    #The index of the smallest postive dist is the index i for the data to append
-                    reg_index = 0
-                    old_d = dist[0]
-                    for i in range(1,len(frac_keys[item])):
-                        if dist[i] > 0 and old_d > 0:
-                            if dist[i] < old_d:
-                                reg_index = i
-                                old_d = dist[i]
-                        elif old_d < 0:
-                            old_d = dist[i]
-                            reg_index = i
-                    self.data_map[new_name].append(self.data_map[frac_keys[item][reg_index]][n])
-                    n+=1
-                #End value loop
+                #Now operate on all rows at once to insert proper data into new column
+                #   Each row registers the data of the column whose limit in val_list
+                #   is closest to (but still above) the recorded data
+                columns = [np.asarray(self.data_map[sub_key], dtype=float) for sub_key in frac_keys[item]]
+                reg_index = np.zeros(len(columns[0]), dtype=int)
+                old_d = val_list[0] - columns[0]
+                for i in range(1,len(frac_keys[item])):
+                    dist = val_list[i] - columns[i]
+                    update = ((dist > 0) & (old_d > 0) & (dist < old_d)) | (old_d < 0)
+                    reg_index = np.where(update, i, reg_index)
+                    old_d = np.where(update, dist, old_d)
+                self.data_map[new_name] = np.choose(reg_index, columns)
 
                 #Now, delete the original columns
                 for sub_key in frac_keys[item]:
@@ -995,12 +1383,10 @@ class TransientData(object):
     def createRateMap(self, column_list = [], max_count = 21):
         rate_map = {}
         col_list = []
-        if len(column_list) == 0:
-            for item in self.data_map:
-                column_list.append(item)
-
         if type(column_list) is list:
-            col_list = column_list
+            col_list = list(column_list)
+            if len(col_list) == 0:
+                col_list = list(self.data_map.keys())
         else:
             if column_list not in self.data_map.keys():
                 print("Error! Invalid column name!")
@@ -1014,40 +1400,24 @@ class TransientData(object):
         #Forces the rate map to contain the time key
         rate_map[self.time_key] = []
 
-        #Loop over all items in the rate_map
+        #Each aggregate point averages max_count rows, then skips the following row
+        #   (any rows left over at the end that do not fill an aggregate are dropped)
+        num_points = self.getNumRows()//(max_count+1)
         for item in rate_map:
-            #Start by looping through the current rows
-            count = 0
-            fn=0
-            j=0
-            while j<self.getNumRows():
-                if count < max_count:
-                    fn+=self.data_map[item][j]
-                    count+=1
-                else:
-                    fn = fn/max_count
-                    rate_map[item].append(fn)
-                    fn=0
-                    count=0
-                j+=1
-            #End While loop
+            column = np.asarray(self.data_map[item][0:num_points*(max_count+1)], dtype=float)
+            rate_map[item] = column.reshape(num_points,max_count+1)[:,0:max_count].sum(axis=1)/max_count
         #End map loop
 
         #Loop again to over the rate_map to approximate time derivatives
         time_der_map = {}
+        time = rate_map[self.time_key]
         for item in rate_map:
-            #if item == self.time_key:
-            #    break
             name ="d{"+item+"}/dt"
-            time_der_map[name] = [0.]*len(rate_map[self.time_key])
-
-            n=1
-            while n<len(time_der_map[name])-1:
-                time_der_map[name][n] = (rate_map[item][n+1] - rate_map[item][n-1]) / (rate_map[self.time_key][n+1] - rate_map[self.time_key][n-1])
-                n+=1
-
-            time_der_map[name][0] = (rate_map[item][1] - rate_map[item][0]) / (rate_map[self.time_key][1] - rate_map[self.time_key][0])
-            time_der_map[name][len(time_der_map[name])-1] = (rate_map[item][len(time_der_map[name])-1] - rate_map[item][len(time_der_map[name])-2]) / (rate_map[self.time_key][len(time_der_map[name])-1] - rate_map[self.time_key][len(time_der_map[name])-2])
+            f = rate_map[item]
+            time_der_map[name] = np.zeros(len(time))
+            time_der_map[name][1:-1] = (f[2:] - f[:-2]) / (time[2:] - time[:-2])
+            time_der_map[name][0] = (f[1] - f[0]) / (time[1] - time[0])
+            time_der_map[name][-1] = (f[-1] - f[-2]) / (time[-1] - time[-2])
 
         for item in time_der_map:
             rate_map[item] = time_der_map[item]
@@ -1269,12 +1639,18 @@ class TransientData(object):
         #   That average value becomes the new value to place into the new data_map with a new key
         #   This cycle repeats until no data is left to compress
         for item in new_key_list:
+            column = self.data_map[item]
+            if type(column) is np.ndarray:
+                num = len(column)//factor
+                self.data_map[new_key_list[item]] = column[0:num*factor].reshape(num,factor).sum(axis=1)/float(factor)
+                del self.data_map[item]
+                continue
             self.data_map[new_key_list[item]] = []
             i = 0
             reset = 1
             avg = 0
-            for value in self.data_map[item]:
-                if type(value) is not int and type(value) is not float:
+            for value in column:
+                if is_numeric(value) == False:
                     if reset == factor:
                         reset = 1
                         self.data_map[new_key_list[item]].append(value)
@@ -1330,7 +1706,7 @@ class TransientData(object):
         if data_key not in self.data_map.keys():
             print("Error! No corresponding output value exists in data_map!")
             return
-        if type(self.data_map[data_key][-1]) is not int and type(self.data_map[data_key][-1]) is not float:
+        if is_numeric(self.data_map[data_key][-1]) == False:
             print("Error! Can only autoregChangedInput() for numeric data...")
             return
 
@@ -1382,7 +1758,7 @@ class TransientData(object):
         #Iterate through the input_change map
         for new_key in self.input_change:
             i=0
-            self.data_map[new_key] = []
+            new_column = []
             for time in self.data_map[self.time_key]:
                 try:
                     time_limit = self.change_time[i+1]
@@ -1390,7 +1766,8 @@ class TransientData(object):
                     time_limit = self.change_time[-1]+time
                 if time > time_limit:
                     i+=1
-                self.data_map[new_key].append(self.input_change[new_key][i])
+                new_column.append(self.input_change[new_key][i])
+            self.data_map[new_key] = columnize(new_column)
 
     ##This function calculates a simple integral of a given column over the time range
     #
@@ -1415,7 +1792,7 @@ class TransientData(object):
         time_set = self.extractRows(min_time, max_time)
         time_old = time_set[self.time_key][0]
         f_old = time_set[column_name][0]
-        if type(f_old) is not int and type(f_old) is not float:
+        if is_numeric(f_old) == False:
             print("Error! Cannot integrate non-numeric data!")
             return sum
         i=1
@@ -1482,34 +1859,18 @@ class TransientData(object):
             ret_key = outlet_column+"-Retained (normalized)"
         else:
             ret_key = outlet_column+"-Retained"
-        self.data_map[ret_key] = []
-        self.data_map[ret_key].append(0)
-        MR_old = 0
-        max_value = abs(MR_old)
-        time_old = self.data_map[self.time_key][0]
-        Min_old = self.data_map[inlet_column][0]
-        Mout_old = self.data_map[outlet_column][0]
-        i=1
-        while i<len(self.data_map[self.time_key]):
-            time_new = self.data_map[self.time_key][i]
-            Min_new = self.data_map[inlet_column][i]
-            Mout_new = self.data_map[outlet_column][i]
-            MR_new = MR_old + (time_new-time_old)/60*self.flow_rate*( (Min_old+Min_new)/2 - (Mout_old+Mout_new)/2 )
-            if abs(MR_new) > max_value:
-                max_value = abs(MR_new)
-            self.data_map[ret_key].append(MR_new*conv_factor)
-            time_old = time_new
-            Min_old = Min_new
-            Mout_old = Mout_new
-            MR_old = MR_new
-            i+=1
-
-        #Loop one last time to normalize the integrated curve
+        time = np.asarray(self.data_map[self.time_key], dtype=float)
+        Min = np.asarray(self.data_map[inlet_column], dtype=float)
+        Mout = np.asarray(self.data_map[outlet_column], dtype=float)
+        #Trapezoid rule increments of the retained mass, summed cumulatively from MR = 0
+        dMR = (time[1:]-time[:-1])/60*self.flow_rate*( (Min[:-1]+Min[1:])/2 - (Mout[:-1]+Mout[1:])/2 )
+        MR = np.concatenate(([0.0], np.cumsum(dMR)))
+        max_value = np.max(np.abs(MR))
+        self.data_map[ret_key] = MR*conv_factor
+
+        #Normalize the integrated curve
         if normalized == True:
-            i=0
-            for value in self.data_map[ret_key]:
-                self.data_map[ret_key][i] = self.data_map[ret_key][i]/max_value
-                i+=1
+            self.data_map[ret_key] /= max_value
 
     ## Function to fit a 2-peak distribution to the TPD
     #
@@ -1646,13 +2007,17 @@ class PairedTransientData(object):
     #
     # @param bypass_file name of the bypass file
     # @param result_file name of the data run file that needs to be paired with the bypass file
-    def __init__(self, bypass_file, result_file):
+    # @param use_cache if True, then parsed and aligned data is loaded from (or saved to) the data
+    #                   cache when a cache folder has been set (see set_data_cache())
+    def __init__(self, bypass_file, result_file, use_cache = True):
 
         # The constructor for the objects will automatically read the files
         ## object for bypass data
-        self.bypass_trans_obj = TransientData(bypass_file)
+        self.bypass_trans_obj = TransientData(bypass_file, use_cache)
         ## object for result data
-        self.result_trans_obj = TransientData(result_file)
+        self.result_trans_obj = TransientData(result_file, use_cache)
+        ## Flag to denote whether or not this object may use the data cache
+        self.use_cache = use_cache
         self.material_name = self.result_trans_obj.material_name
         self.aging_time = self.result_trans_obj.aging_time
         self.aging_temp = self.result_trans_obj.aging_temp
@@ -1846,14 +2211,17 @@ class PairedTransientData(object):
         if self.aligned == True:
             print("Data already aligned. Cannot re-align...")
             return
+        cache_path = self.alignCachePath(addNoise, verticalAlignment)
+        if self.readAlignCache(cache_path) == True:
+            return
 
         for item in self.bypass_trans_obj.data_map:
             if item != self.bypass_trans_obj.time_key:
-                if type(self.bypass_trans_obj.data_map[item][-1]) is int or type(self.bypass_trans_obj.data_map[item][-1]) is float:
+                if is_numeric(self.bypass_trans_obj.data_map[item][-1]) == True:
                     self.bypass_trans_obj.autoregChangedInput(item,10,False)
         for item in self.result_trans_obj.data_map:
             if item != self.result_trans_obj.time_key:
-                if type(self.result_trans_obj.data_map[item][-1]) is int or type(self.result_trans_obj.data_map[item][-1]) is float:
+                if is_numeric(self.result_trans_obj.data_map[item][-1]) == True:
                     self.result_trans_obj.autoregChangedInput(item,10,False)
         #Check to make sure all input_change maps have the same keys and throw out any dissimilar keys
         dissimilar_key = []
@@ -1942,10 +2310,10 @@ class PairedTransientData(object):
         #   but with the number of data points matching master_set
         for item in sub_set:
             #Check the data type of the master list at the given item and initialize new_set accordingly
-            if type(master_set[item][0]) is not int and type(master_set[item][0]) is not float:
+            if is_numeric(master_set[item][0]) == False or is_numeric(sub_set[item][0]) == False:
                 new_set[item] = [""]*len(master_set[item])
             else:
-                new_set[item] = [0.0]*len(master_set[item])
+                new_set[item] = np.zeros(len(master_set[item]))
 
         #First data point in the new_set should auto-align to the first master_set time,
         #   regardless of discrepencies in the first time point. This is because
@@ -2035,7 +2403,7 @@ class PairedTransientData(object):
                 #       (iii) Use a running average with artifical "noise" added for realism
                 for item in new_set:
                     if item is not time_column:
-                        if type(new_set[item][i]) is not int and type(new_set[item][i]) is not float:
+                        if is_numeric(new_set[item][i]) == False:
                             #If the data in the column is non-numeric, then just grab the prior time value
                             new_set[item][i] = new_set[item][i-1]
                         else:
@@ -2087,9 +2455,7 @@ class PairedTransientData(object):
         for item in new_set:
             del sub_set[item]
         for item in new_set:
-            sub_set[item] = []
-            for value in new_set[item]:
-                sub_set[item].append(value)
+            sub_set[item] = columnize(new_set[item])
 
         #If we made it this far without error, then the data should be aligned (fingers crossed, no jynx)
         print("Complete!")
@@ -2130,9 +2496,74 @@ class PairedTransientData(object):
                     self.result_trans_obj.data_map[new_name][i] = self.result_trans_obj.data_map[new_name][i]*frame_ratios[frame_key][tuple_index]
                     i+=1
 
+        self.writeAlignCache(cache_path)
 
     #End alignData()
 
+    ##Function to return the path of the cache file for the aligned data (None if caching is disabled)
+    #
+    #   The cache file is keyed by the alignData() options and the full contents of both
+    #   data sets, since users may delete, compress, or modify columns before aligning.
+    def alignCachePath(self, addNoise, verticalAlignment):
+        if data_cache["folder"] == None or self.use_cache == False:
+            return None
+        key = hashlib.sha1()
+        key.update(str((addNoise, verticalAlignment)).encode())
+        for obj in [self.bypass_trans_obj, self.result_trans_obj]:
+            key.update(str((obj.time_key, obj.change_time, obj.input_change)).encode())
+            for item in obj.data_map:
+                key.update(item.encode())
+                if type(obj.data_map[item]) is np.ndarray:
+                    key.update(obj.data_map[item].tobytes())
+                else:
+                    key.update(str(obj.data_map[item]).encode())
+        return data_cache_path("pair", [key.hexdigest()])
+
+    ##Function to load the aligned data from the data cache
+    #
+    #   Returns True if the aligned data was loaded, False if alignment must be performed
+    def readAlignCache(self, path):
+        if path == None:
+            return False
+        cache = read_data_cache(path)
+        if cache == None:
+            return False
+        arrays, meta = cache
+        self.bypass_trans_obj.data_map = unpack_columns(arrays, "bypass", meta["bypass_columns"])
+        self.bypass_trans_obj.input_change = meta["bypass_input_change"]
+        self.bypass_trans_obj.num_rows = len(self.bypass_trans_obj.data_map[self.bypass_trans_obj.time_key])
+        self.result_trans_obj.data_map = unpack_columns(arrays, "result", meta["result_columns"])
+        self.result_trans_obj.input_change = meta["result_input_change"]
+        self.result_trans_obj.num_rows = len(self.result_trans_obj.data_map[self.result_trans_obj.time_key])
+        #Result columns for the bypass data point to the bypass data (same as in alignData())
+        for item in self.bypass_trans_obj.data_map:
+            if item != self.bypass_trans_obj.time_key:
+                self.result_trans_obj.appendColumn(item+"[bypass]", self.bypass_trans_obj.data_map[item])
+        print("\nAligned data loaded from cache...")
+        self.aligned = True
+        return True
+
+    ##Function to save the aligned data to the data cache
+    def writeAlignCache(self, path):
+        if path == None:
+            return
+        arrays = {}
+        meta = {}
+        meta["bypass_columns"] = pack_columns(self.bypass_trans_obj.data_map, "bypass", arrays)
+        meta["bypass_input_change"] = self.bypass_trans_obj.input_change
+        #Result columns that point to the bypass data are re-created when loading
+        bypass_names = {}
+        for item in self.bypass_trans_obj.data_map:
+            if item != self.bypass_trans_obj.time_key:
+                bypass_names[item+"[bypass]"] = True
+        result_map = {}
+        for item in self.result_trans_obj.data_map:
+            if item not in bypass_names.keys():
+                result_map[item] = self.result_trans_obj.data_map[item]
+        meta["result_columns"] = pack_columns(result_map, "result", arrays)
+        meta["result_input_change"] = self.result_trans_obj.input_change
+        write_data_cache(path, arrays, meta)
+
 
     ##Function will compress the rows of data based on the given compression factor
     #
@@ -23,14 +23,43 @@
 
 #Generally speaking, we do not know whether or not there is bypass data in the
 #   folders that may need to be paired, so we import all objects from transient_data
-from labview_processing.transient_data import TransientData, PairedTransientData
+from labview_processing.transient_data import TransientData, PairedTransientData, set_data_cache, disable_data_cache, clear_data_cache
 import os, sys, getopt
+import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from mpl_toolkits.mplot3d import Axes3D
 import matplotlib.pyplot as plt
 from matplotlib import cm
 from matplotlib.ticker import LinearLocator, FormatStrFormatter
 import numpy as np
 
+## Helper function to read (and pair) the data for a single file in a folder
+#
+#   This is the unit of work for reading the files of a folder. It is a module level
+#   function so that it can be farmed out to separate processes. The returned object
+#   has already had its columns compressed (and its data aligned, if paired).
+#
+#   @param folder name of the folder that contains the data files
+#   @param file name of the (non-bypass) data file
+#   @param bypass_file name of the bypass file to pair with (None if unpaired)
+#   @param addNoise whether or not to add random noise for missing data emulation
+#   @param seed seed for the random noise (None leaves the random state as is)
+#                   Forked processes inherit the random state of the parent, so each
+#                   file is given its own seed to make the noise the same in serial
+#                   and in parallel
+def read_folder_data_obj(folder, file, bypass_file, addNoise, seed = None):
+    if seed != None:
+        random.seed(seed)
+    if bypass_file == None:
+        obj = TransientData(folder+"/"+file)
+        obj.compressColumns()
+    else:
+        obj = PairedTransientData(folder+"/"+bypass_file,folder+"/"+file)
+        obj.compressColumns()
+        obj.alignData(addNoise)
+    return obj
+
 ## TransientDataFolder
 #   This object creates a map of other transient data objects (paired or unpaired)
 #
@@ -59,12 +88,14 @@ class TransientDataFolder(object):
     #
     # @param folder name of the folder that contains sets of data files
     # @param addNoise whether or not to add random noise for missing data emulation
+    # @param workers number of processes to use for reading (and pairing) the files.
+    #                   Each file (or pair of files) is independent of the others.
     #
     #   NOTE:
     #
     #       The code expects that the folder only contains a set of CLEERS data files.
     #       If there are non-CLEERS data files or sub-folders, then this may cause errors.
-    def __init__(self,folder,addNoise = True):
+    def __init__(self,folder,addNoise = True,workers = 1):
         if os.path.isdir(folder) == False:
             print("Error! Given argument is not a folder!")
             return
@@ -166,6 +197,8 @@ class TransientDataFolder(object):
                         self.conditions["iso_temp"][base][file] = 0
                         self.conditions["aging_cond"][base][file] = "unknown"
 
+        #List of files to read as (file, bypass_file, is_skipped) tuples
+        read_list = []
         #Determine what to do when no bypass files are provided
         if len(self.bypass_names) == 0:
             print("Warning! No bypass data provided...")
@@ -173,12 +206,7 @@ class TransientDataFolder(object):
             self.has_unpaired = True
             i = 0
             for file in self.file_names:
-                print("\nReading the following...")
-                print("\t"+file)
-                self.unpaired_data[file] = TransientData(self.folder_name+"/"+file)
-                self.unpaired_data[file].compressColumns()
-                self.total_data_processed+=self.unpaired_data[file].getNumRows()*self.unpaired_data[file].getNumCols()
-                self.time_key = self.unpaired_data[file].time_key
+                read_list.append( (file, None, False) )
                 self.unread[i] = False
                 i+=1
         #Check for file_names that should correspond to bypass_names
@@ -190,14 +218,7 @@ class TransientDataFolder(object):
                 for file in self.file_names:
                     if base in file:
                         self.file_pairs[base].append( (base+"-bp.dat",file) )
-                        print("\nReading and pairing the following...")
-                        print("\t"+self.file_pairs[base][i][0])
-                        print("\t"+self.file_pairs[base][i][1])
-                        self.paired_data[file] = PairedTransientData(self.folder_name+"/"+self.file_pairs[base][i][0],self.folder_name+"/"+self.file_pairs[base][i][1])
-                        self.paired_data[file].compressColumns()
-                        self.paired_data[file].alignData(addNoise)
-                        self.total_data_processed+=2*self.paired_data[file].getNumRows()*self.paired_data[file].getNumCols()
-                        self.time_key = self.paired_data[file].time_key
+                        read_list.append( (file, self.file_pairs[base][i][0], False) )
                         self.unread[j] = False
                         i+=1
                     j+=1
@@ -206,12 +227,11 @@ class TransientDataFolder(object):
         j=0
         for check in self.unread:
             if check == True:
-                print("\nReading the following skipped unpaired files...")
-                print("\t"+self.file_names[j])
-                self.unpaired_data[self.file_names[j]] = TransientData(self.folder_name+"/"+self.file_names[j])
-                self.unpaired_data[self.file_names[j]].compressColumns()
+                read_list.append( (self.file_names[j], None, True) )
             j+=1
 
+        self.readDataFiles(read_list, addNoise, workers)
+
         #After done reading, register the file conditions in the conditions map
         for base in self.like_sets:
             for file in self.like_sets[base]:
@@ -229,6 +249,80 @@ class TransientDataFolder(object):
                 for base in self.like_sets:
                     self.conditions[cond][base] = {k: v for k, v in sorted(self.conditions[cond][base].items(), key=lambda item: item[1], reverse=False)}
 
+    ##Function to read (and pair) a list of data files in the folder
+    #
+    #   Each file (or pair of files) is read, compressed, and aligned independently of the
+    #   others, so the work can be spread over several processes. Data objects are always
+    #   stored in the order of the read_list, regardless of the order in which they finish.
+    #   The seed for the random noise of each file is drawn (in order) before any reading.
+    #
+    #   @param read_list list of (file, bypass_file, is_skipped) tuples to read
+    #                       bypass_file is None for unpaired files and is_skipped is True
+    #                       for unpaired files that were skipped during pairing
+    #   @param addNoise whether or not to add random noise for missing data emulation
+    #   @param workers number of processes to use (1 reads the files in serial)
+    def readDataFiles(self, read_list, addNoise = True, workers = 1):
+        if workers > 1 and len(read_list) > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            print("Warning! Parallel reading requires 'fork' processes on this platform")
+            print("\tReverting to serial reading...")
+            workers = 1
+
+        seeds = {}
+        for (file, bypass_file, is_skipped) in read_list:
+            seeds[file] = random.getrandbits(32)
+
+        data_objs = {}
+        if workers > 1 and len(read_list) > 1:
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=min(workers, len(read_list)), mp_context=context) as pool:
+                jobs = {}
+                for (file, bypass_file, is_skipped) in read_list:
+                    self.printReadMessage(file, bypass_file, is_skipped)
+                    jobs[pool.submit(read_folder_data_obj, self.folder_name, file, bypass_file, addNoise, seeds[file])] = (file, bypass_file, is_skipped)
+                print("\nReading " + str(len(read_list)) + " files with " + str(min(workers, len(read_list))) + " processes. Please wait...")
+                for job in as_completed(jobs):
+                    (file, bypass_file, is_skipped) = jobs[job]
+                    data_objs[file] = job.result()
+                    self.addDataProcessed(data_objs[file], bypass_file, is_skipped)
+                    print("\tFinished " + file + " (" + str(len(data_objs)) + " of " + str(len(read_list)) + ")...  Total data processed = " + str(self.getTotalDataProcessed()))
+        else:
+            for (file, bypass_file, is_skipped) in read_list:
+                self.printReadMessage(file, bypass_file, is_skipped)
+                data_objs[file] = read_folder_data_obj(self.folder_name, file, bypass_file, addNoise, seeds[file])
+                self.addDataProcessed(data_objs[file], bypass_file, is_skipped)
+
+        for (file, bypass_file, is_skipped) in read_list:
+            if bypass_file == None:
+                self.unpaired_data[file] = data_objs[file]
+            else:
+                self.paired_data[file] = data_objs[file]
+            if is_skipped == False:
+                self.time_key = data_objs[file].time_key
+
+    ##Function to print the message for reading a file
+    def printReadMessage(self, file, bypass_file, is_skipped):
+        if bypass_file != None:
+            print("\nReading and pairing the following...")
+            print("\t"+bypass_file)
+            print("\t"+file)
+        elif is_skipped == True:
+            print("\nReading the following skipped unpaired files...")
+            print("\t"+file)
+        else:
+            print("\nReading the following...")
+            print("\t"+file)
+
+    ##Function to add the data of a newly read object to the total data processed
+    #
+    #   NOTE: Skipped unpaired files do not count towards the total data processed
+    def addDataProcessed(self, obj, bypass_file, is_skipped):
+        if is_skipped == True:
+            return
+        if bypass_file == None:
+            self.total_data_processed+=obj.getNumRows()*obj.getNumCols()
+        else:
+            self.total_data_processed+=2*obj.getNumRows()*obj.getNumCols()
+
     ##Print object attributes to the console
     def __str__(self):
         message =  "\n ---- Folder: " + str(self.folder_name) + " ---- "
@@ -1104,12 +1198,13 @@ class TransientDataFolderSets(object):
     #
     # @param folders list of namse of folders that contain sets of data files
     # @param addNoise whether or not to add random noise for missing data emulation
+    # @param workers number of processes to use for reading (and pairing) the files of each folder
     #
     #   NOTE:
     #
     #       The code expects that the folders only contain sets of CLEERS data files.
     #       If there are non-CLEERS data files or sub-folders, then this may cause errors.
-    def __init__(self,folders,addNoise = True):
+    def __init__(self,folders,addNoise = True,workers = 1):
         if type(folders) is not list:
             folders = [folders]
         self.folder_data = {}
@@ -1118,7 +1213,8 @@ class TransientDataFolderSets(object):
                 print("Error! Given argument is not a folder!")
                 return
 
-            self.folder_data[folder] = TransientDataFolder(folder)
+            self.folder_data[folder] = TransientDataFolder(folder,addNoise,workers)
+            print("\nFinished folder " + folder + "...  Total data processed = " + str(self.getTotalDataProcessed()))
 
     ##Function to display information to the console
     def __str__(self):